@@ -1,11 +1,32 @@
-from flask import Flask, jsonify, request, render_template, session
-from imdb_queries import IMDbQueries
+from flask import Flask, Response, jsonify, make_response, request, render_template, session
+from contextlib import closing
+from functools import wraps
+from typing import Optional
+from imdb_queries import (FUZZY_CURSOR, MOVIE_COLUMNS, SEARCH_CURSOR, VIEW_ROW_CURSOR, VIEW_SORT_CURSOR,
+                          YEAR_TITLE_CURSOR, IMDbQueries, check_view_request, compile_title_pattern,
+                          decode_cursor)
+from query_cache import QueryCache
+import csv
+import gzip
+import io
+import json
 import os
 import uuid
 
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'imdb-movies-secret-key-change-in-production')
-queries = IMDbQueries()
+# Queries read IMDB_DB (default imdb.db). Year/runtime listings are served from
+# an in-memory catalog unless IMDB_CATALOG=0; query results are cached in up to
+# IMDB_CACHE_MB megabytes (0 disables the cache)
+db_path = os.environ.get('IMDB_DB', 'imdb.db')
+cache_mb = int(os.environ.get('IMDB_CACHE_MB', '64'))
+queries = IMDbQueries(db_path, use_catalog=os.environ.get('IMDB_CATALOG', '1') != '0',
+                      cache=QueryCache(max_bytes=cache_mb * 1024 * 1024) if cache_mb > 0 else None)
+
+STATS_MAX_AGE = 300             # Seconds browsers may reuse statistics without asking
+LISTING_MAX_AGE = 60            # Seconds browsers may reuse listings, searches and views
+GZIP_MIN_BYTES = 1024           # Smaller JSON bodies are sent uncompressed
+GZIP_LEVEL = 6
 
 def get_user_session():
     """Get or create a user session ID"""
@@ -13,12 +34,160 @@ def get_user_session():
         session['user_id'] = str(uuid.uuid4())
     return session['user_id']
 
+def catalog_response(max_age: int, validate=None):
+    """Decorator for read endpoints whose responses only change with the catalog
+
+    Responses carry a weak ETag and Last-Modified from the catalog
+    generation, which setup and --refresh bump. A request whose
+    If-None-Match or If-Modified-Since still matches gets 304 Not Modified
+    without the endpoint running. `validate`, called with the view's
+    arguments, checks the request parameters first and returns an error
+    message, so an invalid request gets 400 rather than 304.
+    """
+    def decorate(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            error = validate(*args, **kwargs) if validate is not None else None
+            if error:
+                return jsonify({'error': error}), 400
+            generation, modified = queries.catalog_version()
+            etag = f"catalog-{generation}"
+            if request.if_none_match:
+                not_modified = request.if_none_match.contains_weak(etag)
+            else:
+                not_modified = (modified is not None and request.if_modified_since is not None
+                                and request.if_modified_since >= modified)
+            if not_modified:
+                response = app.response_class(status=304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag, weak=True)
+            response.last_modified = modified
+            response.cache_control.public = True
+            response.cache_control.max_age = max_age
+            response.vary.add('Accept-Encoding')
+            return response
+        return wrapper
+    return decorate
+
+@app.after_request
+def compress_response(response):
+    """gzip JSON bodies of GZIP_MIN_BYTES or more for clients that accept it"""
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or response.mimetype != 'application/json' or 'Content-Encoding' in response.headers):
+        return response
+    response.vary.add('Accept-Encoding')
+    if not request.accept_encodings['gzip']:
+        return response
+    data = response.get_data()
+    if len(data) >= GZIP_MIN_BYTES:
+        response.set_data(gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0))
+        response.headers['Content-Encoding'] = 'gzip'
+    return response
+
+def list_params_error(columns) -> Optional[str]:
+    """Error message for a format= or fields= that list_response would reject for
+    rows with these columns, or None"""
+    if request.args.get('format', 'rows') not in ('rows', 'columns'):
+        return "format must be 'rows' or 'columns'"
+    fields = request.args.get('fields')
+    if fields:
+        unknown = [field.strip() for field in fields.split(',') if field.strip() and field.strip() not in columns]
+        if unknown:
+            return f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(columns)}"
+    return None
+
+def cursor_error(shape) -> Optional[str]:
+    """Error message for a cursor= that does not decode to the given key shape, or None"""
+    cursor = request.args.get('cursor')
+    try:
+        if cursor:
+            decode_cursor(cursor, shape)
+    except ValueError as e:
+        return str(e)
+    return None
+
+# Request validators for catalog_response, one per kind of endpoint
+def validate_movie_list(*args, **kwargs):
+    return list_params_error(MOVIE_COLUMNS)
+
+def validate_year_list(*args, **kwargs):
+    # Listings of a single year leave out startYear
+    return list_params_error([column for column in MOVIE_COLUMNS if column != 'startYear'])
+
+def validate_movie_page(*args, **kwargs):
+    return cursor_error(YEAR_TITLE_CURSOR) or list_params_error(MOVIE_COLUMNS)
+
+def validate_search(*args, **kwargs):
+    mode = request.args.get('mode', 'exact')
+    if not request.args.get('q', ''):
+        return 'Search term (q) is required'
+    if mode not in ('exact', 'fuzzy'):
+        return 'Search mode must be exact or fuzzy'
+    if mode == 'fuzzy':
+        return cursor_error(FUZZY_CURSOR) or list_params_error(MOVIE_COLUMNS + ['similarity'])
+    return cursor_error(SEARCH_CURSOR) or list_params_error(MOVIE_COLUMNS)
+
+def validate_advanced_search(*args, **kwargs):
+    if not request.args.get('q', ''):
+        return 'Search term (q) is required'
+    return list_params_error(MOVIE_COLUMNS)
+
+def validate_regex_search(*args, **kwargs):
+    pattern = request.args.get('pattern', '')
+    if not pattern:
+        return 'Regex pattern is required'
+    try:
+        compile_title_pattern(pattern)
+    except ValueError as e:
+        return str(e)
+    return validate_movie_page()
+
+def validate_view(view_name):
+    order_by = request.args.get('order_by')
+    if request.args.get('direction', 'asc').lower() not in ('asc', 'desc'):
+        return "direction must be 'asc' or 'desc'"
+    try:
+        check_view_request(view_name, order_by)
+        columns = queries.get_view_columns(view_name)
+    except ValueError as e:
+        return str(e)
+    return cursor_error(VIEW_ROW_CURSOR if order_by is None else VIEW_SORT_CURSOR) or list_params_error(columns)
+
+def list_response(payload: dict, key: str = 'movies'):
+    """jsonify a payload whose `key` holds a list of row dicts, shaped by the request
+
+    format=columns sends the column names once, as 'columns', and each row
+    as an array of values; fields=a,b,c keeps only the listed columns.
+    """
+    response_format = request.args.get('format', 'rows')
+    fields = request.args.get('fields')
+    if response_format not in ('rows', 'columns'):
+        return jsonify({'error': "format must be 'rows' or 'columns'"}), 400
+    rows = payload[key]
+    if fields:
+        columns = [field.strip() for field in fields.split(',') if field.strip()]
+        unknown = [field for field in columns if rows and field not in rows[0]]
+        if unknown:
+            return jsonify({'error': f"Unknown fields: {', '.join(unknown)}. "
+                                     f"Available: {', '.join(rows[0])}"}), 400
+    else:
+        columns = list(rows[0]) if rows else []
+    if response_format == 'columns':
+        payload = {**payload, 'columns': columns, key: [[row[field] for field in columns] for row in rows]}
+    elif fields:
+        payload = {**payload, key: [{field: row[field] for field in columns} for row in rows]}
+    return jsonify(payload)
+
 @app.route('/')
 def index():
     """Main page with API documentation"""
     return render_template('index.html')
 
 @app.route('/api/stats')
+@catalog_response(STATS_MAX_AGE)
 def database_stats():
     """Get database statistics"""
     try:
@@ -28,12 +197,13 @@ def database_stats():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/movies')
+@catalog_response(LISTING_MAX_AGE, validate_movie_list)
 def get_movies():
     """Get sample movies"""
     limit = request.args.get('limit', 10, type=int)
     try:
         movies = queries.get_sample_movies(limit)
-        return jsonify({
+        return list_response({
             'count': len(movies),
             'movies': movies
         })
@@ -41,12 +211,13 @@ def get_movies():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/movies/year/<int:year>')
+@catalog_response(LISTING_MAX_AGE, validate_year_list)
 def get_movies_by_year(year):
     """Get movies by year"""
     limit = request.args.get('limit', 10, type=int)
     try:
         movies = queries.get_movies_by_year(year, limit)
-        return jsonify({
+        return list_response({
             'year': year,
             'count': len(movies),
             'movies': movies
@@ -55,12 +226,13 @@ def get_movies_by_year(year):
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/movies/years/<int:start_year>/<int:end_year>')
+@catalog_response(LISTING_MAX_AGE, validate_movie_list)
 def get_movies_by_year_range(start_year, end_year):
     """Get movies by year range"""
     limit = request.args.get('limit', 10, type=int)
     try:
         movies = queries.get_movies_by_year_range(start_year, end_year, limit)
-        return jsonify({
+        return list_response({
             'year_range': f"{start_year}-{end_year}",
             'count': len(movies),
             'movies': movies
@@ -69,51 +241,64 @@ def get_movies_by_year_range(start_year, end_year):
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/movies/search')
+@catalog_response(LISTING_MAX_AGE, validate_search)
 def search_movies():
-    """Search movies"""
+    """Search movies by title (mode=exact) or by typo-tolerant similarity (mode=fuzzy)"""
     search_term = request.args.get('q', '')
+    mode = request.args.get('mode', 'exact')
     limit = request.args.get('limit', 20, type=int)
     offset = request.args.get('offset', 0, type=int)
-    
-    if not search_term:
-        return jsonify({'error': 'Search term (q) is required'}), 400
+    cursor = request.args.get('cursor')
     
     try:
-        movies = queries.search_movies(search_term, limit, offset)
-        return jsonify({
+        if mode == 'fuzzy':
+            page = queries.fuzzy_search_movies(search_term, limit, offset, cursor)
+        else:
+            page = queries.search_movies(search_term, limit, offset, cursor)
+        return list_response({
             'search_term': search_term,
-            'count': len(movies),
+            'mode': mode,
+            'count': len(page['movies']),
             'offset': offset,
-            'has_more': len(movies) == limit,
-            'movies': movies
+            'has_more': page['has_more'],
+            'next_cursor': page['next_cursor'],
+            'movies': page['movies']
         })
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/movies/genre/<genre>')
+@catalog_response(LISTING_MAX_AGE, validate_movie_page)
 def get_movies_by_genre(genre):
     """Get movies by genre"""
     limit = request.args.get('limit', 20, type=int)
     offset = request.args.get('offset', 0, type=int)
+    cursor = request.args.get('cursor')
     try:
-        movies = queries.get_movies_by_genre(genre, limit, offset)
-        return jsonify({
+        page = queries.get_movies_by_genre(genre, limit, offset, cursor)
+        return list_response({
             'genre': genre,
-            'count': len(movies),
+            'count': len(page['movies']),
             'offset': offset,
-            'has_more': len(movies) == limit,
-            'movies': movies
+            'has_more': page['has_more'],
+            'next_cursor': page['next_cursor'],
+            'movies': page['movies']
         })
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/movies/runtime/<int:min_runtime>/<int:max_runtime>')
+@catalog_response(LISTING_MAX_AGE, validate_movie_list)
 def get_movies_by_runtime(min_runtime, max_runtime):
     """Get movies by runtime range"""
     limit = request.args.get('limit', 10, type=int)
     try:
         movies = queries.get_movies_by_runtime(min_runtime, max_runtime, limit)
-        return jsonify({
+        return list_response({
             'runtime_range': f"{min_runtime}-{max_runtime} minutes",
             'count': len(movies),
             'movies': movies
@@ -122,12 +307,13 @@ def get_movies_by_runtime(min_runtime, max_runtime):
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/movies/longest')
+@catalog_response(LISTING_MAX_AGE, validate_movie_list)
 def get_longest_movies():
     """Get longest movies"""
     limit = request.args.get('limit', 10, type=int)
     try:
         movies = queries.get_longest_movies(limit)
-        return jsonify({
+        return list_response({
             'count': len(movies),
             'movies': movies
         })
@@ -135,22 +321,77 @@ def get_longest_movies():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/movies/recent')
+@catalog_response(LISTING_MAX_AGE, validate_movie_page)
 def get_recent_movies():
     """Get recent movies"""
     limit = request.args.get('limit', 20, type=int)
     offset = request.args.get('offset', 0, type=int)
+    cursor = request.args.get('cursor')
     try:
-        movies = queries.get_recent_movies(limit, offset)
-        return jsonify({
-            'count': len(movies),
+        page = queries.get_recent_movies(limit, offset, cursor)
+        return list_response({
+            'count': len(page['movies']),
             'offset': offset,
-            'has_more': len(movies) == limit,
-            'movies': movies
+            'has_more': page['has_more'],
+            'next_cursor': page['next_cursor'],
+            'movies': page['movies']
         })
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+def ndjson_chunks(batches):
+    """One JSON object per line, one chunk per batch of rows"""
+    with closing(batches):
+        for rows in batches:
+            yield ''.join(json.dumps(dict(zip(MOVIE_COLUMNS, row)), ensure_ascii=False) + '\n' for row in rows)
+
+def csv_chunks(batches):
+    """A header line, then one chunk of CSV lines per batch of rows"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    with closing(batches):
+        writer.writerow(MOVIE_COLUMNS)
+        for rows in batches:
+            writer.writerows(rows)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()
+
+# format= of /api/export/movies: (chunk generator, mimetype)
+EXPORT_FORMATS = {
+    'ndjson': (ndjson_chunks, 'application/x-ndjson'),
+    'csv': (csv_chunks, 'text/csv'),
+}
+
+@app.route('/api/export/movies')
+def export_movies():
+    """Stream every movie matching the filters as NDJSON or CSV"""
+    export_format = request.args.get('format', 'ndjson')
+    start_year = request.args.get('start_year', type=int)
+    end_year = request.args.get('end_year', type=int)
+    genre = request.args.get('genre')
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({'error': f"format must be one of: {', '.join(EXPORT_FORMATS)}"}), 400
+    
+    try:
+        batches = queries.export_movies(start_year, end_year, genre)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
+    chunks, mimetype = EXPORT_FORMATS[export_format]
+    # Rows are produced as the server writes them out, so a slow client slows the
+    # query down. Exports are too large for shared caches to keep.
+    return Response(chunks(batches), mimetype=mimetype,
+                    headers={'Content-Disposition': f'attachment; filename=movies.{export_format}',
+                             'Cache-Control': 'no-store'})
 
 @app.route('/api/stats/years')
+@catalog_response(STATS_MAX_AGE)
 def get_movies_stats_by_year():
     """Get movie statistics by year"""
     try:
@@ -163,6 +404,7 @@ def get_movies_stats_by_year():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/stats/genres')
+@catalog_response(STATS_MAX_AGE)
 def get_genre_stats():
     """Get genre statistics"""
     try:
@@ -175,6 +417,7 @@ def get_genre_stats():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/stats/runtime')
+@catalog_response(STATS_MAX_AGE)
 def get_runtime_stats():
     """Get runtime statistics"""
     try:
@@ -183,6 +426,14 @@ def get_runtime_stats():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/stats/cache')
+def get_cache_stats():
+    """Get result cache hit, miss and eviction counters"""
+    stats = queries.cache_stats()
+    if stats is None:
+        return jsonify({'enabled': False})
+    return jsonify({'enabled': True, **stats})
+
 @app.route('/dashboard')
 def dashboard():
     """Movie dashboard with search and recommendations"""
@@ -208,24 +459,25 @@ def get_recommendations():
                 'error': f'At least 5 movie interactions required. Current: {total_interactions}'
             }), 400
         
-        recommendations = queries.get_recommendations(want_to_watch_ids, watched_ids)
-        return jsonify(recommendations)
+        # Served from precompute_recommendations.py while still fresh
+        recommendations = queries.get_precomputed_recommendations(user_session, want_to_watch_ids, watched_ids)
+        if recommendations is None:
+            recommendations = queries.get_recommendations(want_to_watch_ids, watched_ids)
+        return list_response(recommendations, 'recommendations')
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/search/advanced')
+@catalog_response(LISTING_MAX_AGE, validate_advanced_search)
 def advanced_search():
     """Advanced search with regex and pattern matching"""
     search_term = request.args.get('q', '')
     search_type = request.args.get('type', 'basic')  # basic, regex, year_pattern, genre_pattern
     limit = request.args.get('limit', 10, type=int)
     
-    if not search_term:
-        return jsonify({'error': 'Search term (q) is required'}), 400
-    
     try:
         movies = queries.advanced_search(search_term, search_type, limit)
-        return jsonify({
+        return list_response({
             'search_term': search_term,
             'search_type': search_type,
             'count': len(movies),
@@ -235,50 +487,78 @@ def advanced_search():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/regex/search')
+@catalog_response(LISTING_MAX_AGE, validate_regex_search)
 def regex_search():
     """Regex-based movie title search"""
     pattern = request.args.get('pattern', '')
     limit = request.args.get('limit', 20, type=int)
     offset = request.args.get('offset', 0, type=int)
-    
-    if not pattern:
-        return jsonify({'error': 'Regex pattern is required'}), 400
+    cursor = request.args.get('cursor')
     
     try:
-        movies = queries.regex_title_search(pattern, limit, offset)
-        return jsonify({
+        page = queries.regex_title_search(pattern, limit, offset, cursor)
+        return list_response({
             'pattern': pattern,
-            'count': len(movies),
+            'count': len(page['movies']),
             'offset': offset,
-            'has_more': len(movies) == limit,
-            'movies': movies
+            'has_more': page['has_more'],
+            'next_cursor': page['next_cursor'],
+            'movies': page['movies']
         })
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/views/<view_name>')
+@catalog_response(LISTING_MAX_AGE, validate_view)
 def get_view_data(view_name):
     """Get data from database views"""
     limit = request.args.get('limit', 20, type=int)
+    offset = request.args.get('offset', 0, type=int)
+    cursor = request.args.get('cursor')
+    order_by = request.args.get('order_by')
+    direction = request.args.get('direction', 'asc').lower()
     
     try:
-        data = queries.get_view_data(view_name, limit)
-        return jsonify({
+        page = queries.get_view_data(view_name, limit, offset, order_by, direction == 'desc', cursor)
+        return list_response({
             'view': view_name,
-            'count': len(data),
-            'data': data
-        })
+            'refreshed_at': page['refreshed_at'],
+            'count': len(page['rows']),
+            'offset': offset,
+            'has_more': page['has_more'],
+            'next_cursor': page['next_cursor'],
+            'data': page['rows']
+        }, 'data')
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 # User Movie Lists API Endpoints
+def batch_tconsts():
+    """The 'tconsts' array of a batch request body, or None when it is missing or malformed"""
+    data = request.get_json(silent=True)
+    tconsts = data.get('tconsts') if isinstance(data, dict) else None
+    if not isinstance(tconsts, list) or not all(isinstance(tconst, str) and tconst for tconst in tconsts):
+        return None
+    return tconsts
+
+def batch_response(results):
+    """Per-movie statuses of a batch list update, with a count per status"""
+    counts = {}
+    for result in results:
+        counts[result['status']] = counts.get(result['status'], 0) + 1
+    return jsonify({'results': results, 'counts': counts})
+
 @app.route('/api/user/want-to-watch', methods=['GET'])
 def get_user_want_to_watch():
     """Get user's want to watch movies from database"""
     try:
         user_session = get_user_session()
         movies = queries.get_want_to_watch_movies(user_session)
-        return jsonify({
+        return list_response({
             'movies': movies,
             'count': len(movies)
         })
@@ -323,6 +603,32 @@ def remove_from_want_to_watch():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/user/want-to-watch/batch', methods=['POST'])
+def add_many_to_want_to_watch():
+    """Add several movies to user's want to watch list in one transaction"""
+    tconsts = batch_tconsts()
+    if tconsts is None:
+        return jsonify({'error': 'A JSON array of movie IDs (tconsts) is required'}), 400
+    try:
+        return batch_response(queries.add_many_to_want_to_watch(get_user_session(), tconsts))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/user/want-to-watch/batch', methods=['DELETE'])
+def remove_many_from_want_to_watch():
+    """Remove several movies from user's want to watch list in one transaction"""
+    tconsts = batch_tconsts()
+    if tconsts is None:
+        return jsonify({'error': 'A JSON array of movie IDs (tconsts) is required'}), 400
+    try:
+        return batch_response(queries.remove_many_from_want_to_watch(get_user_session(), tconsts))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/user/want-to-watch/clear', methods=['DELETE'])
 def clear_want_to_watch():
     """Clear all movies from user's want to watch list"""
@@ -343,7 +649,7 @@ def get_user_watched():
     try:
         user_session = get_user_session()
         movies = queries.get_watched_movies(user_session)
-        return jsonify({
+        return list_response({
             'movies': movies,
             'count': len(movies)
         })
@@ -388,6 +694,32 @@ def remove_from_watched():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/user/watched/batch', methods=['POST'])
+def add_many_to_watched():
+    """Add several movies to user's watched list in one transaction"""
+    tconsts = batch_tconsts()
+    if tconsts is None:
+        return jsonify({'error': 'A JSON array of movie IDs (tconsts) is required'}), 400
+    try:
+        return batch_response(queries.add_many_to_watched(get_user_session(), tconsts))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/user/watched/batch', methods=['DELETE'])
+def remove_many_from_watched():
+    """Remove several movies from user's watched list in one transaction"""
+    tconsts = batch_tconsts()
+    if tconsts is None:
+        return jsonify({'error': 'A JSON array of movie IDs (tconsts) is required'}), 400
+    try:
+        return batch_response(queries.remove_many_from_watched(get_user_session(), tconsts))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/user/watched/clear', methods=['DELETE'])
 def clear_watched():
     """Clear all movies from user's watched list"""
@@ -412,12 +744,22 @@ def get_user_lists_summary():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/dashboard/bootstrap')
+def dashboard_bootstrap():
+    """User's lists, their summary and database statistics for the dashboard's first paint"""
+    try:
+        return jsonify(queries.get_dashboard_bootstrap(get_user_session()))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 if __name__ == '__main__':
     # Check if database exists
-    if not os.path.exists('imdb.db'):
+    if not os.path.exists(db_path):
         print("Database not found! Please run 'python database_setup.py' first.")
         exit(1)
     
+    # Development server; production uses prefork_server.py
     print("Starting IMDb Movies Server...")
     print("Open http://localhost:8081 in your browser to explore the API")
+    print("For production, run 'python prefork_server.py' instead")
     app.run(debug=True, host='0.0.0.0', port=8081) 
\ No newline at end of file
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+ASGI serving mode for the IMDb Movies app
+
+Serves the same Flask routes from an asyncio event loop. Each request runs
+the Flask (WSGI) app on a bounded thread pool, so blocking IMDbQueries
+calls never block the loop. Routes listed in ROUTE_LIMITS (regex,
+advanced and fuzzy-capable search, recommendations, exports) may only
+occupy that many pool threads at once; further requests for them wait on
+the loop without holding a thread. Cheap listings and lookups therefore
+always find a free thread and keep their latency while heavy requests run.
+
+Usage: python asgi_app.py [--host 0.0.0.0] [--port 8081] [--threads 16]
+   or: uvicorn asgi_app:application --port 8081
+"""
+
+import argparse
+import asyncio
+import io
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from app import app as flask_app, db_path, queries
+
+THREADS = 16                    # Pool threads running Flask requests
+
+# Route prefixes whose requests may hold at most this many pool threads at once
+ROUTE_LIMITS = {
+    '/api/regex/search': 2,
+    '/api/search/advanced': 2,
+    '/api/recommendations': 2,
+    '/api/movies/search': 4,
+    '/api/export': 2,
+}
+
+def wsgi_environ(scope: dict, body: bytes) -> dict:
+    """WSGI environ for an ASGI HTTP request scope"""
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client') or ('', 0)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode().decode('latin-1'),
+        'PATH_INFO': scope['path'].encode().decode('latin-1'),
+        'QUERY_STRING': scope['query_string'].decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope['http_version']}",
+        'REMOTE_ADDR': client[0],
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+    }
+    for name, value in scope['headers']:
+        name = name.decode('latin-1').upper().replace('-', '_')
+        value = value.decode('latin-1')
+        if name not in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+            name = f"HTTP_{name}"
+        environ[name] = f"{environ[name]},{value}" if name in environ else value
+    return environ
+
+class ThreadPoolASGI:
+    """ASGI application running a WSGI app on a bounded thread pool with per-route limits"""
+
+    def __init__(self, wsgi_app: Callable, threads: int = THREADS,
+                 route_limits: Optional[Dict[str, int]] = None, on_shutdown: Optional[Callable] = None):
+        self.wsgi_app = wsgi_app
+        self.threads = threads
+        self._executor = None
+        # Longest prefix first, so nested routes can have their own limit
+        limits = ROUTE_LIMITS if route_limits is None else route_limits
+        self.route_limits = [(prefix, asyncio.Semaphore(limit))
+                             for prefix, limit in sorted(limits.items(), key=lambda item: -len(item[0]))]
+        self.on_shutdown = on_shutdown
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The thread pool, created on the first request so `threads` can still be set"""
+        # Only the event loop thread gets here, so no lock is needed
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix='asgi')
+        return self._executor
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            body = b''
+            while True:
+                message = await receive()
+                body += message.get('body', b'')
+                if not message.get('more_body'):
+                    break
+            limit = self._route_limit(scope['path'])
+            if limit is None:
+                await self._respond(wsgi_environ(scope, body), send)
+            else:
+                async with limit:
+                    await self._respond(wsgi_environ(scope, body), send)
+
+    def _route_limit(self, path: str) -> Optional[asyncio.Semaphore]:
+        for prefix, semaphore in self.route_limits:
+            if path.startswith(prefix):
+                return semaphore
+        return None
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                if self._executor is not None:
+                    self._executor.shutdown(wait=True)
+                if self.on_shutdown is not None:
+                    self.on_shutdown()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _respond(self, environ: dict, send):
+        """Run the WSGI app on the pool and relay its response chunk by chunk"""
+        loop = asyncio.get_running_loop()
+        response = {}
+
+        def start_response(status, headers, exc_info=None):
+            response['status'] = int(status.split(' ', 1)[0])
+            response['headers'] = [(name.lower().encode('latin-1'), value.encode('latin-1'))
+                                   for name, value in headers]
+
+        def start():
+            result = self.wsgi_app(environ, start_response)
+            chunks = iter(result)
+            return result, chunks, next(chunks, None)
+
+        result, chunks, chunk = await loop.run_in_executor(self.executor, start)
+        try:
+            await send({'type': 'http.response.start', 'status': response['status'],
+                        'headers': response['headers']})
+            while True:
+                # Streamed responses produce further chunks on the pool as well
+                following = None if chunk is None else await loop.run_in_executor(self.executor, next, chunks, None)
+                await send({'type': 'http.response.body', 'body': chunk or b'', 'more_body': following is not None})
+                if following is None:
+                    break
+                chunk = following
+        finally:
+            if hasattr(result, 'close'):
+                await loop.run_in_executor(self.executor, result.close)
+
+application = ThreadPoolASGI(flask_app.wsgi_app, on_shutdown=queries.close)
+
+def main():
+    """Serve the app with uvicorn"""
+    parser = argparse.ArgumentParser(description="Serve the IMDb Movies app over ASGI")
+    parser.add_argument('--host', default='0.0.0.0', help="Interface to listen on")
+    parser.add_argument('--port', type=int, default=8081, help="Port to listen on")
+    parser.add_argument('--threads', type=int, default=THREADS, help="Pool threads running requests")
+    args = parser.parse_args()
+
+    if not os.path.exists(db_path):
+        print("Database not found! Please run 'python database_setup.py' first.")
+        return 1
+    try:
+        import uvicorn
+    except ImportError:
+        print("The ASGI server needs uvicorn: pip install uvicorn")
+        return 1
+
+    print(f"Starting IMDb Movies ASGI server ({args.threads} threads)...")
+    print(f"Open http://localhost:{args.port} in your browser to explore the API")
+    # The module-level app is served, its pool not yet created
+    application.threads = args.threads
+    uvicorn.run(application, host=args.host, port=args.port, log_level='warning')
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-request database connection overhead
+
+Compares opening a new SQLite connection for every query (the previous
+IMDbQueries behaviour) with the pooled read-only connections, first as
+direct method calls and then through the threaded Flask server with
+several concurrent clients.
+
+Usage: python benchmark_connections.py [--db imdb.db] [--requests 2000] [--clients 8]
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import statistics
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+
+from werkzeug.serving import make_server
+
+import app as web_app
+from imdb_queries import IMDbQueries
+
+# Cheap, index-served endpoints, so connection cost dominates
+ENDPOINTS = [
+    '/api/movies/year/1994?limit=10',
+    '/api/movies/recent?limit=20',
+    '/api/movies/search?q=godfather&limit=20',
+    '/api/movies/genre/Drama?limit=20',
+]
+
+class UnpooledQueries(IMDbQueries):
+    """IMDbQueries opening a new connection for every method call"""
+
+    @contextmanager
+    def _get_connection(self):
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            yield conn
+
+    @contextmanager
+    def _write_connection(self):
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            yield conn
+
+def time_direct_calls(queries, calls):
+    """Average milliseconds per get_movies_by_year call"""
+    start_time = time.perf_counter()
+    for _ in range(calls):
+        queries.get_movies_by_year(1994, 10)
+    return (time.perf_counter() - start_time) * 1000 / calls
+
+def time_http_requests(queries, requests, clients):
+    """Serve the app with `queries` and fetch ENDPOINTS concurrently; return (latencies_ms, seconds)"""
+    web_app.queries = queries
+    server = make_server('127.0.0.1', 0, web_app.app, threaded=True)
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    latencies = []
+    lock = threading.Lock()
+
+    def client(client_id):
+        for i in range(client_id, requests, clients):
+            start_time = time.perf_counter()
+            with urllib.request.urlopen(base_url + ENDPOINTS[i % len(ENDPOINTS)]) as response:
+                response.read()
+            elapsed = (time.perf_counter() - start_time) * 1000
+            with lock:
+                latencies.append(elapsed)
+
+    start_time = time.perf_counter()
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start_time
+
+    server.shutdown()
+    return latencies, elapsed
+
+def main():
+    """Run the connection benchmark for unpooled and pooled connections"""
+    parser = argparse.ArgumentParser(description="Benchmark per-request connection overhead")
+    parser.add_argument('--db', default='imdb.db', help="SQLite database path")
+    parser.add_argument('--requests', type=int, default=2000, help="HTTP requests per configuration")
+    parser.add_argument('--clients', type=int, default=8, help="Concurrent HTTP clients")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"Database '{args.db}' not found! Please run database_setup.py first.")
+        return
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+
+    configurations = [('new connection per call', UnpooledQueries), ('pooled connections', IMDbQueries)]
+
+    print(f"Direct calls (get_movies_by_year, {args.requests} calls)")
+    for name, queries_class in configurations:
+        queries = queries_class(args.db)
+        time_direct_calls(queries, 10)
+        print(f"  {name:<24} {time_direct_calls(queries, args.requests):>7.3f} ms/call")
+
+    print(f"\nThreaded Flask server ({args.requests} requests, {args.clients} clients)")
+    print(f"  {'':<24} {'mean ms':>8} {'p95 ms':>8} {'req/sec':>9}")
+    for name, queries_class in configurations:
+        queries = queries_class(args.db)
+        time_http_requests(queries, len(ENDPOINTS) * args.clients, args.clients)
+        latencies, elapsed = time_http_requests(queries, args.requests, args.clients)
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        print(f"  {name:<24} {statistics.mean(latencies):>8.2f} {p95:>8.2f} {len(latencies) / elapsed:>9.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Benchmark parallel parsing of title.basics for database setup
+
+Parses the input with 1, 2, 4 and 8 worker processes (parse and filter
+only, nothing is written) and prints throughput and speedup for each.
+
+Usage: python benchmark_parsing.py [--input data/title.basics.tsv.gz] [--workers 1 2 4 8]
+"""
+
+import argparse
+import os
+import time
+
+from database_setup import DEFAULT_DATA_FILE, iter_movie_batches
+
+def time_parse(file_path, workers):
+    """Parse the whole file with the given worker count, return (seconds, rows, movies)"""
+    rows_read = 0
+    movies = 0
+    start_time = time.perf_counter()
+    for batch_rows, movie_rows in iter_movie_batches(file_path, workers):
+        rows_read += batch_rows
+        movies += len(movie_rows)
+    return time.perf_counter() - start_time, rows_read, movies
+
+def main():
+    """Run the parsing benchmark for each worker count"""
+    parser = argparse.ArgumentParser(description="Benchmark parallel title.basics parsing")
+    parser.add_argument('--input', default=DEFAULT_DATA_FILE, help="title.basics .tsv or .tsv.gz file")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help="Worker counts to benchmark (default: 1 2 4 8)")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.input):
+        print(f"File {args.input} not found!")
+        return
+
+    print(f"Benchmarking parse of {args.input} ({os.cpu_count()} CPUs available)")
+    print(f"{'workers':>8} {'seconds':>9} {'rows/sec':>12} {'speedup':>8}")
+
+    baseline = None
+    for workers in args.workers:
+        elapsed, rows_read, movies = time_parse(args.input, workers)
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {elapsed:>9.2f} {rows_read / elapsed:>12,.0f} {baseline / elapsed:>7.2f}x")
+
+    print(f"Rows parsed: {rows_read:,}, movies found: {movies:,}")
+
+if __name__ == "__main__":
+    main()
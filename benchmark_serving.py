@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Load test the threaded Flask server, the ASGI serving mode and the
+preforking server
+
+Starts each server in its own process on the same database (with the
+result cache off, so every request does its work), then runs a mixed load
+for a fixed time: clients fetching cheap listing endpoints alongside
+clients running slow regex searches. Reports throughput and p50/p99
+latency per class, showing whether heavy requests starve cheap ones.
+With --workers, prefork_server.py is measured at each worker count too,
+along with the memory of its workers: RSS counts the pages shared with
+the parent in full, PSS divides them among the processes sharing them.
+
+Usage: python benchmark_serving.py [--db imdb.db] [--duration 15] [--clients 8] [--heavy-clients 4]
+                                   [--workers 1 2 4 8]
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+# Index-served endpoints answered in about a millisecond
+CHEAP_ENDPOINTS = [
+    '/api/movies/year/1994?limit=10',
+    '/api/movies/recent?limit=20',
+    '/api/movies/genre/Drama?limit=20',
+    '/api/stats',
+]
+
+# Regex searches without a usable literal prefilter: a Python scan of every title
+HEAVY_ENDPOINTS = [
+    '/api/regex/search?pattern=%5E.*q.*z.*%24&limit=20',
+    '/api/regex/search?pattern=%5E%5B%5Eaeiou%5D%2B%24&limit=20',
+]
+
+SERVERS = {
+    'threaded Flask': [sys.executable, '-c',
+                       "import sys, app; app.app.run(host='127.0.0.1', port=int(sys.argv[1]), threaded=True)"],
+    'ASGI (uvicorn)': [sys.executable, 'asgi_app.py', '--host', '127.0.0.1', '--port'],
+}
+
+def prefork_command(workers):
+    return [sys.executable, 'prefork_server.py', '--host', '127.0.0.1', '--workers', str(workers), '--port']
+
+def memory_usage(pid):
+    """(RSS, PSS) of a process in MB"""
+    usage = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            name, _, value = line.partition(':')
+            if name in ('Rss', 'Pss'):
+                usage[name] = int(value.split()[0]) / 1024
+    return usage['Rss'], usage['Pss']
+
+def child_pids(pid):
+    with open(f"/proc/{pid}/task/{pid}/children") as f:
+        return [int(child) for child in f.read().split()]
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def start_server(command, port, db_path):
+    """Start a server process and wait until it answers"""
+    env = dict(os.environ, IMDB_DB=db_path, IMDB_CACHE_MB='0')
+    process = subprocess.Popen(command + [str(port)], env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 120
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/api/stats", timeout=1):
+                return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("server did not start")
+
+def run_load(port, duration, clients, heavy_clients):
+    """Fetch cheap and heavy endpoints concurrently for `duration` seconds"""
+    base_url = f"http://127.0.0.1:{port}"
+    latencies = {'cheap': [], 'heavy': []}
+    errors = []
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + duration
+
+    def client(kind, endpoints, offset):
+        i = offset
+        while time.perf_counter() < stop_at:
+            start_time = time.perf_counter()
+            try:
+                with urllib.request.urlopen(base_url + endpoints[i % len(endpoints)], timeout=120) as response:
+                    response.read()
+            except OSError as e:
+                with lock:
+                    errors.append(e)
+                continue
+            elapsed = (time.perf_counter() - start_time) * 1000
+            with lock:
+                latencies[kind].append(elapsed)
+            i += 1
+
+    threads = ([threading.Thread(target=client, args=('cheap', CHEAP_ENDPOINTS, i)) for i in range(clients)]
+               + [threading.Thread(target=client, args=('heavy', HEAVY_ENDPOINTS, i)) for i in range(heavy_clients)])
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, len(errors)
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else float('nan')
+
+def main():
+    """Run the serving load test for each server"""
+    parser = argparse.ArgumentParser(description="Load test the threaded and ASGI servers")
+    parser.add_argument('--db', default='imdb.db', help="SQLite database path")
+    parser.add_argument('--duration', type=float, default=15, help="Seconds of load per server")
+    parser.add_argument('--clients', type=int, default=8, help="Concurrent clients on cheap endpoints")
+    parser.add_argument('--heavy-clients', type=int, default=4, help="Concurrent clients running regex searches")
+    parser.add_argument('--workers', type=int, nargs='+', default=[],
+                        help="Also run prefork_server.py with these worker counts")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"Database '{args.db}' not found! Please run database_setup.py first.")
+        return
+
+    print(f"{args.clients} cheap + {args.heavy_clients} heavy clients, {args.duration:.0f}s per server\n")
+    servers = dict(SERVERS)
+    servers.update((f"prefork x{workers}", prefork_command(workers)) for workers in args.workers)
+    memory = {}
+    print(f"{'':<16} {'class':<6} {'req/sec':>8} {'p50 ms':>8} {'p99 ms':>9}")
+    for name, command in servers.items():
+        port = free_port()
+        process = start_server(command, port, os.path.abspath(args.db))
+        try:
+            latencies, errors = run_load(port, args.duration, args.clients, args.heavy_clients)
+            if name.startswith('prefork'):
+                memory[name] = (memory_usage(process.pid), [memory_usage(pid) for pid in child_pids(process.pid)])
+        finally:
+            process.terminate()
+            process.wait()
+        for kind, values in latencies.items():
+            print(f"{name:<16} {kind:<6} {len(values) / args.duration:>8.1f} "
+                  f"{statistics.median(values) if values else float('nan'):>8.1f} {percentile(values, 0.99):>9.1f}")
+        if errors:
+            print(f"{name:<16} {errors} failed requests")
+
+    if memory:
+        print(f"\n{'':<16} {'parent RSS':>11} {'worker RSS':>11} {'worker PSS':>11} {'total PSS':>10}   (MB, after load)")
+        for name, ((parent_rss, parent_pss), workers) in memory.items():
+            worker_rss = sum(rss for rss, _ in workers) / len(workers)
+            worker_pss = sum(pss for _, pss in workers) / len(workers)
+            total_pss = parent_pss + sum(pss for _, pss in workers)
+            print(f"{name:<16} {parent_rss:>11.0f} {worker_rss:>11.0f} {worker_pss:>11.0f} {total_pss:>10.0f}")
+
+if __name__ == "__main__":
+    main()
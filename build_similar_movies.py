@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Build item-to-item neighbors from list co-occurrence across sessions
+
+Treats every session's want_to_watch and watched_movies entries as one
+binary session x movie matrix, counts how many sessions list each pair of
+movies together and scores pairs by cosine similarity:
+
+    similarity(a, b) = sessions listing both / sqrt(sessions listing a * sessions listing b)
+
+The TOP_NEIGHBORS most similar movies of each movie are stored in
+similar_movies, which get_recommendations reads with one primary key
+lookup per request to boost movies similar to the session's own. Run it
+periodically (before precompute_recommendations.py, whose stored results
+include the boosts). A rebuild deletes those stored results, so sessions
+are recommended from the new neighbors until they are precomputed again.
+
+Usage: python build_similar_movies.py [--db imdb.db] [--top 20] [--min-sessions 2]
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from database_setup import IMDbDatabase
+from imdb_queries import NEIGHBOR_DTYPE, POSTINGS_DTYPE
+
+TOP_NEIGHBORS = 20              # Neighbors kept per movie
+MIN_SESSIONS = 2                # Sessions that must list a pair before it counts
+MAX_SESSION_MOVIES = 500        # Movies per session considered (pairs grow quadratically)
+PAIR_BATCH = 5_000_000          # Pair keys collected before merging their counts
+
+def _merge_counts(keys, counts):
+    """Sum the counts of equal pair keys"""
+    keys = np.concatenate(keys)
+    counts = np.concatenate(counts)
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    return unique_keys, np.bincount(inverse, weights=counts).astype(np.int64)
+
+def cooccurrence(session_codes, movie_index, movie_count):
+    """(first, second, sessions) for every pair of movie indexes listed together
+
+    session_codes must be sorted, so each session's movies are contiguous.
+    """
+    boundaries = np.flatnonzero(np.diff(session_codes)) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(session_codes)]))
+
+    keys, counts = [], []
+    pending = 0
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        if end - start < 2:
+            continue
+        movies = np.sort(movie_index[start:min(end, start + MAX_SESSION_MOVIES)])
+        first, second = np.triu_indices(len(movies), 1)
+        keys.append(movies[first] * movie_count + movies[second])
+        counts.append(np.ones(len(first), dtype=np.int64))
+        pending += len(first)
+        if pending >= PAIR_BATCH:
+            merged = _merge_counts(keys, counts)
+            keys, counts = [merged[0]], [merged[1]]
+            pending = len(merged[0])
+
+    if not keys:
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, empty
+    pair_keys, pair_counts = _merge_counts(keys, counts)
+    return pair_keys // movie_count, pair_keys % movie_count, pair_counts
+
+def build_similar_movies(db_path, top=TOP_NEIGHBORS, min_sessions=MIN_SESSIONS):
+    """Rebuild similar_movies; returns (sessions, movies with neighbors)"""
+    db = IMDbDatabase(db_path)
+    db.create_tables()
+    cursor = db.cursor
+
+    cursor.execute("""
+        SELECT l.user_session, m.rowid
+        FROM (
+            SELECT user_session, tconst FROM want_to_watch
+            UNION
+            SELECT user_session, tconst FROM watched_movies
+        ) l
+        JOIN movies m ON m.tconst = l.tconst
+        ORDER BY l.user_session
+    """)
+    sessions, rowids = [], []
+    for user_session, rowid in cursor:
+        sessions.append(user_session)
+        rowids.append(rowid)
+    _, session_codes = np.unique(np.array(sessions, dtype=object), return_inverse=True)
+    movie_rowids, movie_index = np.unique(np.array(rowids, dtype=np.int64), return_inverse=True)
+    session_count = int(session_codes.max()) + 1 if len(session_codes) else 0
+    print(f"Session list entries: {len(rowids):,} ({session_count:,} sessions, {len(movie_rowids):,} movies)")
+
+    # Cosine similarity of the movies' session columns
+    listed = np.bincount(movie_index, minlength=len(movie_rowids))
+    first, second, together = cooccurrence(session_codes, movie_index, len(movie_rowids))
+    keep = together >= min_sessions
+    first, second, together = first[keep], second[keep], together[keep]
+    similarity = together / np.sqrt(listed[first] * listed[second])
+    print(f"Movie pairs listed together by at least {min_sessions} sessions: {len(first):,}")
+
+    # Both directions of each pair, most similar first within each movie
+    source = np.concatenate((first, second))
+    neighbor = np.concatenate((second, first))
+    similarity = np.concatenate((similarity, similarity))
+    order = np.lexsort((movie_rowids[neighbor], -similarity, source))
+    source, neighbor, similarity = source[order], neighbor[order], similarity[order]
+    group_starts = np.flatnonzero(np.concatenate(([True], source[1:] != source[:-1])))
+    rank = np.arange(len(source)) - np.repeat(group_starts, np.diff(np.append(group_starts, len(source))))
+    keep = rank < top
+    source, neighbor, similarity = source[keep], neighbor[keep], similarity[keep]
+
+    bounds = np.flatnonzero(np.concatenate(([True], source[1:] != source[:-1], [True]))) if len(source) else []
+    rows = [
+        (int(movie_rowids[source[start]]),
+         movie_rowids[neighbor[start:end]].astype(POSTINGS_DTYPE).tobytes(),
+         similarity[start:end].astype(NEIGHBOR_DTYPE).tobytes())
+        for start, end in zip(bounds[:-1], bounds[1:])
+    ]
+    cursor.execute("DELETE FROM similar_movies")
+    cursor.executemany("INSERT INTO similar_movies (movie_id, neighbor_ids, similarities) VALUES (?, ?, ?)", rows)
+    # Precomputed recommendations carry the old neighbor boosts
+    cursor.execute("DELETE FROM session_recommendations")
+    db.connection.commit()
+    db.close()
+    return session_count, len(rows)
+
+def main():
+    """Build the similar_movies table"""
+    parser = argparse.ArgumentParser(description="Build item-to-item neighbors from session lists")
+    parser.add_argument('--db', default='imdb.db', help="SQLite database path")
+    parser.add_argument('--top', type=int, default=TOP_NEIGHBORS, help="Neighbors kept per movie")
+    parser.add_argument('--min-sessions', type=int, default=MIN_SESSIONS,
+                        help="Sessions that must list a pair together")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"Database '{args.db}' not found! Please run database_setup.py first.")
+        return
+
+    start_time = time.perf_counter()
+    sessions, movies = build_similar_movies(args.db, args.top, args.min_sessions)
+    print(f"Stored neighbors for {movies:,} movies from {sessions:,} sessions "
+          f"in {time.perf_counter() - start_time:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Check that every IMDbQueries method is served by an index
+
+Calls each query method against an existing database, captures the SQL it
+runs and inspects the EXPLAIN QUERY PLAN of every statement. The check
+fails when a statement scans a whole table or sorts through a temporary
+B-tree, unless that plan line of that statement is listed in
+KNOWN_PLAN_ISSUES; the method's other statements and plan lines are still
+checked. Walking an index in ORDER BY order ("SCAN movies USING INDEX
+...") is accepted: it needs no sort and stops as soon as LIMIT rows are
+found.
+
+Usage: python check_query_plans.py [imdb.db]
+"""
+
+import os
+import re
+import sqlite3
+import sys
+from types import GeneratorType
+
+from imdb_queries import IMDbQueries, encode_cursor
+
+# Session id used for the user list methods; the check leaves no rows behind
+CHECK_SESSION = '__query_plan_check__'
+
+# Plan lines expected in specific statements, and why: (method, pattern the
+# statement must match, pattern of the plan line, reason). Only the sort of
+# an already bounded row set is exempt; a scan of movies in the same
+# statement still fails.
+FTS_CANDIDATES = r'FROM movie_titles_fts f JOIN movies m ON m\.rowid = f\.rowid WHERE movie_titles_fts MATCH'
+ORDER_BY_SORT = r'^USE TEMP B-TREE FOR ORDER BY$'
+KNOWN_PLAN_ISSUES = [
+    ('search_movies', FTS_CANDIDATES, ORDER_BY_SORT,
+     "sorts the full-text matches by match tier and BM25"),
+    ('get_genre_stats', r'GROUP BY genres ORDER BY movie_count DESC', ORDER_BY_SORT,
+     "sorts the aggregated genre groups by count"),
+    ('get_recommendations', r'as recommendation_score FROM movies', ORDER_BY_SORT,
+     "scores and sorts the indexed candidate rows when no in-memory catalog is loaded"),
+    ('regex_title_search', FTS_CANDIDATES, ORDER_BY_SORT,
+     "sorts the titles that pass the literal prefilter by year"),
+    ('advanced_search', FTS_CANDIDATES, ORDER_BY_SORT,
+     "regex search sorts the titles that pass the literal prefilter by year"),
+]
+
+# Small lookup tables that are read in full by design: the genre bit map,
+# the schema (table existence checks) and the FTS5 index configuration
+LOOKUP_TABLES = {'genre_bits', 'sqlite_master', 'main.movie_titles_fts_config'}
+
+# Scans of a table; "SCAN (subquery-N)" reads an already bounded subquery result
+FULL_SCAN = re.compile(r'^SCAN ([^(\s]\S*)$')
+TEMP_SORT = re.compile(r'USE TEMP B-TREE')
+
+class TracingQueries(IMDbQueries):
+    """IMDbQueries that records every SQL statement it executes"""
+
+    def __init__(self, db_path):
+        super().__init__(db_path)
+        self.statements = []
+
+    def _open_connection(self, read_only=True):
+        conn = super()._open_connection(read_only)
+        conn.set_trace_callback(self.statements.append)
+        return conn
+
+def query_calls(conn):
+    """Representative (method, args) calls covering every query method"""
+    sample_ids = [row[0] for row in conn.execute(
+        "SELECT tconst FROM movies WHERE genres IS NOT NULL AND startYear IS NOT NULL LIMIT 5")]
+    tconst = sample_ids[0] if sample_ids else 'tt0000001'
+    # Cursors continuing after a mid-catalog movie, for the keyset page queries
+    year_cursor = encode_cursor(conn.execute(
+        "SELECT startYear, primaryTitle, tconst FROM movies WHERE startYear = 2000 AND primaryTitle IS NOT NULL"
+    ).fetchone() or (2000, '', ''))
+    search_cursor = encode_cursor((3, 0, -2000, tconst))
+    return [
+        ('get_sample_movies', (10,)),
+        ('get_movies_by_year', (1994, 10)),
+        ('get_movies_by_year_range', (1990, 1999, 10)),
+        ('search_movies', ('godfather', 20, 0)),
+        ('search_movies', ('godfather', 20, 0, search_cursor)),
+        ('fuzzy_search_movies', ('godfater', 20, 0)),
+        ('get_movies_by_genre', ('Drama', 20, 0)),
+        ('get_movies_by_genre', ('Drama', 20, 0, year_cursor)),
+        ('get_movies_by_runtime', (90, 120, 10)),
+        ('get_longest_movies', (10,)),
+        ('get_recent_movies', (20, 0)),
+        ('get_recent_movies', (20, 0, year_cursor)),
+        ('export_movies', ()),
+        ('export_movies', (1990, 1999)),
+        ('export_movies', (None, None, 'Drama')),
+        ('get_movies_stats_by_year', ()),
+        ('get_genre_stats', ()),
+        ('get_runtime_stats', ()),
+        ('get_database_stats', ()),
+        ('get_recommendations', (sample_ids[:3], sample_ids[3:])),
+        ('get_precomputed_recommendations', (CHECK_SESSION, sample_ids[:3], sample_ids[3:])),
+        ('advanced_search', ('^The', 'regex', 10)),
+        ('advanced_search', ('199*', 'year_pattern', 10)),
+        ('advanced_search', ('Action+Comedy', 'genre_pattern', 10)),
+        ('advanced_search', ('Action|Comedy', 'genre_pattern', 10)),
+        ('get_view_columns', ('decade_summary',)),
+        ('get_view_data', ('recent_quality_movies', 20)),
+        ('get_view_data', ('genre_stats_view', 20)),
+        ('get_view_data', ('decade_summary', 20)),
+        ('get_view_data', ('recent_quality_movies', 20, 0, 'runtimeMinutes', True)),
+        ('get_view_data', ('genre_stats_view', 20, 0, 'movie_count', False, encode_cursor([10, 5]))),
+        ('get_view_data', ('decade_summary', 20, 0, None, True, encode_cursor([3]))),
+        ('regex_title_search', ('^The', 20, 0)),
+        ('regex_title_search', ('godfather.*ii', 20, 0)),
+        ('regex_title_search', ('^.{3}$', 20, 0, year_cursor)),
+        ('add_to_want_to_watch', (CHECK_SESSION, tconst)),
+        ('get_want_to_watch_movies', (CHECK_SESSION,)),
+        ('remove_from_want_to_watch', (CHECK_SESSION, tconst)),
+        ('clear_want_to_watch', (CHECK_SESSION,)),
+        ('add_many_to_want_to_watch', (CHECK_SESSION, sample_ids)),
+        ('remove_many_from_want_to_watch', (CHECK_SESSION, sample_ids)),
+        ('add_to_watched', (CHECK_SESSION, tconst)),
+        ('get_watched_movies', (CHECK_SESSION,)),
+        ('remove_from_watched', (CHECK_SESSION, tconst)),
+        ('clear_watched', (CHECK_SESSION,)),
+        ('add_many_to_watched', (CHECK_SESSION, sample_ids)),
+        ('remove_many_from_watched', (CHECK_SESSION, sample_ids)),
+        ('get_user_movie_lists_summary', (CHECK_SESSION,)),
+        ('get_dashboard_bootstrap', (CHECK_SESSION,)),
+    ]
+
+def plan_problems(conn, statement):
+    """Return the EXPLAIN QUERY PLAN lines that indicate a scan or temp sort"""
+    problems = []
+    for row in conn.execute(f"EXPLAIN QUERY PLAN {statement}"):
+        detail = row[3]
+        full_scan = FULL_SCAN.match(detail)
+        if (full_scan and full_scan.group(1) not in LOOKUP_TABLES) or TEMP_SORT.search(detail):
+            problems.append(detail)
+    return problems
+
+def known_issue(method, statement, problem):
+    """Reason the plan line `problem` of `statement` is expected, or None"""
+    statement = ' '.join(statement.split())
+    for known_method, statement_pattern, line_pattern, reason in KNOWN_PLAN_ISSUES:
+        if (method == known_method and re.search(statement_pattern, statement)
+                and re.search(line_pattern, problem)):
+            return reason
+    return None
+
+def check_query_plans(db_path='imdb.db'):
+    """Check every query method's plans; return the number of unexpected problems"""
+    queries = TracingQueries(db_path)
+    conn = sqlite3.connect(db_path)
+    failures = 0
+
+    for method, args in query_calls(conn):
+        queries.statements.clear()
+        result = getattr(queries, method)(*args)
+        if isinstance(result, GeneratorType):
+            # Streamed results run their statement when the first batch is read
+            next(result, None)
+            result.close()
+
+        problems, known = [], {}
+        for statement in queries.statements:
+            if statement.lstrip().upper().startswith(('SELECT', 'WITH', 'UPDATE', 'DELETE')):
+                for problem in plan_problems(conn, statement):
+                    reason = known_issue(method, statement, problem)
+                    if reason is None:
+                        problems.append(problem)
+                    else:
+                        known[problem] = reason
+
+        if problems:
+            failures += 1
+            print(f"  FAIL  {method}{args}: {'; '.join(problems)}")
+        elif known:
+            print(f"  KNOWN {method}{args}: {'; '.join(f'{problem} ({reason})' for problem, reason in known.items())}")
+        else:
+            print(f"  OK    {method}{args}")
+
+    conn.close()
+    return failures
+
+def main():
+    """Run the query plan check"""
+    db_path = sys.argv[1] if len(sys.argv) > 1 else 'imdb.db'
+    if not os.path.exists(db_path):
+        print(f"Database '{db_path}' not found! Please run database_setup.py first.")
+        return 1
+
+    print(f"Checking query plans in {db_path}...")
+    failures = check_query_plans(db_path)
+    if failures:
+        print(f"❌ {failures} query method(s) fall back to a full table scan or temp B-tree sort")
+        return 1
+    print("✅ All query methods use indexes")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,113 @@
 import sqlite3
 import pandas as pd
+import argparse
+import csv
+import gzip
+import io
 import os
+import sys
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
+from imdb_queries import (CATALOG_STATS_COLUMNS, CATALOG_STATS_QUERY, DATABASE_VIEWS, NEIGHBOR_DTYPE,
+                          POSTINGS_DTYPE, VIEW_SORT_COLUMNS, materialized_table, title_trigrams)
+
+# IMDb ships title.basics as a gzipped TSV; it is read compressed so the
+# ~900MB uncompressed file never has to be written to disk.
+DEFAULT_DATA_FILE = 'data/title.basics.tsv.gz'
+
+MOVIE_COLUMNS = ['tconst', 'titleType', 'primaryTitle', 'originalTitle', 'isAdult',
+                 'startYear', 'endYear', 'runtimeMinutes', 'genres']
+INT_COLUMNS = ['isAdult', 'startYear', 'endYear', 'runtimeMinutes']
+INSERT_MOVIE_SQL = (f"INSERT INTO movies ({', '.join(MOVIE_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' for _ in MOVIE_COLUMNS)})")
+
+# Input is parsed in blocks of roughly this many bytes (~40K rows), always
+# ending on a line boundary
+BLOCK_SIZE = 4 * 1024 * 1024
+
+def _split_blocks(file_path, block_size=BLOCK_SIZE):
+    """Yield (column_names, block) pieces of a title.basics file
+
+    For a plain TSV a block is a (start, end) byte range that the parsing
+    worker reads itself. A gzip stream cannot be seeked, so it is
+    decompressed here and each block is the raw bytes. Either way blocks
+    are aligned on line boundaries so every block parses independently.
+    """
+    if file_path.endswith('.gz'):
+        with gzip.open(file_path, 'rb') as f:
+            columns = f.readline().decode('utf-8').rstrip('\n').split('\t')
+            while True:
+                data = f.read(block_size)
+                if not data:
+                    break
+                yield columns, data + f.readline()
+    else:
+        file_size = os.path.getsize(file_path)
+        with open(file_path, 'rb') as f:
+            columns = f.readline().decode('utf-8').rstrip('\n').split('\t')
+            start = f.tell()
+            while start < file_size:
+                f.seek(min(start + block_size, file_size))
+                f.readline()
+                end = f.tell()
+                yield columns, (file_path, start, end)
+                start = end
+
+def _parse_block(columns, block):
+    """Parse one block into (rows_read, movie_rows)
+
+    movie_rows are plain tuples in MOVIE_COLUMNS order, ready for
+    executemany. Runs in a worker process, so it takes and returns only
+    picklable values.
+    """
+    if isinstance(block, tuple):
+        file_path, start, end = block
+        with open(file_path, 'rb') as f:
+            f.seek(start)
+            block = f.read(end - start)
+    
+    # IMDb TSVs are unquoted; quote characters are part of the titles
+    chunk = pd.read_csv(io.BytesIO(block), sep='\t', header=None, names=columns,
+                        na_values='\\N', quoting=csv.QUOTE_NONE, dtype=str)
+    
+    # Filter for movies only
+    movies_chunk = chunk.loc[chunk['titleType'] == 'movie', MOVIE_COLUMNS].copy()
+    
+    # Convert to appropriate data types, then NaN to None for SQLite
+    for int_col in INT_COLUMNS:
+        movies_chunk[int_col] = pd.to_numeric(movies_chunk[int_col], errors='coerce').astype('Int64')
+    movies_chunk = movies_chunk.astype(object).where(movies_chunk.notna(), None)
+    
+    return len(chunk), list(movies_chunk.itertuples(index=False, name=None))
+
+def iter_movie_batches(file_path, workers=1, block_size=BLOCK_SIZE):
+    """Yield (rows_read, movie_rows) batches of a title.basics file in file order
+
+    With workers > 1 blocks are parsed in a process pool. At most two
+    blocks per worker are in flight, so memory stays bounded even when the
+    caller (the single database writer) is slower than the parsers.
+    """
+    blocks = _split_blocks(file_path, block_size)
+    if workers <= 1:
+        for columns, block in blocks:
+            yield _parse_block(columns, block)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for columns, block in blocks:
+            pending.append(pool.submit(_parse_block, columns, block))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
 class IMDbDatabase:
     def __init__(self, db_path='imdb.db'):
         self.db_path = db_path
@@ -23,7 +128,69 @@ class IMDbDatabase:
                 startYear INTEGER,
                 endYear INTEGER,
                 runtimeMinutes INTEGER,
-                genres TEXT
+                genres TEXT,
+                genre_mask INTEGER
+            )
+        ''')
+        
+        # Databases created before genre normalization lack the mask column
+        self.cursor.execute("PRAGMA table_info(movies)")
+        if 'genre_mask' not in [column[1] for column in self.cursor.fetchall()]:
+            self.cursor.execute("ALTER TABLE movies ADD COLUMN genre_mask INTEGER")
+        
+        # Normalized genres: one row per (genre, movie), plus the bit each
+        # genre occupies in movies.genre_mask. Bits are never reassigned.
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS movie_genres (
+                tconst TEXT NOT NULL,
+                genre TEXT NOT NULL,
+                PRIMARY KEY (tconst, genre)
+            ) WITHOUT ROWID
+        ''')
+        
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS genre_bits (
+                genre TEXT PRIMARY KEY,
+                bit INTEGER NOT NULL UNIQUE
+            )
+        ''')
+        
+        # Fuzzy title search postings: for each trigram (from
+        # imdb_queries.title_trigrams of primary and original titles) the
+        # sorted movies rowids containing it, packed as POSTINGS_DTYPE
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS title_trigrams (
+                trigram TEXT PRIMARY KEY,
+                movie_ids BLOB NOT NULL
+            ) WITHOUT ROWID
+        ''')
+        
+        # Bumped whenever the catalog data changes; IMDbQueries drops cached
+        # results and reloads its in-memory catalog when it moves on
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS catalog_generation (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                generation INTEGER NOT NULL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Precomputed catalog_stats row (one row, CATALOG_STATS_COLUMNS)
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS catalog_stats (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                total_movies INTEGER NOT NULL,
+                movies_with_year INTEGER NOT NULL,
+                min_year INTEGER,
+                max_year INTEGER,
+                unique_genre_combinations INTEGER NOT NULL,
+                adult_movies INTEGER NOT NULL,
+                non_adult_movies INTEGER NOT NULL,
+                avg_runtime REAL,
+                min_runtime INTEGER,
+                max_runtime INTEGER,
+                movies_with_runtime INTEGER NOT NULL,
+                computed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         ''')
         
@@ -50,126 +217,574 @@ class IMDbDatabase:
             )
         ''')
         
+        # Item-to-item neighbors from list co-occurrence across sessions
+        # (build_similar_movies.py): for each movie rowid, the most similar
+        # movie rowids packed as POSTINGS_DTYPE and their cosine similarities
+        # packed as NEIGHBOR_DTYPE, most similar first
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS similar_movies (
+                movie_id INTEGER PRIMARY KEY,
+                neighbor_ids BLOB NOT NULL,
+                similarities BLOB NOT NULL
+            )
+        ''')
+        
+        # Recommendations precomputed by precompute_recommendations.py, valid
+        # while the session's lists (fingerprint) and the catalog generation
+        # are unchanged
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS session_recommendations (
+                user_session TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                generation INTEGER NOT NULL,
+                recommendation_limit INTEGER NOT NULL,
+                result TEXT NOT NULL,
+                computed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
         self.connection.commit()
         print("Tables created successfully!")
     
-    def load_title_basics(self, file_path='data/title.basics.tsv'):
-        """Load title.basics.tsv into SQLite database (movies only)"""
+    def load_title_basics(self, file_path=DEFAULT_DATA_FILE, fast_load=False, workers=1):
+        """Load title.basics.tsv(.gz) into SQLite database (movies only)
+
+        Gzipped input is decompressed, parsed and filtered in a single
+        streaming pass. Parsing is spread over `workers` processes while
+        this connection stays the only writer. With fast_load the whole
+        load runs in one transaction with relaxed journaling (see
+        _bulk_insert).
+        """
         if not os.path.exists(file_path):
             print(f"File {file_path} not found!")
             return
         
         print(f"Loading {file_path}...")
-        print("Filtering for movies only...")
+        print(f"Filtering for movies only ({workers} parser process{'es' if workers > 1 else ''})...")
         
-        # Read in chunks to handle large files
-        chunk_size = 10000
-        chunk_count = 0
-        total_movies = 0
+        batches = iter_movie_batches(file_path, workers)
         
-        for chunk in pd.read_csv(file_path, sep='\t', na_values='\\N', chunksize=chunk_size):
-            # Filter for movies only
-            movies_chunk = chunk[chunk['titleType'] == 'movie'].copy()
-            
-            if len(movies_chunk) == 0:
-                chunk_count += 1
-                continue
-            
-            # Replace NaN with None for SQLite
-            movies_chunk = movies_chunk.where(pd.notnull(movies_chunk), None)
-            
-            # Convert to appropriate data types
-            for int_col in ['isAdult', 'startYear', 'endYear', 'runtimeMinutes']:
-                if int_col in movies_chunk.columns:
-                    movies_chunk[int_col] = pd.to_numeric(movies_chunk[int_col], errors='coerce')
-            
-            # Insert into database
-            movies_chunk.to_sql('movies', self.connection, if_exists='append', index=False)
-            
-            total_movies += len(movies_chunk)
-            chunk_count += 1
-            
-            if chunk_count % 10 == 0:
-                print(f"Processed {chunk_count * chunk_size} rows, found {total_movies} movies so far...")
+        start_time = time.perf_counter()
+        if fast_load:
+            print("Fast load: single transaction, relaxed journal and sync settings")
+            total_movies = self._bulk_insert(batches)
+        else:
+            total_movies = self._batched_insert(batches)
+        elapsed = time.perf_counter() - start_time
         
         print(f"Finished loading {file_path}")
         print(f"Total movies loaded: {total_movies}")
+        print(f"Load time: {elapsed:.1f}s ({total_movies / elapsed if elapsed else 0:,.0f} rows/sec)")
+        return total_movies
+    
+    def _batched_insert(self, batches):
+        """Insert each parsed batch with executemany, committing per batch"""
+        rows_processed = 0
+        total_movies = 0
+        
+        for rows_read, movie_rows in batches:
+            rows_processed += rows_read
+            if movie_rows:
+                self.cursor.executemany(INSERT_MOVIE_SQL, movie_rows)
+                self.connection.commit()
+                total_movies += len(movie_rows)
+            
+            print(f"Processed {rows_processed} rows, found {total_movies} movies so far...")
+        
+        return total_movies
+    
+    def _bulk_insert(self, batches):
+        """Insert all parsed batches in one transaction through executemany
+
+        journal_mode and synchronous are relaxed for the duration of the
+        load and restored afterwards, even if the load fails. MEMORY
+        journaling keeps the transaction able to roll back.
+        """
+        cursor = self.cursor
+        cursor.execute("PRAGMA journal_mode")
+        journal_mode = cursor.fetchone()[0]
+        cursor.execute("PRAGMA synchronous")
+        synchronous = cursor.fetchone()[0]
+        
+        rows_processed = 0
+        total_movies = 0
+        
+        cursor.execute("PRAGMA journal_mode = MEMORY")
+        cursor.execute("PRAGMA synchronous = OFF")
+        try:
+            cursor.execute("BEGIN")
+            for rows_read, movie_rows in batches:
+                rows_processed += rows_read
+                if movie_rows:
+                    cursor.executemany(INSERT_MOVIE_SQL, movie_rows)
+                    total_movies += len(movie_rows)
+                
+                print(f"Processed {rows_processed} rows, found {total_movies} movies so far...")
+            self.connection.commit()
+        except BaseException:
+            self.connection.rollback()
+            raise
+        finally:
+            cursor.execute(f"PRAGMA journal_mode = {journal_mode}")
+            cursor.execute(f"PRAGMA synchronous = {synchronous}")
+        
+        return total_movies
+    
+    def build_genre_index(self, changed_table=None, commit=True):
+        """Normalize movies.genres into movie_genres and movies.genre_mask
+
+        With no changed_table every movie is indexed from scratch. Otherwise
+        only the tconsts listed in changed_table are re-indexed, which is
+        how refresh keeps genres in sync without rewriting the whole table.
+        commit=False leaves the changes in the caller's transaction.
+        """
+        cursor = self.cursor
+        scope = f"tconst IN (SELECT tconst FROM {changed_table})" if changed_table else "1"
+        if changed_table is None:
+            print("Building genre index...")
+        
+        cursor.execute(f"DELETE FROM movie_genres WHERE {scope}")
+        
+        # Split the comma-separated genres string into one row per genre
+        cursor.execute(f'''
+            WITH RECURSIVE split(tconst, genre, rest) AS (
+                SELECT tconst, '', genres || ','
+                FROM movies
+                WHERE genres IS NOT NULL AND {scope}
+                UNION ALL
+                SELECT tconst, substr(rest, 1, instr(rest, ',') - 1), substr(rest, instr(rest, ',') + 1)
+                FROM split
+                WHERE rest != ''
+            )
+            INSERT OR IGNORE INTO movie_genres (tconst, genre)
+            SELECT tconst, genre FROM split WHERE genre != ''
+        ''')
+        
+        # New genres get the next free bit; existing genres keep theirs
+        cursor.execute('''
+            INSERT INTO genre_bits (genre, bit)
+            SELECT genre, (SELECT COALESCE(MAX(bit), -1) FROM genre_bits) + ROW_NUMBER() OVER (ORDER BY genre)
+            FROM (SELECT DISTINCT genre FROM movie_genres
+                  WHERE genre NOT IN (SELECT genre FROM genre_bits))
+        ''')
+        cursor.execute("SELECT MAX(bit) FROM genre_bits")
+        max_bit = cursor.fetchone()[0]
+        if max_bit is not None and max_bit > 62:
+            raise ValueError(f"Too many genres for a 64-bit genre_mask ({max_bit + 1})")
+        
+        cursor.execute(f'''
+            UPDATE movies SET genre_mask = COALESCE((
+                SELECT SUM(1 << b.bit)
+                FROM movie_genres g JOIN genre_bits b ON b.genre = g.genre
+                WHERE g.tconst = movies.tconst
+            ), 0)
+            WHERE {scope}
+        ''')
+        
+        if commit:
+            self.connection.commit()
+        if changed_table is None:
+            cursor.execute("SELECT COUNT(*) FROM genre_bits")
+            print(f"Genre index built ({cursor.fetchone()[0]} genres)")
+    
+    def build_title_search_index(self):
+        """Build the FTS5 full-text index over movie titles
+
+        movie_titles_fts indexes primaryTitle and originalTitle of movies
+        (as external content, so titles are not stored twice) with the
+        trigram tokenizer, which answers the same case-insensitive
+        substring matches search_movies always offered. Triggers keep it in
+        sync with every later insert, update and delete, including refresh.
+        """
+        print("Building title search index...")
+        
+        self.cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS movie_titles_fts USING fts5(
+                primaryTitle,
+                originalTitle,
+                content='movies',
+                content_rowid='rowid',
+                tokenize='trigram'
+            )
+        ''')
+        self.cursor.execute("INSERT INTO movie_titles_fts (movie_titles_fts) VALUES ('rebuild')")
+        
+        self.cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS movies_fts_insert AFTER INSERT ON movies BEGIN
+                INSERT INTO movie_titles_fts (rowid, primaryTitle, originalTitle)
+                VALUES (new.rowid, new.primaryTitle, new.originalTitle);
+            END
+        ''')
+        self.cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS movies_fts_delete AFTER DELETE ON movies BEGIN
+                INSERT INTO movie_titles_fts (movie_titles_fts, rowid, primaryTitle, originalTitle)
+                VALUES ('delete', old.rowid, old.primaryTitle, old.originalTitle);
+            END
+        ''')
+        self.cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS movies_fts_update AFTER UPDATE OF primaryTitle, originalTitle ON movies BEGIN
+                INSERT INTO movie_titles_fts (movie_titles_fts, rowid, primaryTitle, originalTitle)
+                VALUES ('delete', old.rowid, old.primaryTitle, old.originalTitle);
+                INSERT INTO movie_titles_fts (rowid, primaryTitle, originalTitle)
+                VALUES (new.rowid, new.primaryTitle, new.originalTitle);
+            END
+        ''')
+        
+        self.connection.commit()
+        print("Title search index built successfully!")
+    
+    def title_postings(self, scope="1"):
+        """Map each title trigram to an array of the rowids of movies containing it
+
+        Only movies matching the SQL condition `scope` are read.
+        """
+        postings = {}
+        titles = self.connection.cursor()
+        titles.execute(f"SELECT rowid, primaryTitle, originalTitle FROM movies WHERE {scope}")
+        for movie_id, primary_title, original_title in titles:
+            trigrams = title_trigrams(primary_title or '')
+            if original_title and original_title != primary_title:
+                trigrams |= title_trigrams(original_title)
+            for trigram in trigrams:
+                if trigram not in postings:
+                    postings[trigram] = array('i')
+                postings[trigram].append(movie_id)
+        return {trigram: np.asarray(ids, dtype=POSTINGS_DTYPE) for trigram, ids in postings.items()}
+    
+    def build_trigram_index(self, changed_table=None, removed=None, commit=True):
+        """Maintain the title_trigrams postings used by fuzzy title search
+
+        With no changed_table the postings are rebuilt for every movie.
+        Otherwise the movies whose tconst is in changed_table get postings
+        for their current titles, and `removed` (title_postings of the same
+        movies taken before they changed) is taken out first. Only the
+        trigrams involved are rewritten. commit=False leaves the changes in
+        the caller's transaction.
+        """
+        cursor = self.cursor
+        if changed_table is None:
+            print("Building fuzzy search trigram index...")
+            cursor.execute("DELETE FROM title_trigrams")
+            postings = self.title_postings()
+            cursor.executemany(
+                "INSERT INTO title_trigrams (trigram, movie_ids) VALUES (?, ?)",
+                ((trigram, np.sort(ids).tobytes()) for trigram, ids in postings.items())
+            )
+            if commit:
+                self.connection.commit()
+            print(f"Trigram index built ({len(postings):,} trigrams, "
+                  f"{sum(len(ids) for ids in postings.values()):,} postings)")
+            return
+        
+        added = self.title_postings(f"tconst IN (SELECT tconst FROM {changed_table})")
+        removed = removed or {}
+        for trigram in set(added) | set(removed):
+            cursor.execute("SELECT movie_ids FROM title_trigrams WHERE trigram = ?", (trigram,))
+            row = cursor.fetchone()
+            ids = np.frombuffer(row[0], dtype=POSTINGS_DTYPE) if row else np.empty(0, dtype=POSTINGS_DTYPE)
+            if trigram in removed:
+                ids = np.setdiff1d(ids, removed[trigram])
+            if trigram in added:
+                ids = np.union1d(ids, added[trigram])
+            if len(ids):
+                cursor.execute("INSERT OR REPLACE INTO title_trigrams (trigram, movie_ids) VALUES (?, ?)",
+                               (trigram, ids.astype(POSTINGS_DTYPE).tobytes()))
+            else:
+                cursor.execute("DELETE FROM title_trigrams WHERE trigram = ?", (trigram,))
+        if commit:
+            self.connection.commit()
+    
+    def prune_similar_movies(self, deleted_table, commit=True):
+        """Take the movies whose rowid is in deleted_table out of similar_movies
+
+        Their own rows are deleted and they are dropped from every other
+        movie's neighbors, so a new movie that reuses one of their rowids is
+        never boosted as someone's neighbor. The remaining neighbors keep
+        their order; build_similar_movies.py fills the lists up again.
+        commit=False leaves the changes in the caller's transaction.
+        """
+        cursor = self.cursor
+        cursor.execute(f"SELECT movie_id FROM {deleted_table}")
+        deleted = np.array([row[0] for row in cursor.fetchall()], dtype=POSTINGS_DTYPE)
+        cursor.execute(f"DELETE FROM similar_movies WHERE movie_id IN (SELECT movie_id FROM {deleted_table})")
+        
+        cursor.execute("SELECT movie_id, neighbor_ids, similarities FROM similar_movies")
+        updated, emptied = [], []
+        for movie_id, neighbor_ids, similarities in cursor.fetchall():
+            ids = np.frombuffer(neighbor_ids, dtype=POSTINGS_DTYPE)
+            keep = ~np.isin(ids, deleted)
+            if keep.all():
+                continue
+            if keep.any():
+                updated.append((ids[keep].tobytes(),
+                                np.frombuffer(similarities, dtype=NEIGHBOR_DTYPE)[keep].tobytes(), movie_id))
+            else:
+                emptied.append((movie_id,))
+        cursor.executemany("UPDATE similar_movies SET neighbor_ids = ?, similarities = ? WHERE movie_id = ?", updated)
+        cursor.executemany("DELETE FROM similar_movies WHERE movie_id = ?", emptied)
+        if commit:
+            self.connection.commit()
+        print(f"Removed {len(deleted):,} deleted movies from similar_movies "
+              f"({len(updated) + len(emptied):,} neighbor lists changed)")
+    
+    def table_exists(self, table_name):
+        """Check whether a table (or virtual table) exists"""
+        self.cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table_name,))
+        return self.cursor.fetchone() is not None
     
     def create_indexes(self):
-        """Create indexes for better query performance"""
+        """Create indexes for better query performance
+
+        Called after the bulk load so rows are inserted without index
+        maintenance. Each index is shaped after the WHERE/ORDER BY of the
+        IMDbQueries methods it serves; check_query_plans.py verifies that
+        those queries actually use them.
+        """
         print("Creating indexes...")
         
-        # Indexes for movies table
-        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_movies_tconst ON movies(tconst)')
-        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_movies_primaryTitle ON movies(primaryTitle)')
+        # Superseded indexes from older databases: tconst duplicates the
+        # PRIMARY KEY and no query can use a plain primaryTitle index
+        self.cursor.execute('DROP INDEX IF EXISTS idx_movies_tconst')
+        self.cursor.execute('DROP INDEX IF EXISTS idx_movies_primaryTitle')
+        self.cursor.execute('DROP INDEX IF EXISTS idx_movies_year_title')
+        
+        # get_movies_by_year, get_movies_by_year_range, get_recent_movies,
+        # regex_title_search: filter on startYear, ORDER BY startYear DESC, primaryTitle
+        # tconst completes the keyset pagination order, so a page cursor
+        # is a single range seek; genre_mask is carried in the index so
+        # genre bit tests along this ordering (get_movies_by_genre,
+        # advanced_search genre patterns) need no table lookups
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_movies_year_key
+            ON movies(startYear DESC, primaryTitle, tconst, genre_mask)
+            WHERE primaryTitle IS NOT NULL
+        ''')
+        # get_movies_stats_by_year (GROUP BY startYear), year ordering without a title filter
         self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_movies_startYear ON movies(startYear)')
-        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_movies_genres ON movies(genres)')
+        # get_movies_by_runtime, get_longest_movies, get_runtime_stats
         self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_movies_runtimeMinutes ON movies(runtimeMinutes)')
+        # get_genre_stats and genre_stats_view (GROUP BY genres), unique genre count
+        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_movies_genres ON movies(genres)')
+        # Adult counts, recent_quality_movies and recommendations (isAdult = 0 AND startYear >= ...)
+        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_movies_adult_year ON movies(isAdult, startYear)')
+        
+        # User lists are read per session, newest first
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_want_to_watch_session_date
+            ON want_to_watch(user_session, added_date)
+        ''')
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_watched_movies_session_date
+            ON watched_movies(user_session, watched_date)
+        ''')
+        
+        # Give the query planner statistics for the new indexes
+        self.cursor.execute('ANALYZE')
         
         self.connection.commit()
         print("Indexes created successfully!")
     
+    def refresh_title_basics(self, file_path=DEFAULT_DATA_FILE, workers=1):
+        """Apply a new title.basics snapshot to the existing movies table
+
+        The snapshot is staged in a temporary table and diffed against
+        movies by tconst: new rows are inserted, rows with any changed
+        column are updated and rows missing from the snapshot are deleted,
+        all in one transaction. User list tables, views and indexes are
+        left in place; genres and the title search indexes are updated for
+        the changed movies only, and deleted movies are taken out of
+        similar_movies. Returns a dict of inserted/updated/deleted counts.
+        """
+        if not os.path.exists(file_path):
+            print(f"File {file_path} not found!")
+            return None
+        
+        # Databases from before full-text search get the index first; its
+        # triggers then carry every change made below
+        if not self.table_exists('movie_titles_fts'):
+            self.build_title_search_index()
+        
+        print(f"Refreshing movies from {file_path}...")
+        start_time = time.perf_counter()
+        cursor = self.cursor
+        columns = ', '.join(MOVIE_COLUMNS)
+        
+        # Stage the snapshot; temp tables never touch the main database file
+        cursor.execute("DROP TABLE IF EXISTS temp.incoming_movies")
+        cursor.execute(f"CREATE TEMP TABLE incoming_movies AS SELECT {columns} FROM movies WHERE 0")
+        insert_incoming = INSERT_MOVIE_SQL.replace('INTO movies', 'INTO temp.incoming_movies', 1)
+        staged = 0
+        for rows_read, movie_rows in iter_movie_batches(file_path, workers):
+            cursor.executemany(insert_incoming, movie_rows)
+            staged += len(movie_rows)
+        cursor.execute("CREATE UNIQUE INDEX temp.idx_incoming_movies_tconst ON incoming_movies(tconst)")
+        self.connection.commit()
+        print(f"Staged {staged:,} movies from snapshot")
+        
+        # An empty snapshot almost certainly means a bad download, not a
+        # catalog with no movies; refuse to delete everything
+        if staged == 0:
+            cursor.execute("DROP TABLE temp.incoming_movies")
+            print("Snapshot contains no movies, refresh aborted")
+            return None
+        
+        # Movies whose genres must be re-indexed: deleted, new or re-genred
+        cursor.execute("DROP TABLE IF EXISTS temp.genre_changes")
+        cursor.execute('''
+            CREATE TEMP TABLE genre_changes AS
+            SELECT tconst FROM movies
+            WHERE tconst NOT IN (SELECT tconst FROM temp.incoming_movies)
+            UNION
+            SELECT i.tconst FROM temp.incoming_movies i
+            LEFT JOIN movies m ON m.tconst = i.tconst
+            WHERE m.tconst IS NULL OR m.genres IS NOT i.genres
+        ''')
+        cursor.execute("SELECT EXISTS (SELECT 1 FROM movie_genres)")
+        genres_indexed = cursor.fetchone()[0]
+        
+        # Movies whose fuzzy search postings change: deleted, new or retitled
+        cursor.execute("DROP TABLE IF EXISTS temp.title_changes")
+        cursor.execute('''
+            CREATE TEMP TABLE title_changes AS
+            SELECT tconst FROM movies
+            WHERE tconst NOT IN (SELECT tconst FROM temp.incoming_movies)
+            UNION
+            SELECT i.tconst FROM temp.incoming_movies i
+            LEFT JOIN movies m ON m.tconst = i.tconst
+            WHERE m.tconst IS NULL
+                OR m.primaryTitle IS NOT i.primaryTitle
+                OR m.originalTitle IS NOT i.originalTitle
+        ''')
+        cursor.execute("SELECT EXISTS (SELECT 1 FROM title_trigrams)")
+        trigrams_indexed = cursor.fetchone()[0]
+        
+        changed = ' OR '.join(f"movies.{col} IS NOT excluded.{col}" for col in MOVIE_COLUMNS[1:])
+        assignments = ', '.join(f"{col} = excluded.{col}" for col in MOVIE_COLUMNS[1:])
+        try:
+            # Postings of the old titles, to take out once the titles change
+            removed_postings = (self.title_postings("tconst IN (SELECT tconst FROM temp.title_changes)")
+                                if trigrams_indexed else None)
+            
+            # Rowids of the deleted movies; movies has no AUTOINCREMENT, so
+            # an insert below or in a later refresh can reuse them
+            cursor.execute("DROP TABLE IF EXISTS temp.deleted_movies")
+            cursor.execute('''
+                CREATE TEMP TABLE deleted_movies AS
+                SELECT rowid AS movie_id FROM movies
+                WHERE tconst NOT IN (SELECT tconst FROM temp.incoming_movies)
+            ''')
+            cursor.execute('''
+                DELETE FROM movies
+                WHERE tconst NOT IN (SELECT tconst FROM temp.incoming_movies)
+            ''')
+            deleted = cursor.rowcount
+            if deleted and self.table_exists('similar_movies'):
+                self.prune_similar_movies('temp.deleted_movies', commit=False)
+            
+            # Upsert restricted to existing rows, updating only those that differ
+            cursor.execute(f'''
+                INSERT INTO movies ({columns})
+                SELECT {columns} FROM temp.incoming_movies
+                WHERE tconst IN (SELECT tconst FROM movies)
+                ON CONFLICT(tconst) DO UPDATE SET {assignments}
+                WHERE {changed}
+            ''')
+            updated = cursor.rowcount
+            
+            cursor.execute(f'''
+                INSERT INTO movies ({columns})
+                SELECT {columns} FROM temp.incoming_movies
+                WHERE tconst NOT IN (SELECT tconst FROM movies)
+            ''')
+            inserted = cursor.rowcount
+            
+            # Databases from before genre normalization get a full build
+            self.build_genre_index('temp.genre_changes' if genres_indexed else None, commit=False)
+            if trigrams_indexed:
+                self.build_trigram_index('temp.title_changes', removed_postings, commit=False)
+            else:
+                self.build_trigram_index(commit=False)
+            
+            self.connection.commit()
+        except BaseException:
+            self.connection.rollback()
+            raise
+        finally:
+            cursor.execute("DROP TABLE IF EXISTS temp.incoming_movies")
+            cursor.execute("DROP TABLE IF EXISTS temp.genre_changes")
+            cursor.execute("DROP TABLE IF EXISTS temp.title_changes")
+            cursor.execute("DROP TABLE IF EXISTS temp.deleted_movies")
+        
+        elapsed = time.perf_counter() - start_time
+        print(f"Refresh complete: {inserted:,} inserted, {updated:,} updated, {deleted:,} deleted "
+              f"in {elapsed:.1f}s")
+        return {'inserted': inserted, 'updated': updated, 'deleted': deleted}
+    
     def create_views(self):
         """Create database views for better data organization"""
         print("Creating database views...")
         
-        # View 1: Recent high-quality movies
-        self.cursor.execute('''
-            CREATE VIEW IF NOT EXISTS recent_quality_movies AS
-            SELECT 
-                tconst,
-                primaryTitle,
-                startYear,
-                runtimeMinutes,
-                genres,
-                CASE 
-                    WHEN runtimeMinutes >= 120 THEN 'Long'
-                    WHEN runtimeMinutes >= 90 THEN 'Standard'
-                    ELSE 'Short'
-                END as length_category
-            FROM movies
-            WHERE startYear >= 2010 
-                AND runtimeMinutes >= 60
-                AND isAdult = 0
-                AND genres IS NOT NULL
-            ORDER BY startYear DESC
-        ''')
-        
-        # View 2: Genre statistics view
-        self.cursor.execute('''
-            CREATE VIEW IF NOT EXISTS genre_stats_view AS
-            SELECT 
-                genres,
-                COUNT(*) as movie_count,
-                AVG(runtimeMinutes) as avg_runtime,
-                MIN(startYear) as earliest_year,
-                MAX(startYear) as latest_year
-            FROM movies
-            WHERE genres IS NOT NULL 
-                AND runtimeMinutes IS NOT NULL
-            GROUP BY genres
-            HAVING movie_count >= 5
-            ORDER BY movie_count DESC
-        ''')
-        
-        # View 3: Decade summary view
-        self.cursor.execute('''
-            CREATE VIEW IF NOT EXISTS decade_summary AS
-            SELECT 
-                (startYear / 10) * 10 as decade,
-                COUNT(*) as total_movies,
-                AVG(runtimeMinutes) as avg_runtime,
-                COUNT(CASE WHEN isAdult = 0 THEN 1 END) as family_friendly,
-                COUNT(CASE WHEN isAdult = 1 THEN 1 END) as adult_movies
-            FROM movies
-            WHERE startYear IS NOT NULL AND startYear >= 1920
-            GROUP BY decade
-            ORDER BY decade DESC
-        ''')
+        # Recent high-quality movies, genre statistics and decade summary
+        for view_name, query in DATABASE_VIEWS.items():
+            self.cursor.execute(f"CREATE VIEW IF NOT EXISTS {view_name} AS {query}")
         
         self.connection.commit()
         print("Database views created successfully!")
     
+    def refresh_materialized_views(self):
+        """Rebuild the materialized copy of each view, indexed for ordered paging"""
+        print("Refreshing materialized views...")
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS materialized_views (
+                view_name TEXT PRIMARY KEY,
+                row_count INTEGER NOT NULL,
+                refreshed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        for view_name in DATABASE_VIEWS:
+            table = materialized_table(view_name)
+            # Swapped in one transaction; readers see the old or the new copy.
+            # Rows are inserted in the view's order, so rowid is its position.
+            self.cursor.execute("BEGIN")
+            self.cursor.execute(f"DROP TABLE IF EXISTS {table}")
+            self.cursor.execute(f"CREATE TABLE {table} AS SELECT * FROM {view_name}")
+            for column in VIEW_SORT_COLUMNS[view_name]:
+                self.cursor.execute(f"CREATE INDEX idx_{table}_{column} ON {table}({column})")
+            self.cursor.execute(f"ANALYZE {table}")
+            self.cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            row_count = self.cursor.fetchone()[0]
+            self.cursor.execute("INSERT OR REPLACE INTO materialized_views (view_name, row_count) VALUES (?, ?)",
+                                (view_name, row_count))
+            self.connection.commit()
+            print(f"  {view_name}: {row_count:,} rows")
+    
+    def has_materialized_views(self):
+        """Whether every view has a materialized copy"""
+        try:
+            self.cursor.execute("SELECT view_name FROM materialized_views")
+        except sqlite3.OperationalError:
+            return False
+        return set(DATABASE_VIEWS) <= {row[0] for row in self.cursor.fetchall()}
+    
+    def compute_catalog_stats(self):
+        """Recompute the catalog_stats row served by /api/stats and /api/stats/runtime"""
+        print("Computing catalog statistics...")
+        columns = ', '.join(CATALOG_STATS_COLUMNS)
+        self.cursor.execute(f"INSERT OR REPLACE INTO catalog_stats (id, {columns}) SELECT 1, * FROM ({CATALOG_STATS_QUERY})")
+        self.connection.commit()
+    
+    def bump_generation(self):
+        """Mark the catalog data as changed for running query servers"""
+        self.cursor.execute('''
+            INSERT INTO catalog_generation (id, generation) VALUES (1, 1)
+            ON CONFLICT (id) DO UPDATE SET generation = generation + 1, updated_at = CURRENT_TIMESTAMP
+        ''')
+        self.connection.commit()
+        self.cursor.execute("SELECT generation FROM catalog_generation WHERE id = 1")
+        generation = self.cursor.fetchone()[0]
+        print(f"Catalog generation is now {generation}")
+        return generation
+    
     def get_table_info(self, table_name):
         """Get information about a table"""
         self.cursor.execute(f"PRAGMA table_info({table_name})")
@@ -184,19 +799,83 @@ class IMDbDatabase:
         """Close database connection"""
         self.connection.close()
 
-def main():
+def parse_args(argv=None):
+    """Parse command line arguments for database setup"""
+    parser = argparse.ArgumentParser(description="Set up the IMDb Movies database")
+    parser.add_argument('--input', default=None,
+                        help=f"title.basics file to load, .tsv or .tsv.gz (default: {DEFAULT_DATA_FILE})")
+    parser.add_argument('--db', default='imdb.db', help="SQLite database path (default: imdb.db)")
+    parser.add_argument('--fast-load', action='store_true',
+                        help="Load all movies in one transaction with relaxed journaling")
+    parser.add_argument('--refresh', action='store_true',
+                        help="Apply the input snapshot to an existing database instead of rebuilding it")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Number of parser processes (default: number of CPUs)")
+    return parser.parse_args(argv)
+
+def resolve_input_file(file_path=None):
+    """Pick the title.basics file to load, preferring the compressed download"""
+    if file_path:
+        return file_path
+    # Fall back to a previously extracted TSV for existing checkouts
+    for candidate in (DEFAULT_DATA_FILE, 'data/title.basics.tsv'):
+        if os.path.exists(candidate):
+            return candidate
+    return DEFAULT_DATA_FILE
+
+def refresh(args):
+    """Refresh an existing database from a new title.basics snapshot"""
+    if not os.path.exists(args.db):
+        print(f"Database '{args.db}' not found! Please run database_setup.py first.")
+        return 1
+    
+    db = IMDbDatabase(args.db)
+    db.create_tables()
+    changes = db.refresh_title_basics(resolve_input_file(args.input), workers=args.workers)
+    if changes is None:
+        # Missing or empty snapshot: the database was left untouched
+        db.close()
+        return 1
+    # Brings indexes of older databases up to date and refreshes statistics
+    db.create_indexes()
+    db.create_views()
+    # Views and statistics are rewritten only when the movies changed (or an
+    # older database lacks them), always with a new generation: servers cache
+    # view pages, with their refreshed_at, under the generation
+    if sum(changes.values()) > 0 or not db.has_materialized_views():
+        db.refresh_materialized_views()
+        db.compute_catalog_stats()
+        db.bump_generation()
+    else:
+        print("No movies changed; materialized views and statistics kept")
+    print(f"Movies in database: {db.get_row_count('movies'):,}")
+    db.close()
+    return 0
+
+def main(argv=None):
     """Main function to set up the database"""
+    args = parse_args(argv)
+    if args.refresh:
+        return refresh(args)
     print("Setting up IMDb Movies database...")
     
     # Initialize database
-    db = IMDbDatabase()
+    db = IMDbDatabase(args.db)
     
     # Create tables
     db.create_tables()
     
     # Load data
     print("\nLoading movie data...")
-    db.load_title_basics()
+    db.load_title_basics(resolve_input_file(args.input), fast_load=args.fast_load,
+                         workers=args.workers)
+    
+    # Normalize genres for indexed genre filtering
+    db.build_genre_index()
+    
+    # Full-text index for title search, trigram postings for fuzzy search
+    db.build_title_search_index()
+    db.build_trigram_index()
     
     # Create indexes for better performance
     db.create_indexes()
@@ -204,6 +883,9 @@ def main():
     # Create database views
     print("\nCreating database views...")
     db.create_views()
+    db.refresh_materialized_views()
+    db.compute_catalog_stats()
+    db.bump_generation()
     
     # Show summary
     print("\nDatabase setup complete!")
@@ -220,6 +902,7 @@ def main():
     print(f"Unique genre combinations: {genre_combinations:,}")
     
     db.close()
+    return 0
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(main()) 
\ No newline at end of file
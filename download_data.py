@@ -9,31 +9,25 @@ Please ensure compliance with IMDb's terms and conditions.
 
 import os
 import urllib.request
-import gzip
-import shutil
 
 import ssl
 ssl._create_default_https_context = ssl._create_unverified_context
 
-def download_and_extract(url, filename):
-    """Download and extract a gzipped file"""
+def download(url, filename):
+    """Download a gzipped dataset file
+
+    The file is kept compressed; database_setup.py streams it through
+    decompression directly, so no extracted copy is written.
+    """
     print(f"Downloading {filename}...")
     
     # Create data directory if it doesn't exist
     os.makedirs('data', exist_ok=True)
     
-    # Download the gzipped file
-    gz_filename = f"data/{filename}.gz"
-    urllib.request.urlretrieve(url, gz_filename)
-    
-    # Extract the file
-    print(f"Extracting {filename}...")
-    with gzip.open(gz_filename, 'rb') as f_in:
-        with open(f"data/{filename}", 'wb') as f_out:
-            shutil.copyfileobj(f_in, f_out)
-    
-    # Remove the gzipped file
-    os.remove(gz_filename)
+    # Download to a temporary name so an interrupted download is never loaded
+    gz_filename = f"data/{filename}"
+    urllib.request.urlretrieve(url, f"{gz_filename}.part")
+    os.replace(f"{gz_filename}.part", gz_filename)
     print(f"✅ {filename} ready!")
 
 def main():
@@ -44,15 +38,15 @@ def main():
     print("This may take several minutes depending on your internet connection.\n")
     
     files_to_download = [
-        ("https://datasets.imdbws.com/title.basics.tsv.gz", "title.basics.tsv"),
+        ("https://datasets.imdbws.com/title.basics.tsv.gz", "title.basics.tsv.gz"),
         # Uncomment if you need additional datasets:
-        # ("https://datasets.imdbws.com/name.basics.tsv.gz", "name.basics.tsv"),
-        # ("https://datasets.imdbws.com/title.akas.tsv.gz", "title.akas.tsv"),
+        # ("https://datasets.imdbws.com/name.basics.tsv.gz", "name.basics.tsv.gz"),
+        # ("https://datasets.imdbws.com/title.akas.tsv.gz", "title.akas.tsv.gz"),
     ]
     
     for url, filename in files_to_download:
         try:
-            download_and_extract(url, filename)
+            download(url, filename)
         except Exception as e:
             print(f"❌ Error downloading {filename}: {e}")
             return False
@@ -1,16 +1,436 @@
 import sqlite3
+import base64
+import hashlib
+import json
 import pandas as pd
+import numpy as np
+import math
+import queue
 import re
-from typing import List, Dict, Any, Optional
+import threading
+import time
+import unicodedata
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+from movie_catalog import MovieCatalog
+from query_cache import QueryCache, cached
+from recommender import Recommender
+
+try:
+    from re import _parser as sre_parse     # Python 3.11+
+except ImportError:
+    import sre_parse
+
+# Columns of a movie in listing results
+MOVIE_COLUMNS = ['tconst', 'primaryTitle', 'originalTitle', 'startYear', 'runtimeMinutes', 'genres']
+
+# Connection pool
+POOL_SIZE = 8                   # Idle read-only connections kept open for reuse
+CACHE_SIZE_KIB = 65536          # Page cache per connection (64MB)
+MMAP_SIZE = 1 << 30             # Memory-map up to 1GB of the database file
+
+# Result cache
+GENERATION_CHECK_INTERVAL = 1.0 # Seconds between checks of the database's catalog generation
+STATS_TTL = 3600                # Aggregates change only when the catalog is rebuilt
+LISTING_TTL = 600
+SEARCH_TTL = 300
+
+# Catalog-wide aggregates behind /api/stats and /api/stats/runtime, in one
+# pass over movies; database_setup.py stores the row in catalog_stats
+CATALOG_STATS_COLUMNS = ['total_movies', 'movies_with_year', 'min_year', 'max_year',
+                         'unique_genre_combinations', 'adult_movies', 'non_adult_movies',
+                         'avg_runtime', 'min_runtime', 'max_runtime', 'movies_with_runtime']
+CATALOG_STATS_QUERY = """
+    SELECT
+        COUNT(*),
+        COUNT(startYear),
+        MIN(startYear),
+        MAX(startYear),
+        COUNT(DISTINCT genres),
+        COUNT(CASE WHEN isAdult = 1 THEN 1 END),
+        COUNT(CASE WHEN isAdult = 0 THEN 1 END),
+        AVG(runtimeMinutes),
+        MIN(runtimeMinutes),
+        MAX(runtimeMinutes),
+        COUNT(runtimeMinutes)
+    FROM movies
+"""
+
+# Reporting views: the query behind each view, and the columns its
+# materialized copy (<view>_mv, rebuilt by database_setup.py) is indexed
+# and can be ordered by. None of those columns are ever NULL.
+DATABASE_VIEWS = {
+    # Recent high-quality movies
+    'recent_quality_movies': '''
+        SELECT 
+            tconst,
+            primaryTitle,
+            startYear,
+            runtimeMinutes,
+            genres,
+            CASE 
+                WHEN runtimeMinutes >= 120 THEN 'Long'
+                WHEN runtimeMinutes >= 90 THEN 'Standard'
+                ELSE 'Short'
+            END as length_category
+        FROM movies
+        WHERE startYear >= 2010 
+            AND runtimeMinutes >= 60
+            AND isAdult = 0
+            AND genres IS NOT NULL
+        ORDER BY startYear DESC
+    ''',
+    # Genre statistics
+    'genre_stats_view': '''
+        SELECT 
+            genres,
+            COUNT(*) as movie_count,
+            AVG(runtimeMinutes) as avg_runtime,
+            MIN(startYear) as earliest_year,
+            MAX(startYear) as latest_year
+        FROM movies
+        WHERE genres IS NOT NULL 
+            AND runtimeMinutes IS NOT NULL
+        GROUP BY genres
+        HAVING movie_count >= 5
+        ORDER BY movie_count DESC
+    ''',
+    # Decade summary
+    'decade_summary': '''
+        SELECT 
+            (startYear / 10) * 10 as decade,
+            COUNT(*) as total_movies,
+            AVG(runtimeMinutes) as avg_runtime,
+            COUNT(CASE WHEN isAdult = 0 THEN 1 END) as family_friendly,
+            COUNT(CASE WHEN isAdult = 1 THEN 1 END) as adult_movies
+        FROM movies
+        WHERE startYear IS NOT NULL AND startYear >= 1920
+        GROUP BY decade
+        ORDER BY decade DESC
+    ''',
+}
+VIEW_SORT_COLUMNS = {
+    'recent_quality_movies': ['startYear', 'runtimeMinutes'],
+    'genre_stats_view': ['genres', 'movie_count', 'avg_runtime'],
+    'decade_summary': ['decade', 'total_movies', 'family_friendly', 'adult_movies'],
+}
+
+# Fuzzy title search (trigram similarity)
+FUZZY_MIN_SIMILARITY = 0.3      # Jaccard similarity of trigram sets, as in pg_trgm
+FUZZY_CANDIDATES = 500          # Titles re-ranked per search
+POSTINGS_DTYPE = '<i4'          # title_trigrams.movie_ids: sorted little-endian int32 rowids
+
+# Item-to-item collaborative filtering (similar_movies, build_similar_movies.py)
+NEIGHBOR_DTYPE = '<f4'          # similar_movies.similarities: little-endian float32 cosines
+NEIGHBOR_WEIGHT = 5             # Score points per unit of summed similarity to the session's movies
+
+# Regex title search
+REGEX_PREFILTER_MAX = 20000     # Literal prefilters matching more titles than this are not worth sorting
+
+# Streaming export
+EXPORT_BATCH = 1000             # Rows fetched, and sent as one chunk, per step of an export
+
+# Batch list updates
+MAX_LIST_BATCH = 500            # Movies per batch list update (one IN list of bound parameters)
+
+# Page cursor shapes: accepted types of each sort key element
+NUMBER = (int, float)
+SEARCH_CURSOR = ((int,), NUMBER, (int,), (str,))                # search_rank, score, year_key, tconst
+FUZZY_CURSOR = (NUMBER, (int,), (str,))                         # -similarity, -startYear, tconst
+YEAR_TITLE_CURSOR = ((int, type(None)), (str,), (str,))         # year_title_key
+VIEW_ROW_CURSOR = ((int,),)                                     # _row
+VIEW_SORT_CURSOR = ((*NUMBER, str, type(None)), (int,))         # sort column value, _row
+
+def fold_case(text: Optional[str]) -> Optional[str]:
+    """Unicode lower-casing for SQL, registered as fold_case(); SQLite's LOWER()
+    only folds ASCII, the FTS5 trigram tokenizer folds every letter"""
+    return text.lower() if text is not None else None
+
+def normalize_title(title: str) -> str:
+    """Lower-case a title and reduce it to plain words (no accents or punctuation)"""
+    title = title.lower()
+    if not title.isascii():
+        title = unicodedata.normalize('NFKD', title)
+        title = ''.join(ch for ch in title if not unicodedata.combining(ch))
+    return ' '.join(re.sub(r'[\W_]+', ' ', title).split())
+
+def title_trigrams(title: str) -> set:
+    """Trigrams of a normalized title, each word padded as '  word '"""
+    trigrams = set()
+    for word in normalize_title(title).split():
+        padded = f"  {word} "
+        trigrams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+def trigram_similarity(a: set, b: set) -> float:
+    """Jaccard similarity of two trigram sets"""
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+def required_literals(pattern: str, flags: int = 0) -> List[str]:
+    """Literal substrings that every match of a regular expression contains"""
+    literals = []
+    run = []
+    
+    def end_run():
+        if run:
+            literals.append(''.join(run))
+            run.clear()
+    
+    def walk(items):
+        for op, arg in items:
+            name = str(op)
+            if name == 'LITERAL':
+                run.append(chr(arg))
+            elif name == 'SUBPATTERN':
+                walk(arg[-1])
+            elif name in ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT') and arg[0] >= 1:
+                # The repeated part occurs at least once, but not adjacent to its neighbours
+                end_run()
+                walk(arg[2])
+                end_run()
+            elif name not in ('AT', 'ASSERT', 'ASSERT_NOT'):
+                # Alternatives, classes, optional parts and wildcards break a literal;
+                # anchors and lookarounds match no characters and do not
+                end_run()
+    
+    walk(sre_parse.parse(pattern, flags))
+    end_run()
+    return literals
+
+def encode_cursor(key) -> str:
+    """Opaque page cursor for the sort key of the last movie on a page"""
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode()).decode().rstrip('=')
+
+def decode_cursor(cursor: str, types: tuple) -> list:
+    """Sort key from a page cursor; raises ValueError for a malformed cursor
+
+    `types` gives the accepted types of each key element (see the
+    *_CURSOR shapes), so a tampered key fails here instead of in a
+    comparison or a bound parameter further on.
+    """
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid page cursor")
+    if not isinstance(key, list) or len(key) != len(types):
+        raise ValueError("Invalid page cursor")
+    for value, accepted in zip(key, types):
+        # JSON true/false decode to bool, which would pass as int
+        if isinstance(value, bool) or not isinstance(value, accepted):
+            raise ValueError("Invalid page cursor")
+    return key
+
+def check_view_request(view_name: str, order_by: Optional[str] = None):
+    """Raise ValueError unless view_name is a reporting view and order_by one of its sort columns"""
+    # The names are put into SQL, so only known ones are accepted
+    valid_views = list(DATABASE_VIEWS)
+    if view_name not in valid_views:
+        raise ValueError(f"Invalid view name. Must be one of: {valid_views}")
+    if order_by is not None and order_by not in VIEW_SORT_COLUMNS[view_name]:
+        raise ValueError(f"Invalid order_by for {view_name}. Must be one of: {VIEW_SORT_COLUMNS[view_name]}")
+
+def compile_title_pattern(pattern: str) -> re.Pattern:
+    """Case-insensitive regex for title search; raises ValueError for an invalid pattern"""
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error as e:
+        raise ValueError(f"Invalid regular expression: {e}")
+
+def materialized_table(view_name: str) -> str:
+    """Table holding the rows of a reporting view, in the view's order"""
+    return f"{view_name}_mv"
+
+def interaction_fingerprint(want_to_watch_ids: List[str], watched_ids: List[str]) -> str:
+    """Digest of a session's lists; recommendations depend only on their contents"""
+    lists = json.dumps([sorted(want_to_watch_ids), sorted(watched_ids)])
+    return hashlib.sha1(lists.encode()).hexdigest()
+
+def take(movies: Iterator, start: int, stop: int) -> list:
+    """Items start..stop of a lazy movie iterator, closing it to release its cursor"""
+    try:
+        return list(islice(movies, start, stop))
+    finally:
+        movies.close()
+
+def year_title_key(movie: Dict[str, Any]) -> tuple:
+    """Sort key of movies listed newest first: (startYear, primaryTitle, tconst)"""
+    return movie['startYear'], movie['primaryTitle'], movie['tconst']
 
 class IMDbQueries:
-    def __init__(self, db_path='imdb.db'):
+    def __init__(self, db_path='imdb.db', use_catalog: bool = False, cache: Optional[QueryCache] = None):
         self.db_path = db_path
+        # Read-only connections are borrowed per call and returned warm:
+        # the threaded Flask server runs each request on a new thread, so
+        # connections are pooled rather than kept per thread. User list
+        # mutations go through a single writer connection, one at a time.
+        self._idle = queue.LifoQueue(maxsize=POOL_SIZE)
+        self._writer = None
+        self._writer_lock = threading.Lock()
+        # Optional result cache and in-memory copy serving the structured
+        # listings; both are dropped when database_setup.py bumps the
+        # catalog generation
+        self.cache = cache
+        self.use_catalog = use_catalog
+        # Whether a generation change reloads the catalog in this process;
+        # prefork_server.py turns it off and reloads once in its parent
+        self.reload_catalog = True
+        self.catalog = None
+        self.recommender = None
+        self._generation = None
+        self._generation_updated = None
+        self._generation_checked = 0.0
+        self._generation_lock = threading.Lock()
+        self._enable_wal()
+        if use_catalog:
+            self.load_catalog()
     
+    def _enable_wal(self):
+        """Switch the database to WAL once, so readers keep reading while a list
+        update commits; read-only deployments keep the current journal mode"""
+        uri = Path(self.db_path).resolve().as_uri() + '?mode=rw'
+        try:
+            conn = sqlite3.connect(uri, uri=True)
+        except sqlite3.Error:
+            return
+        try:
+            # The mode is recorded in the database file, it stays on for every connection
+            conn.execute("PRAGMA journal_mode = WAL")
+        except sqlite3.Error as e:
+            print(f"WAL mode not enabled, database is read-only: {e}")
+        finally:
+            conn.close()
+    
+    def load_catalog(self):
+        """Load (or reload) the in-memory MovieCatalog; on failure queries keep using SQLite"""
+        try:
+            with self._get_connection() as conn:
+                self._generation, self._generation_updated = self._read_generation(conn)
+                catalog = MovieCatalog.load(conn)
+            self.catalog, self.recommender = catalog, Recommender(catalog)
+            print(f"Movie catalog loaded ({len(catalog):,} movies)")
+        except sqlite3.Error as e:
+            print(f"Movie catalog not loaded, serving from SQLite: {e}")
+            self.catalog = self.recommender = None
+    
+    def _read_generation(self, conn) -> Tuple[int, Optional[datetime]]:
+        """Catalog generation recorded by database_setup.py and when it was set
+        ((0, None) for databases without one)"""
+        try:
+            row = conn.execute("SELECT generation, updated_at FROM catalog_generation WHERE id = 1").fetchone()
+        except sqlite3.OperationalError:
+            return 0, None
+        if row is None:
+            return 0, None
+        # CURRENT_TIMESTAMP is UTC
+        updated = datetime.strptime(row[1], '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc) if row[1] else None
+        return row[0], updated
+    
+    def check_generation(self) -> int:
+        """Current catalog generation, re-read at most every GENERATION_CHECK_INTERVAL
+        seconds; a change clears the result cache and reloads the catalog"""
+        now = time.monotonic()
+        if self._generation is not None and now - self._generation_checked < GENERATION_CHECK_INTERVAL:
+            return self._generation
+        with self._generation_lock:
+            if self._generation is not None and now - self._generation_checked < GENERATION_CHECK_INTERVAL:
+                return self._generation
+            with self._get_connection() as conn:
+                generation, updated = self._read_generation(conn)
+            previous, self._generation = self._generation, generation
+            self._generation_updated = updated
+            self._generation_checked = time.monotonic()
+            if previous is not None and generation != previous:
+                print(f"Catalog generation changed ({previous} -> {generation}), dropping cached results")
+                if self.cache is not None:
+                    self.cache.clear()
+                if self.use_catalog:
+                    # Serve from SQLite while the new snapshot loads
+                    self.catalog = self.recommender = None
+                    if self.reload_catalog:
+                        threading.Thread(target=self.load_catalog, daemon=True).start()
+            return generation
+    
+    def catalog_version(self) -> Tuple[int, Optional[datetime]]:
+        """(generation, time it was set) of the catalog being served, for HTTP validators;
+        read from SQLite at most every GENERATION_CHECK_INTERVAL seconds"""
+        generation = self.check_generation()
+        return generation, self._generation_updated
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Result cache counters, or None when caching is off"""
+        if self.cache is None:
+            return None
+        return {'generation': self._generation, **self.cache.stats()}
+    
+    def _open_connection(self, read_only: bool = True) -> sqlite3.Connection:
+        """Open a database connection tuned for serving queries"""
+        if read_only:
+            uri = Path(self.db_path).resolve().as_uri() + '?mode=ro'
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.create_function('fold_case', 1, fold_case, deterministic=True)
+        conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KIB}")
+        conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+        return conn
+    
+    def _get_writer(self) -> sqlite3.Connection:
+        """The shared writer connection, opened on the first list update"""
+        if self._writer is None:
+            with self._writer_lock:
+                if self._writer is None:
+                    self._writer = self._open_connection(read_only=False)
+        return self._writer
+    
+    @contextmanager
     def _get_connection(self):
-        """Get database connection"""
-        return sqlite3.connect(self.db_path)
+        """Borrow a pooled read-only connection for the duration of a with block"""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._open_connection()
+        try:
+            with conn:
+                yield conn
+        finally:
+            try:
+                self._idle.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+    
+    @contextmanager
+    def _write_connection(self):
+        """Hold the writer connection for a with block; commits unless it raises"""
+        conn = self._get_writer()
+        with self._writer_lock, conn:
+            yield conn
+    
+    def close(self):
+        """Close pooled and writer connections"""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
     
+    def _get_genre_bits(self, conn) -> Dict[str, tuple]:
+        """Map lower-cased genre names to (genre, genre_mask bit value)"""
+        cursor = conn.cursor()
+        cursor.execute("SELECT genre, bit FROM genre_bits")
+        return {genre.lower(): (genre, 1 << bit) for genre, bit in cursor.fetchall()}
+    
+    @cached(LISTING_TTL)
     def get_sample_movies(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get sample movies"""
         with self._get_connection() as conn:
@@ -26,8 +446,13 @@ class IMDbQueries:
             rows = cursor.fetchall()
             return [dict(zip(columns, row)) for row in rows]
     
+    @cached(LISTING_TTL)
     def get_movies_by_year(self, year: int, limit: int = 10) -> List[Dict[str, Any]]:
         """Get movies by release year"""
+        catalog = self.catalog
+        if catalog is not None:
+            return catalog.rows(catalog.movies_by_year(year, limit),
+                                ['tconst', 'primaryTitle', 'originalTitle', 'runtimeMinutes', 'genres'])
         with self._get_connection() as conn:
             query = """
                 SELECT tconst, primaryTitle, originalTitle, runtimeMinutes, genres
@@ -42,8 +467,12 @@ class IMDbQueries:
             rows = cursor.fetchall()
             return [dict(zip(columns, row)) for row in rows]
     
+    @cached(LISTING_TTL)
     def get_movies_by_year_range(self, start_year: int, end_year: int, limit: int = 10) -> List[Dict[str, Any]]:
         """Get movies within a year range"""
+        catalog = self.catalog
+        if catalog is not None:
+            return catalog.rows(catalog.movies_by_year_range(start_year, end_year, limit), MOVIE_COLUMNS)
         with self._get_connection() as conn:
             query = """
                 SELECT tconst, primaryTitle, originalTitle, startYear, runtimeMinutes, genres
@@ -58,79 +487,241 @@ class IMDbQueries:
             rows = cursor.fetchall()
             return [dict(zip(columns, row)) for row in rows]
     
-    def search_movies(self, search_term: str, limit: int = 10, offset: int = 0) -> List[Dict[str, Any]]:
-        """Search for movies by title with exact matches first"""
+    def _has_table(self, conn, table_name: str) -> bool:
+        """Check whether a table (or virtual table) exists"""
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table_name,))
+        return cursor.fetchone() is not None
+    
+    def _page(self, rows: list, limit: int, key) -> Dict[str, Any]:
+        """Page of results from up to limit + 1 rows, `key` giving a row's sort key
+
+        The extra row only tells whether there is a next page; next_cursor
+        continues after the last row returned.
+        """
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        return {
+            'movies': rows,
+            'has_more': has_more,
+            'next_cursor': encode_cursor(key(rows[-1])) if has_more and rows else None
+        }
+    
+    def _iter_year_ordered(self, conn, source: str, where: str, params: tuple = (),
+                           after: Optional[list] = None, include_undated: bool = True) -> Iterator[Dict[str, Any]]:
+        """Lazily yield movies ordered by startYear DESC, primaryTitle, tconst
+
+        `source` names the movies table as m (optionally joined) and
+        `where` filters it. `after` is the year_title_key of the last movie
+        already seen. The rest of that movie's year, the earlier years and
+        the movies without a year (which sort last) are read by separate
+        queries, so that each part is one range seek on idx_movies_year_key
+        however deep the page is.
+        """
+        segments = []
+        if after is None:
+            segments.append(("m.startYear <= 2025", ()))
+        elif after[0] is not None:
+            year, title, tconst = after
+            segments.append(("m.startYear = ? AND m.startYear <= 2025 AND (m.primaryTitle, m.tconst) > (?, ?)",
+                             (year, title, tconst)))
+            segments.append(("m.startYear < ? AND m.startYear <= 2025", (year,)))
+        if include_undated:
+            if after is None or after[0] is not None:
+                segments.append(("m.startYear IS NULL", ()))
+            else:
+                segments.append(("m.startYear IS NULL AND (m.primaryTitle, m.tconst) > (?, ?)",
+                                 (after[1], after[2])))
+        
+        cursor = conn.cursor()
+        try:
+            for keyset, keyset_params in segments:
+                cursor.execute(f"""
+                    SELECT m.tconst, m.primaryTitle, m.originalTitle, m.startYear, m.runtimeMinutes, m.genres
+                    FROM {source}
+                    WHERE {where} AND {keyset}
+                    ORDER BY m.startYear DESC, m.primaryTitle, m.tconst
+                """, params + keyset_params)
+                columns = [description[0] for description in cursor.description]
+                for row in cursor:
+                    yield dict(zip(columns, row))
+        finally:
+            # A pooled connection must not keep a half-read statement open
+            cursor.close()
+    
+    @cached(SEARCH_TTL)
+    def search_movies(self, search_term: str, limit: int = 10, offset: int = 0,
+                      cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Search for movies by title with exact matches first
+
+        Matching titles are found through the movie_titles_fts trigram
+        index and ordered exact > prefix > contains, then by BM25 relevance,
+        year and tconst. Terms shorter than a trigram (or a database without
+        the index) fall back to scanning titles with LIKE. Both paths ignore
+        case for every letter, as the trigram index does: non-ASCII terms
+        are compared through fold_case() rather than SQLite's ASCII-only
+        LOWER(). Returns a page (see _page); pass its next_cursor as
+        `cursor` for the next one.
+        """
+        after = decode_cursor(cursor, SEARCH_CURSOR) if cursor else None
         with self._get_connection() as conn:
-            query = """
-                SELECT tconst, primaryTitle, originalTitle, startYear, runtimeMinutes, genres,
-                    -- Ranking for search relevance (lower number = higher priority)
-                    CASE 
-                        WHEN LOWER(primaryTitle) = LOWER(?) THEN 1
-                        WHEN LOWER(originalTitle) = LOWER(?) THEN 1
-                        WHEN LOWER(primaryTitle) LIKE LOWER(?) THEN 2
-                        WHEN LOWER(originalTitle) LIKE LOWER(?) THEN 2
-                        WHEN LOWER(primaryTitle) LIKE LOWER(?) THEN 3
-                        WHEN LOWER(originalTitle) LIKE LOWER(?) THEN 3
-                        ELSE 4
-                    END as search_rank
-                FROM movies 
-                WHERE (LOWER(primaryTitle) LIKE LOWER(?) OR LOWER(originalTitle) LIKE LOWER(?)) 
-                    AND primaryTitle IS NOT NULL 
-                    AND (startYear IS NULL OR startYear <= 2025)
-                ORDER BY search_rank ASC, startYear DESC
-                LIMIT ? OFFSET ?
-            """
-            
             # Prepare search patterns
             exact_match = search_term
             starts_with = f"{search_term}%"
             contains = f"%{search_term}%"
+            # An ASCII term cannot match a folded non-ASCII letter, so the
+            # built-in LOWER() suffices and avoids a Python call per title
+            lower = "LOWER" if search_term.isascii() else "fold_case"
+            
+            if len(search_term) >= 3 and self._has_table(conn, 'movie_titles_fts'):
+                # Candidate titles come from the trigram index, not a table scan
+                source = "movie_titles_fts f JOIN movies m ON m.rowid = f.rowid"
+                match = "movie_titles_fts MATCH ?"
+                score = "f.rank"
+                match_params = ('"' + search_term.replace('"', '""') + '"',)
+            else:
+                source = "movies m"
+                match = f"({lower}(m.primaryTitle) LIKE {lower}(?) OR {lower}(m.originalTitle) LIKE {lower}(?))"
+                score = "0"
+                match_params = (contains, contains)
+            
+            # Sort key columns: year_key orders by startYear DESC with unknown years last
+            keyset = "WHERE (search_rank, score, year_key, tconst) > (?, ?, ?, ?)" if after else ""
+            query = f"""
+                SELECT * FROM (
+                    SELECT m.tconst, m.primaryTitle, m.originalTitle, m.startYear, m.runtimeMinutes, m.genres,
+                        -- Ranking for search relevance (lower number = higher priority)
+                        CASE 
+                            WHEN {lower}(m.primaryTitle) = {lower}(?) THEN 1
+                            WHEN {lower}(m.originalTitle) = {lower}(?) THEN 1
+                            WHEN {lower}(m.primaryTitle) LIKE {lower}(?) THEN 2
+                            WHEN {lower}(m.originalTitle) LIKE {lower}(?) THEN 2
+                            WHEN {lower}(m.primaryTitle) LIKE {lower}(?) THEN 3
+                            WHEN {lower}(m.originalTitle) LIKE {lower}(?) THEN 3
+                            ELSE 4
+                        END as search_rank,
+                        {score} as score,
+                        COALESCE(-m.startYear, 0) as year_key
+                    FROM {source}
+                    WHERE {match}
+                        AND m.primaryTitle IS NOT NULL 
+                        AND (m.startYear IS NULL OR m.startYear <= 2025)
+                )
+                {keyset}
+                ORDER BY search_rank, score, year_key, tconst
+                LIMIT ? OFFSET ?
+            """
             
             cursor = conn.cursor()
             cursor.execute(query, (
                 exact_match, exact_match,           # Exact match check
                 starts_with, starts_with,           # Starts with check  
                 contains, contains,                 # Contains check
-                contains, contains,                 # WHERE clause
-                limit, offset
+                *match_params,                      # WHERE clause
+                *(after or ()),                     # Keyset after the previous page
+                limit + 1, offset
             ))
             
-            columns = [description[0] for description in cursor.description]
-            rows = cursor.fetchall()
-            
-            # Remove the search_rank column from results
-            filtered_columns = [col for col in columns if col != 'search_rank']
-            filtered_rows = []
-            for row in rows:
-                filtered_row = []
-                for i, col in enumerate(columns):
-                    if col != 'search_rank':
-                        filtered_row.append(row[i])
-                filtered_rows.append(tuple(filtered_row))
-            
-            return [dict(zip(filtered_columns, row)) for row in filtered_rows]
+            # Sort key columns follow the movie columns and are left out of the results
+            columns = [description[0] for description in cursor.description[:6]]
+            page = self._page(cursor.fetchall(), limit, lambda row: (row[6], row[7], row[8], row[0]))
+            page['movies'] = [dict(zip(columns, row)) for row in page['movies']]
+            return page
     
-    def get_movies_by_genre(self, genre: str, limit: int = 10, offset: int = 0) -> List[Dict[str, Any]]:
-        """Get movies by genre"""
+    @cached(SEARCH_TTL)
+    def fuzzy_search_movies(self, search_term: str, limit: int = 10, offset: int = 0,
+                            cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Typo-tolerant title search ranked by trigram similarity
+
+        The postings of the search term's trigrams are read from
+        title_trigrams and counted per movie; movies sharing too few
+        trigrams to reach FUZZY_MIN_SIMILARITY are dropped without being
+        read. The best candidates are re-ranked by the similarity of their
+        primary or original title, best first. Returns a page (see _page).
+        """
+        # Checked before scoring: the key is compared with every candidate's
+        after = tuple(decode_cursor(cursor, FUZZY_CURSOR)) if cursor else None
+        empty_page = {'movies': [], 'has_more': False, 'next_cursor': None}
+        query_trigrams = title_trigrams(search_term)
+        if not query_trigrams:
+            return empty_page
+        
         with self._get_connection() as conn:
-            query = """
+            cursor = conn.cursor()
+            placeholders = ', '.join('?' for _ in query_trigrams)
+            cursor.execute(f"SELECT movie_ids FROM title_trigrams WHERE trigram IN ({placeholders})",
+                           tuple(query_trigrams))
+            postings = [np.frombuffer(row[0], dtype=POSTINGS_DTYPE) for row in cursor.fetchall()]
+            if not postings:
+                return empty_page
+            
+            # Shared trigram count per movie; similarity >= t needs at least
+            # t * len(query_trigrams) of them
+            shared = np.bincount(np.concatenate(postings))
+            min_shared = max(1, math.ceil(FUZZY_MIN_SIMILARITY * len(query_trigrams)))
+            movie_ids = np.flatnonzero(shared >= min_shared)
+            if len(movie_ids) > FUZZY_CANDIDATES:
+                best = np.argpartition(shared[movie_ids], -FUZZY_CANDIDATES)[-FUZZY_CANDIDATES:]
+                movie_ids = movie_ids[best]
+            if len(movie_ids) == 0:
+                return empty_page
+            
+            placeholders = ', '.join('?' for _ in movie_ids)
+            cursor.execute(f"""
                 SELECT tconst, primaryTitle, originalTitle, startYear, runtimeMinutes, genres
                 FROM movies 
-                WHERE genres LIKE ? 
+                WHERE rowid IN ({placeholders})
                     AND primaryTitle IS NOT NULL 
                     AND (startYear IS NULL OR startYear <= 2025)
-                ORDER BY startYear DESC
-                LIMIT ? OFFSET ?
-            """
-            genre_pattern = f"%{genre}%"
-            cursor = conn.cursor()
-            cursor.execute(query, (genre_pattern, limit, offset))
+            """, movie_ids.tolist())
             columns = [description[0] for description in cursor.description]
-            rows = cursor.fetchall()
-            return [dict(zip(columns, row)) for row in rows]
+            
+            scored = []
+            for row in cursor.fetchall():
+                similarity = trigram_similarity(query_trigrams, title_trigrams(row[1]))
+                if row[2] and row[2] != row[1]:
+                    similarity = max(similarity, trigram_similarity(query_trigrams, title_trigrams(row[2])))
+                if similarity >= FUZZY_MIN_SIMILARITY:
+                    # Sort key: best similarity, then newest, then tconst
+                    scored.append(((-similarity, -(row[3] or 0), row[0]), similarity, row))
+            
+            scored.sort(key=lambda item: item[0])
+            if after:
+                scored = [item for item in scored if item[0] > after]
+            page = self._page(scored[offset:offset + limit + 1], limit, lambda item: item[0])
+            movies = []
+            for key, similarity, row in page['movies']:
+                movie = dict(zip(columns, row))
+                movie['similarity'] = round(similarity, 3)
+                movies.append(movie)
+            page['movies'] = movies
+            return page
+    
+    @cached(LISTING_TTL)
+    def get_movies_by_genre(self, genre: str, limit: int = 10, offset: int = 0,
+                            cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Get a page of movies by genre, newest first (see _page)"""
+        after = decode_cursor(cursor, YEAR_TITLE_CURSOR) if cursor else None
+        with self._get_connection() as conn:
+            genre_bits = self._get_genre_bits(conn)
+            if genre.lower() not in genre_bits:
+                return {'movies': [], 'has_more': False, 'next_cursor': None}
+            
+            # Exact genre match as a genre_mask bit test; the year index
+            # carries genre_mask, so rows are tested in ORDER BY order
+            # without a sort or a table lookup per row
+            movies = self._iter_year_ordered(
+                conn, "movies m", "m.genre_mask & ? != 0 AND m.primaryTitle IS NOT NULL",
+                (genre_bits[genre.lower()][1],), after
+            )
+            return self._page(take(movies, offset, offset + limit + 1), limit, year_title_key)
     
+    @cached(LISTING_TTL)
     def get_movies_by_runtime(self, min_runtime: int, max_runtime: int, limit: int = 10) -> List[Dict[str, Any]]:
         """Get movies by runtime range"""
+        catalog = self.catalog
+        if catalog is not None:
+            return catalog.rows(catalog.movies_by_runtime(min_runtime, max_runtime, limit), MOVIE_COLUMNS)
         with self._get_connection() as conn:
             query = """
                 SELECT tconst, primaryTitle, originalTitle, startYear, runtimeMinutes, genres
@@ -145,8 +736,12 @@ class IMDbQueries:
             rows = cursor.fetchall()
             return [dict(zip(columns, row)) for row in rows]
     
+    @cached(LISTING_TTL)
     def get_longest_movies(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get the longest movies"""
+        catalog = self.catalog
+        if catalog is not None:
+            return catalog.rows(catalog.longest_movies(limit), MOVIE_COLUMNS)
         with self._get_connection() as conn:
             query = """
                 SELECT tconst, primaryTitle, originalTitle, startYear, runtimeMinutes, genres
@@ -161,24 +756,67 @@ class IMDbQueries:
             rows = cursor.fetchall()
             return [dict(zip(columns, row)) for row in rows]
     
-    def get_recent_movies(self, limit: int = 10, offset: int = 0) -> List[Dict[str, Any]]:
-        """Get the most recent movies"""
+    @cached(LISTING_TTL)
+    def get_recent_movies(self, limit: int = 10, offset: int = 0,
+                          cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Get a page of the most recent movies (see _page)"""
+        after = decode_cursor(cursor, YEAR_TITLE_CURSOR) if cursor else None
+        catalog = self.catalog
+        if catalog is not None:
+            movies = catalog.rows(catalog.recent_movies(offset, limit + 1, after), MOVIE_COLUMNS)
+            return self._page(movies, limit, year_title_key)
+        with self._get_connection() as conn:
+            movies = self._iter_year_ordered(conn, "movies m", "m.primaryTitle IS NOT NULL",
+                                             after=after, include_undated=False)
+            return self._page(take(movies, offset, offset + limit + 1), limit, year_title_key)
+    
+    def export_movies(self, start_year: Optional[int] = None, end_year: Optional[int] = None,
+                      genre: Optional[str] = None) -> Iterator[List[tuple]]:
+        """Every titled movie matching the filters, newest first, as batches of
+        EXPORT_BATCH MOVIE_COLUMNS tuples
+
+        Filters are checked before returning (an unknown genre raises
+        ValueError); the rows are then read lazily from one cursor, so memory
+        stays flat however many movies match. The pooled connection is held
+        until the returned generator is exhausted or closed.
+        """
+        conditions, params = ["m.primaryTitle IS NOT NULL"], []
+        if start_year is not None:
+            conditions.append("m.startYear >= ?")
+            params.append(start_year)
+        if end_year is not None:
+            conditions.append("m.startYear <= ?")
+            params.append(end_year)
+        if genre is not None:
+            with self._get_connection() as conn:
+                genre_bits = self._get_genre_bits(conn)
+            if genre.lower() not in genre_bits:
+                raise ValueError(f"Unknown genre: {genre}")
+            conditions.append("m.genre_mask & ? != 0")
+            params.append(genre_bits[genre.lower()][1])
+        return self._iter_export(" AND ".join(conditions), tuple(params))
+    
+    def _iter_export(self, where: str, params: tuple) -> Iterator[List[tuple]]:
+        """Batches of movie rows read along idx_movies_year_key"""
         with self._get_connection() as conn:
-            query = """
-                SELECT tconst, primaryTitle, originalTitle, startYear, runtimeMinutes, genres
-                FROM movies 
-                WHERE startYear IS NOT NULL 
-                    AND primaryTitle IS NOT NULL 
-                    AND startYear <= 2025
-                ORDER BY startYear DESC, primaryTitle
-                LIMIT ? OFFSET ?
-            """
             cursor = conn.cursor()
-            cursor.execute(query, (limit, offset))
-            columns = [description[0] for description in cursor.description]
-            rows = cursor.fetchall()
-            return [dict(zip(columns, row)) for row in rows]
+            try:
+                cursor.execute(f"""
+                    SELECT m.tconst, m.primaryTitle, m.originalTitle, m.startYear, m.runtimeMinutes, m.genres
+                    FROM movies m
+                    WHERE {where}
+                    ORDER BY m.startYear DESC, m.primaryTitle, m.tconst
+                """, params)
+                while True:
+                    rows = cursor.fetchmany(EXPORT_BATCH)
+                    if not rows:
+                        break
+                    yield rows
+            finally:
+                # A pooled connection must not keep a half-read statement open
+                cursor.close()
     
+    @cached(STATS_TTL)
     def get_movies_stats_by_year(self) -> List[Dict[str, Any]]:
         """Get movie count statistics by year"""
         with self._get_connection() as conn:
@@ -196,6 +834,7 @@ class IMDbQueries:
             rows = cursor.fetchall()
             return [dict(zip(columns, row)) for row in rows]
     
+    @cached(STATS_TTL)
     def get_genre_stats(self) -> List[Dict[str, Any]]:
         """Get statistics by genre combinations"""
         with self._get_connection() as conn:
@@ -213,71 +852,51 @@ class IMDbQueries:
             rows = cursor.fetchall()
             return [dict(zip(columns, row)) for row in rows]
     
+    def _catalog_stats(self, conn) -> Dict[str, Any]:
+        """Catalog-wide aggregates, precomputed by database_setup.py into catalog_stats"""
+        cursor = conn.cursor()
+        if self._has_table(conn, 'catalog_stats'):
+            cursor.execute(f"SELECT {', '.join(CATALOG_STATS_COLUMNS)} FROM catalog_stats WHERE id = 1")
+        else:
+            # Databases set up before catalog_stats: aggregate on the fly
+            cursor.execute(CATALOG_STATS_QUERY)
+        row = cursor.fetchone()
+        if row is None:
+            cursor.execute(CATALOG_STATS_QUERY)
+            row = cursor.fetchone()
+        return dict(zip(CATALOG_STATS_COLUMNS, row))
+    
+    @cached(STATS_TTL)
     def get_runtime_stats(self) -> Dict[str, Any]:
         """Get runtime statistics"""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Average runtime
-            cursor.execute("SELECT AVG(runtimeMinutes) FROM movies WHERE runtimeMinutes IS NOT NULL")
-            avg_runtime = cursor.fetchone()[0]
-            
-            # Min runtime
-            cursor.execute("SELECT MIN(runtimeMinutes) FROM movies WHERE runtimeMinutes IS NOT NULL")
-            min_runtime = cursor.fetchone()[0]
-            
-            # Max runtime
-            cursor.execute("SELECT MAX(runtimeMinutes) FROM movies WHERE runtimeMinutes IS NOT NULL")
-            max_runtime = cursor.fetchone()[0]
-            
-            # Movies with runtime data
-            cursor.execute("SELECT COUNT(*) FROM movies WHERE runtimeMinutes IS NOT NULL")
-            movies_with_runtime = cursor.fetchone()[0]
-            
+            stats = self._catalog_stats(conn)
+            avg_runtime = stats['avg_runtime']
             return {
                 'average_runtime_minutes': round(avg_runtime, 2) if avg_runtime else None,
-                'min_runtime_minutes': min_runtime,
-                'max_runtime_minutes': max_runtime,
-                'movies_with_runtime_data': movies_with_runtime
+                'min_runtime_minutes': stats['min_runtime'],
+                'max_runtime_minutes': stats['max_runtime'],
+                'movies_with_runtime_data': stats['movies_with_runtime']
             }
     
+    @cached(STATS_TTL)
     def get_database_stats(self) -> Dict[str, Any]:
         """Get overall database statistics"""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Get total movie count
-            cursor.execute("SELECT COUNT(*) FROM movies")
-            total_movies = cursor.fetchone()[0]
-            
-            # Get movies with non-null start year
-            cursor.execute("SELECT COUNT(*) FROM movies WHERE startYear IS NOT NULL")
-            movies_with_year = cursor.fetchone()[0]
-            
-            # Get year range
-            cursor.execute("SELECT MIN(startYear), MAX(startYear) FROM movies WHERE startYear IS NOT NULL")
-            year_range = cursor.fetchone()
-            min_year, max_year = year_range if year_range else (None, None)
-            
-            # Get unique genres count
-            cursor.execute("SELECT COUNT(DISTINCT genres) FROM movies WHERE genres IS NOT NULL")
-            unique_genres = cursor.fetchone()[0]
-            
-            # Get adult vs non-adult counts
-            cursor.execute("SELECT COUNT(*) FROM movies WHERE isAdult = 1")
-            adult_movies = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM movies WHERE isAdult = 0")
-            non_adult_movies = cursor.fetchone()[0]
-            
-            return {
-                'total_movies': total_movies,
-                'movies_with_year': movies_with_year,
-                'year_range': f"{min_year}-{max_year}" if min_year and max_year else None,
-                'unique_genre_combinations': unique_genres,
-                'adult_movies': adult_movies,
-                'non_adult_movies': non_adult_movies
-            }
+            return self._database_stats(conn)
+    
+    def _database_stats(self, conn) -> Dict[str, Any]:
+        """Overall database statistics read on `conn`"""
+        stats = self._catalog_stats(conn)
+        min_year, max_year = stats['min_year'], stats['max_year']
+        return {
+            'total_movies': stats['total_movies'],
+            'movies_with_year': stats['movies_with_year'],
+            'year_range': f"{min_year}-{max_year}" if min_year and max_year else None,
+            'unique_genre_combinations': stats['unique_genre_combinations'],
+            'adult_movies': stats['adult_movies'],
+            'non_adult_movies': stats['non_adult_movies']
+        }
     
     def get_recommendations(self, want_to_watch_movie_ids: List[str], watched_movie_ids: List[str] = None, limit: int = 15) -> Dict[str, Any]:
         """Get movie recommendations based on want to watch and watched movies"""
@@ -303,19 +922,17 @@ class IMDbQueries:
         with self._get_connection() as conn:
             cursor = conn.cursor()
             
-            # Convert all movie IDs to a comma-separated string for SQL
-            all_ids_str = "','".join(all_interaction_ids)
-            
             # Analyze all interacted movies to understand preferences
             analysis_query = f"""
-                SELECT genres, startYear, runtimeMinutes
+                SELECT rowid, genres, startYear, runtimeMinutes
                 FROM movies 
-                WHERE tconst IN ('{all_ids_str}') 
-                AND genres IS NOT NULL
+                WHERE tconst IN ({', '.join('?' * len(all_interaction_ids))})
             """
             
-            cursor.execute(analysis_query)
-            interaction_movies_data = cursor.fetchall()
+            cursor.execute(analysis_query, all_interaction_ids)
+            interacted = cursor.fetchall()
+            interacted_rowids = [row[0] for row in interacted]
+            interaction_movies_data = [row[1:] for row in interacted if row[1] is not None]
             
             if not interaction_movies_data:
                 return {
@@ -365,15 +982,48 @@ class IMDbQueries:
             avg_year = sum(years) / len(years) if years else 2020
             avg_runtime = sum(runtimes) / len(runtimes) if runtimes else None
             
-            # Build genre conditions for SQL
-            genre_conditions = []
-            for genre in top_genres[:3]:  # Use top 3 genres
-                genre_conditions.append(f"genres LIKE '%{genre}%'")
+            # Genre bits of the top 3 genres, tested against genre_mask
+            genre_bits = self._get_genre_bits(conn)
+            top_genre_bits = [genre_bits[genre.lower()][1] for genre in top_genres[:3]
+                              if genre.lower() in genre_bits]
+            any_top_genre = sum(top_genre_bits)
+            
+            # Movies often listed together with the session's movies by other sessions
+            boosts = self._neighbor_boosts(conn, interacted_rowids)
+            
+            analysis = {
+                'top_genres': top_genres,
+                'preferred_years': f"{min(years)}-{max(years)}" if years else "Unknown",
+                'avg_runtime': round(avg_runtime, 1) if avg_runtime else None,
+                'total_interactions': total_interactions,
+                'want_to_watch_count': len(want_to_watch_movie_ids),
+                'watched_count': len(watched_movie_ids)
+            }
             
-            genre_where_clause = " OR ".join(genre_conditions) if genre_conditions else "1=1"
+            # Same score computed over the in-memory catalog's feature arrays
+            recommender = self.recommender
+            if recommender is not None:
+                positions = recommender.recommend(top_genre_bits, avg_year, avg_runtime, interacted_rowids, limit,
+                                                  boosts)
+                return {
+                    'recommendations': recommender.catalog.rows(positions, MOVIE_COLUMNS),
+                    'analysis': analysis
+                }
             
-            # Build recommendation query
+            # Build recommendation query; neighbor boosts come in as a VALUES table
+            # (IN on the CTE builds a lookup index once; the boost itself is
+            # only looked up for the movies that have one)
+            boost_cte = boost_score = boost_match = ""
+            boost_params = []
+            if boosts:
+                boost_cte = f"WITH neighbor_boosts (movie_id, boost) AS (VALUES {', '.join(['(?, ?)'] * len(boosts))})"
+                boosted = "movies.rowid IN (SELECT movie_id FROM neighbor_boosts)"
+                boost_score = (f"+ (CASE WHEN {boosted} THEN "
+                               "(SELECT boost FROM neighbor_boosts WHERE movie_id = movies.rowid) ELSE 0 END)")
+                boost_match = f"OR {boosted}"
+                boost_params = [value for item in boosts.items() for value in item]
             recommendation_query = f"""
+                {boost_cte}
                 SELECT 
                     tconst, primaryTitle, originalTitle, startYear, runtimeMinutes, genres,
                     -- Score based on genre overlap, year proximity, and runtime similarity
@@ -381,7 +1031,7 @@ class IMDbQueries:
                         WHEN genres IS NULL THEN 0
                         ELSE (
                             -- Genre similarity score (count matching genres)
-                            {' + '.join([f"(CASE WHEN genres LIKE '%{genre}%' THEN 3 ELSE 0 END)" for genre in top_genres[:3]])}
+                            {' + '.join(["(CASE WHEN genre_mask & ? != 0 THEN 3 ELSE 0 END)" for _ in top_genre_bits]) or "0"}
                             -- Year proximity bonus (closer to average preferred year)
                             + (CASE WHEN startYear IS NOT NULL THEN 
                                 MAX(0, 5 - ABS(startYear - {avg_year}) / 10) 
@@ -393,22 +1043,23 @@ class IMDbQueries:
                             -- Quality proxy: reasonable runtime
                             + (CASE WHEN runtimeMinutes >= 80 AND runtimeMinutes <= 180 THEN 1 ELSE 0 END)
                         )
-                    END) as recommendation_score
+                    END) {boost_score} as recommendation_score
                 FROM movies 
-                WHERE tconst NOT IN ('{all_ids_str}')
+                WHERE tconst NOT IN ({', '.join('?' * len(all_interaction_ids))})
                     AND primaryTitle IS NOT NULL 
                     AND genres IS NOT NULL
                     AND isAdult = 0
                     AND (startYear IS NULL OR startYear <= 2025)
                     AND startYear >= 1970
-                    -- Must have at least one matching genre
-                    AND ({genre_where_clause})
-                ORDER BY recommendation_score DESC, startYear DESC
+                    -- Must have at least one matching genre (or be a neighbor)
+                    AND (genre_mask & ? != 0 {boost_match})
+                ORDER BY recommendation_score DESC, startYear DESC, movies.rowid
                 LIMIT ?
             """
             
             try:
-                cursor.execute(recommendation_query, (limit,))
+                cursor.execute(recommendation_query, (*boost_params, *top_genre_bits, *all_interaction_ids,
+                                                      any_top_genre, limit))
                 columns = [description[0] for description in cursor.description]
                 rows = cursor.fetchall()
                 
@@ -422,14 +1073,7 @@ class IMDbQueries:
                 
                 return {
                     'recommendations': recommendations,
-                    'analysis': {
-                        'top_genres': top_genres,
-                        'preferred_years': f"{min(years)}-{max(years)}" if years else "Unknown",
-                        'avg_runtime': round(avg_runtime, 1) if avg_runtime else None,
-                        'total_interactions': total_interactions,
-                        'want_to_watch_count': len(want_to_watch_movie_ids),
-                        'watched_count': len(watched_movie_ids)
-                    }
+                    'analysis': analysis
                 }
             except Exception as e:
                 return {
@@ -443,42 +1087,66 @@ class IMDbQueries:
                     }
                 }
 
+    def _neighbor_boosts(self, conn, movie_ids: List[int]) -> Dict[int, float]:
+        """Score boost per movie rowid from the similar_movies lists of the given movies"""
+        if not movie_ids:
+            return {}
+        try:
+            cursor = conn.execute(f'''
+                SELECT neighbor_ids, similarities
+                FROM similar_movies
+                WHERE movie_id IN ({', '.join('?' * len(movie_ids))})
+            ''', movie_ids)
+            rows = cursor.fetchall()
+        except sqlite3.OperationalError:
+            # similar_movies not built
+            return {}
+        
+        similarity = {}
+        for neighbor_ids, similarities in rows:
+            for movie_id, value in zip(np.frombuffer(neighbor_ids, dtype=POSTINGS_DTYPE).tolist(),
+                                       np.frombuffer(similarities, dtype=NEIGHBOR_DTYPE).tolist()):
+                similarity[movie_id] = similarity.get(movie_id, 0.0) + value
+        return {movie_id: NEIGHBOR_WEIGHT * total for movie_id, total in similarity.items()}
+    
+    def get_precomputed_recommendations(self, user_session: str, want_to_watch_movie_ids: List[str],
+                                        watched_movie_ids: List[str], limit: int = 15) -> Optional[Dict[str, Any]]:
+        """Recommendations stored by precompute_recommendations.py, or None unless fresh
+
+        Fresh means computed from the same list contents, against the current
+        catalog generation, for at least `limit` movies. build_similar_movies.py
+        deletes every stored result, as they include the old neighbor boosts.
+        """
+        with self._get_connection() as conn:
+            try:
+                row = conn.execute('''
+                    SELECT fingerprint, generation, recommendation_limit, result
+                    FROM session_recommendations
+                    WHERE user_session = ?
+                ''', (user_session,)).fetchone()
+            except sqlite3.OperationalError:
+                return None
+            generation, _ = self._read_generation(conn)
+        
+        if (row is None or row[0] != interaction_fingerprint(want_to_watch_movie_ids, watched_movie_ids)
+                or row[1] != generation or row[2] < limit):
+            return None
+        result = json.loads(row[3])
+        result['recommendations'] = result['recommendations'][:limit]
+        return result
+
+    @cached(SEARCH_TTL)
     def advanced_search(self, search_term: str, search_type: str = "basic", limit: int = 10) -> List[Dict[str, Any]]:
         """Advanced search with regex support and pattern matching"""
         with self._get_connection() as conn:
             
             if search_type == "regex":
-                # Use Python regex for advanced pattern matching
-                # First get all movies, then filter with regex (for demonstration)
-                query = """
-                    SELECT tconst, primaryTitle, originalTitle, startYear, runtimeMinutes, genres
-                    FROM movies 
-                    WHERE primaryTitle IS NOT NULL
-                    LIMIT 1000
-                """
-                cursor = conn.cursor()
-                cursor.execute(query)
-                columns = [description[0] for description in cursor.description]
-                rows = cursor.fetchall()
-                
-                # Apply regex filtering in Python
                 try:
                     pattern = re.compile(search_term, re.IGNORECASE)
-                    filtered_rows = []
-                    
-                    for row in rows:
-                        title = row[1]  # primaryTitle
-                        original_title = row[2]  # originalTitle
-                        
-                        if (title and pattern.search(title)) or (original_title and pattern.search(original_title)):
-                            filtered_rows.append(row)
-                            if len(filtered_rows) >= limit:
-                                break
-                    
-                    return [dict(zip(columns, row)) for row in filtered_rows]
                 except re.error:
                     # Fall back to basic search if regex is invalid
-                    return self.search_movies(search_term, limit)
+                    return self.search_movies(search_term, limit)['movies']
+                return take(self._iter_regex_matches(conn, pattern), 0, limit)
             
             elif search_type == "year_pattern":
                 # Pattern matching for years (e.g., "199*" for 1990s)
@@ -499,178 +1167,160 @@ class IMDbQueries:
             elif search_type == "genre_pattern":
                 # Advanced genre pattern matching
                 # Support patterns like "Action+Comedy" (both), "Action|Comedy" (either)
-                if '+' in search_term:
-                    # Must have ALL genres
-                    genres = [g.strip() for g in search_term.split('+')]
-                    conditions = " AND ".join([f"genres LIKE '%{genre}%'" for genre in genres])
-                    query = f"""
-                        SELECT tconst, primaryTitle, originalTitle, startYear, runtimeMinutes, genres
-                        FROM movies 
-                        WHERE {conditions} AND primaryTitle IS NOT NULL
-                        ORDER BY startYear DESC
-                        LIMIT ?
-                    """
-                elif '|' in search_term:
-                    # Must have ANY genre
-                    genres = [g.strip() for g in search_term.split('|')]
-                    conditions = " OR ".join([f"genres LIKE '%{genre}%'" for genre in genres])
-                    query = f"""
-                        SELECT tconst, primaryTitle, originalTitle, startYear, runtimeMinutes, genres
-                        FROM movies 
-                        WHERE ({conditions}) AND primaryTitle IS NOT NULL
-                        ORDER BY startYear DESC
-                        LIMIT ?
-                    """
-                else:
-                    # Single genre
-                    query = """
-                        SELECT tconst, primaryTitle, originalTitle, startYear, runtimeMinutes, genres
-                        FROM movies 
-                        WHERE genres LIKE ? AND primaryTitle IS NOT NULL
-                        ORDER BY startYear DESC
-                        LIMIT ?
-                    """
-                    search_term = f"%{search_term}%"
+                genre_bits = self._get_genre_bits(conn)
+                match_all = '|' not in search_term
+                separator = '+' if match_all else '|'
+                genres = [g.strip().lower() for g in search_term.split(separator) if g.strip()]
+                
+                if match_all and any(genre not in genre_bits for genre in genres):
+                    return []
+                mask = sum(genre_bits[genre][1] for genre in set(genres) if genre in genre_bits)
+                if not mask:
+                    return []
+                
+                # Both forms are bit tests on genre_mask:
+                # ALL genres -> every bit set, ANY genre -> some bit set
+                query = f"""
+                    SELECT tconst, primaryTitle, originalTitle, startYear, runtimeMinutes, genres
+                    FROM movies 
+                    WHERE {"genre_mask & ? = ?" if match_all else "genre_mask & ? != 0"}
+                        AND primaryTitle IS NOT NULL
+                    ORDER BY startYear DESC
+                    LIMIT ?
+                """
+                params = (mask, mask, limit) if match_all else (mask, limit)
                 
                 cursor = conn.cursor()
-                if '+' in search_term or '|' in search_term:
-                    cursor.execute(query, (limit,))
-                else:
-                    cursor.execute(query, (search_term, limit))
+                cursor.execute(query, params)
                 columns = [description[0] for description in cursor.description]
                 rows = cursor.fetchall()
                 return [dict(zip(columns, row)) for row in rows]
             
             else:
                 # Default to basic search
-                return self.search_movies(search_term, limit)
+                return self.search_movies(search_term, limit)['movies']
 
     def create_database_views(self):
         """Create database views for better data organization"""
-        with self._get_connection() as conn:
+        with self._write_connection() as conn:
             cursor = conn.cursor()
-            
-            # View 1: Recent high-quality movies
-            cursor.execute('''
-                CREATE VIEW IF NOT EXISTS recent_quality_movies AS
-                SELECT 
-                    tconst,
-                    primaryTitle,
-                    startYear,
-                    runtimeMinutes,
-                    genres,
-                    CASE 
-                        WHEN runtimeMinutes >= 120 THEN 'Long'
-                        WHEN runtimeMinutes >= 90 THEN 'Standard'
-                        ELSE 'Short'
-                    END as length_category
-                FROM movies
-                WHERE startYear >= 2010 
-                    AND runtimeMinutes >= 60
-                    AND isAdult = 0
-                    AND genres IS NOT NULL
-                ORDER BY startYear DESC
-            ''')
-            
-            # View 2: Genre statistics view
-            cursor.execute('''
-                CREATE VIEW IF NOT EXISTS genre_stats_view AS
-                SELECT 
-                    genres,
-                    COUNT(*) as movie_count,
-                    AVG(runtimeMinutes) as avg_runtime,
-                    MIN(startYear) as earliest_year,
-                    MAX(startYear) as latest_year
-                FROM movies
-                WHERE genres IS NOT NULL 
-                    AND runtimeMinutes IS NOT NULL
-                GROUP BY genres
-                HAVING movie_count >= 5
-                ORDER BY movie_count DESC
-            ''')
-            
-            # View 3: Decade summary view
-            cursor.execute('''
-                CREATE VIEW IF NOT EXISTS decade_summary AS
-                SELECT 
-                    (startYear / 10) * 10 as decade,
-                    COUNT(*) as total_movies,
-                    AVG(runtimeMinutes) as avg_runtime,
-                    COUNT(CASE WHEN isAdult = 0 THEN 1 END) as family_friendly,
-                    COUNT(CASE WHEN isAdult = 1 THEN 1 END) as adult_movies
-                FROM movies
-                WHERE startYear IS NOT NULL AND startYear >= 1920
-                GROUP BY decade
-                ORDER BY decade DESC
-            ''')
-            
+            for view_name, query in DATABASE_VIEWS.items():
+                cursor.execute(f"CREATE VIEW IF NOT EXISTS {view_name} AS {query}")
             conn.commit()
             print("Database views created successfully!")
 
-    def get_view_data(self, view_name: str, limit: int = 20) -> List[Dict[str, Any]]:
-        """Get data from a specific database view"""
+    @cached(STATS_TTL)
+    def get_view_columns(self, view_name: str) -> List[str]:
+        """Column names of a reporting view's rows"""
+        check_view_request(view_name)
+        with self._get_connection() as conn:
+            # Read from the schema, without running the view
+            return [row[1] for row in conn.execute(f"PRAGMA table_info({view_name})")]
+    
+    @cached(STATS_TTL)
+    def get_view_data(self, view_name: str, limit: int = 20, offset: int = 0,
+                      order_by: Optional[str] = None, descending: bool = False,
+                      cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Get a page of a database view's rows (see _page) and when they were refreshed
+
+        Rows come from the view's materialized table, in the view's own order
+        or ordered by one of its VIEW_SORT_COLUMNS; ties keep the view's order
+        (reversed when descending).
+        """
+        check_view_request(view_name, order_by)
+        after = decode_cursor(cursor, VIEW_ROW_CURSOR if order_by is None else VIEW_SORT_CURSOR) if cursor else None
+        
         with self._get_connection() as conn:
             cursor = conn.cursor()
+            table = materialized_table(view_name)
+            if self._has_table(conn, table):
+                source = f"(SELECT rowid AS _row, * FROM {table})"
+                cursor.execute("SELECT refreshed_at FROM materialized_views WHERE view_name = ?", (view_name,))
+                row = cursor.fetchone()
+                refreshed_at = row[0] if row else None
+            else:
+                # Databases set up before materialization: number the view's rows
+                source, refreshed_at = f"(SELECT ROW_NUMBER() OVER () AS _row, * FROM {view_name})", None
             
-            # Validate view name for security
-            valid_views = ['recent_quality_movies', 'genre_stats_view', 'decade_summary']
-            if view_name not in valid_views:
-                raise ValueError(f"Invalid view name. Must be one of: {valid_views}")
+            # Rows are numbered from 1, so the first page also starts with a seek
+            direction, operator = ('DESC', '<') if descending else ('', '>')
+            if order_by is None:
+                keyset, order = f"_row {operator} ?", f"_row {direction}"
+                params = after or [2 ** 63 - 1 if descending else 0]
+            elif after:
+                keyset, order = f"({order_by}, _row) {operator} (?, ?)", f"{order_by} {direction}, _row {direction}"
+                params = after
+            else:
+                keyset, order = "1", f"{order_by} {direction}, _row {direction}"
+                params = []
             
-            query = f"SELECT * FROM {view_name} LIMIT ?"
-            cursor.execute(query, (limit,))
+            query = f"SELECT * FROM {source} WHERE {keyset} ORDER BY {order} LIMIT ? OFFSET ?"
+            cursor.execute(query, (*params, limit + 1, offset))
             columns = [description[0] for description in cursor.description]
-            rows = cursor.fetchall()
-            return [dict(zip(columns, row)) for row in rows]
+            rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+            
+            page = self._page(rows, limit, lambda row: [row['_row']] if order_by is None else [row[order_by], row['_row']])
+            for row in page['movies']:
+                del row['_row']
+            return {'rows': page.pop('movies'), **page, 'refreshed_at': refreshed_at}
+
+    def _iter_regex_matches(self, conn, pattern: re.Pattern,
+                            after: Optional[list] = None) -> Iterator[Dict[str, Any]]:
+        """Lazily yield movies whose primary or original title matches a compiled regex
 
-    def regex_title_search(self, pattern: str, limit: int = 10, offset: int = 0) -> List[Dict[str, Any]]:
-        """Search movie titles using regular expressions"""
+        Movies come in year_title_key order, starting after `after`. When
+        the literal substrings the pattern requires narrow the catalog down
+        to at most REGEX_PREFILTER_MAX titles in the movie_titles_fts index,
+        only those titles are read. Otherwise titles are read along
+        idx_movies_year_key for as long as the caller keeps consuming.
+        """
+        cursor = conn.cursor()
+        literals = [literal for literal in required_literals(pattern.pattern, pattern.flags) if len(literal) >= 3]
+        prefilter = None
+        if literals and self._has_table(conn, 'movie_titles_fts'):
+            prefilter = ' AND '.join('"' + literal.replace('"', '""') + '"' for literal in literals)
+            cursor.execute("""
+                SELECT COUNT(*) FROM (
+                    SELECT rowid FROM movie_titles_fts WHERE movie_titles_fts MATCH ? LIMIT ?
+                )
+            """, (prefilter, REGEX_PREFILTER_MAX + 1))
+            if cursor.fetchone()[0] > REGEX_PREFILTER_MAX:
+                prefilter = None
+        
+        if prefilter:
+            movies = self._iter_year_ordered(
+                conn, "movie_titles_fts f JOIN movies m ON m.rowid = f.rowid",
+                "movie_titles_fts MATCH ? AND m.primaryTitle IS NOT NULL", (prefilter,), after
+            )
+        else:
+            movies = self._iter_year_ordered(conn, "movies m", "m.primaryTitle IS NOT NULL", after=after)
+        
+        try:
+            for movie in movies:
+                title = movie['primaryTitle']
+                original_title = movie['originalTitle']
+                if pattern.search(title) or (original_title and pattern.search(original_title)):
+                    yield movie
+        finally:
+            movies.close()
+    
+    @cached(SEARCH_TTL)
+    def regex_title_search(self, pattern: str, limit: int = 10, offset: int = 0,
+                           cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Search movie titles using regular expressions, newest first (see _page)"""
+        after = decode_cursor(cursor, YEAR_TITLE_CURSOR) if cursor else None
+        regex_pattern = compile_title_pattern(pattern)
+        
         with self._get_connection() as conn:
-            # Get movies and apply regex in Python (SQLite doesn't have built-in regex)
-            query = """
-                SELECT tconst, primaryTitle, originalTitle, startYear, runtimeMinutes, genres
-                FROM movies 
-                WHERE primaryTitle IS NOT NULL 
-                    AND (startYear IS NULL OR startYear <= 2025)
-                ORDER BY startYear DESC
-            """
-            
-            cursor = conn.cursor()
-            cursor.execute(query)
-            columns = [description[0] for description in cursor.description]
-            
-            try:
-                regex_pattern = re.compile(pattern, re.IGNORECASE)
-                matching_movies = []
-                skip_count = 0
-                
-                for row in cursor.fetchall():
-                    title = row[1]  # primaryTitle
-                    original_title = row[2]  # originalTitle
-                    
-                    # Test both titles against the regex
-                    if ((title and regex_pattern.search(title)) or 
-                        (original_title and regex_pattern.search(original_title))):
-                        
-                        # Handle offset
-                        if skip_count < offset:
-                            skip_count += 1
-                            continue
-                            
-                        matching_movies.append(dict(zip(columns, row)))
-                        
-                        if len(matching_movies) >= limit:
-                            break
-                
-                return matching_movies
-                
-            except re.error as e:
-                raise ValueError(f"Invalid regular expression: {e}")
+            # SQLite has no built-in regex: candidate rows stream through
+            # Python and reading stops once the page and one extra match are found
+            matches = self._iter_regex_matches(conn, regex_pattern, after)
+            return self._page(take(matches, offset, offset + limit + 1), limit, year_title_key)
 
     # User Movie Lists Management
     def add_to_want_to_watch(self, user_session: str, tconst: str) -> bool:
         """Add a movie to user's want to watch list"""
-        with self._get_connection() as conn:
+        with self._write_connection() as conn:
             cursor = conn.cursor()
             try:
                 cursor.execute(
@@ -685,7 +1335,7 @@ class IMDbQueries:
 
     def remove_from_want_to_watch(self, user_session: str, tconst: str) -> bool:
         """Remove a movie from user's want to watch list"""
-        with self._get_connection() as conn:
+        with self._write_connection() as conn:
             cursor = conn.cursor()
             try:
                 cursor.execute(
@@ -698,26 +1348,38 @@ class IMDbQueries:
                 print(f"Error removing from want to watch: {e}")
                 return False
 
+    def add_many_to_want_to_watch(self, user_session: str, tconsts: List[str]) -> List[Dict[str, str]]:
+        """Add movies to user's want to watch list in one transaction (see _update_list)"""
+        return self._update_list('want_to_watch', user_session, tconsts, add=True)
+
+    def remove_many_from_want_to_watch(self, user_session: str, tconsts: List[str]) -> List[Dict[str, str]]:
+        """Remove movies from user's want to watch list in one transaction (see _update_list)"""
+        return self._update_list('want_to_watch', user_session, tconsts, add=False)
+
     def get_want_to_watch_movies(self, user_session: str) -> List[Dict[str, Any]]:
         """Get user's want to watch movies"""
         with self._get_connection() as conn:
-            query = """
-                SELECT m.tconst, m.primaryTitle, m.originalTitle, m.startYear, 
-                       m.runtimeMinutes, m.genres, w.added_date
-                FROM want_to_watch w
-                JOIN movies m ON w.tconst = m.tconst
-                WHERE w.user_session = ?
-                ORDER BY w.added_date DESC
-            """
-            cursor = conn.cursor()
-            cursor.execute(query, (user_session,))
-            columns = [description[0] for description in cursor.description]
-            rows = cursor.fetchall()
-            return [dict(zip(columns, row)) for row in rows]
+            return self._list_movies(conn, 'want_to_watch', 'added_date', user_session)
+
+    def _list_movies(self, conn, table: str, date_column: str, user_session: str) -> List[Dict[str, Any]]:
+        """Movies in one of the user's lists, most recently added first"""
+        query = f"""
+            SELECT m.tconst, m.primaryTitle, m.originalTitle, m.startYear, 
+                   m.runtimeMinutes, m.genres, w.{date_column}
+            FROM {table} w
+            JOIN movies m ON w.tconst = m.tconst
+            WHERE w.user_session = ?
+            ORDER BY w.{date_column} DESC
+        """
+        cursor = conn.cursor()
+        cursor.execute(query, (user_session,))
+        columns = [description[0] for description in cursor.description]
+        rows = cursor.fetchall()
+        return [dict(zip(columns, row)) for row in rows]
 
     def add_to_watched(self, user_session: str, tconst: str) -> bool:
         """Add a movie to user's watched list"""
-        with self._get_connection() as conn:
+        with self._write_connection() as conn:
             cursor = conn.cursor()
             try:
                 cursor.execute(
@@ -732,7 +1394,7 @@ class IMDbQueries:
 
     def remove_from_watched(self, user_session: str, tconst: str) -> bool:
         """Remove a movie from user's watched list"""
-        with self._get_connection() as conn:
+        with self._write_connection() as conn:
             cursor = conn.cursor()
             try:
                 cursor.execute(
@@ -745,26 +1407,66 @@ class IMDbQueries:
                 print(f"Error removing from watched: {e}")
                 return False
 
+    def add_many_to_watched(self, user_session: str, tconsts: List[str]) -> List[Dict[str, str]]:
+        """Add movies to user's watched list in one transaction (see _update_list)"""
+        return self._update_list('watched_movies', user_session, tconsts, add=True)
+
+    def remove_many_from_watched(self, user_session: str, tconsts: List[str]) -> List[Dict[str, str]]:
+        """Remove movies from user's watched list in one transaction (see _update_list)"""
+        return self._update_list('watched_movies', user_session, tconsts, add=False)
+
+    def _update_list(self, table: str, user_session: str, tconsts: List[str], add: bool) -> List[Dict[str, str]]:
+        """Add or remove up to MAX_LIST_BATCH movies with one executemany and one commit
+
+        Returns a {'tconst', 'status'} per item, in order. Adding reports
+        'added', 'already_present' or 'missing' (no such movie, nothing
+        stored); removing reports 'removed' or 'missing' (not in the list).
+        A movie repeated in the batch is reported from its second mention on
+        as it stands after the first.
+        """
+        if len(tconsts) > MAX_LIST_BATCH:
+            raise ValueError(f"At most {MAX_LIST_BATCH} movies per batch")
+        unique = list(dict.fromkeys(tconsts))
+        if not unique:
+            return []
+        placeholders = ', '.join('?' * len(unique))
+        with self._write_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT tconst FROM {table} WHERE user_session = ? AND tconst IN ({placeholders})",
+                           (user_session, *unique))
+            listed = {row[0] for row in cursor.fetchall()}
+            if add:
+                cursor.execute(f"SELECT tconst FROM movies WHERE tconst IN ({placeholders})", unique)
+                known = {row[0] for row in cursor.fetchall()}
+                changed = [tconst for tconst in unique if tconst in known and tconst not in listed]
+                cursor.executemany(f"INSERT OR IGNORE INTO {table} (user_session, tconst) VALUES (?, ?)",
+                                   [(user_session, tconst) for tconst in changed])
+            else:
+                changed = [tconst for tconst in unique if tconst in listed]
+                cursor.executemany(f"DELETE FROM {table} WHERE user_session = ? AND tconst = ?",
+                                   [(user_session, tconst) for tconst in changed])
+
+        results = []
+        changed, pending = set(changed), set(changed)
+        for tconst in tconsts:
+            if tconst in pending:
+                status = 'added' if add else 'removed'
+                pending.discard(tconst)
+            elif add:
+                status = 'already_present' if tconst in listed or tconst in changed else 'missing'
+            else:
+                status = 'missing'
+            results.append({'tconst': tconst, 'status': status})
+        return results
+
     def get_watched_movies(self, user_session: str) -> List[Dict[str, Any]]:
         """Get user's watched movies"""
         with self._get_connection() as conn:
-            query = """
-                SELECT m.tconst, m.primaryTitle, m.originalTitle, m.startYear, 
-                       m.runtimeMinutes, m.genres, w.watched_date
-                FROM watched_movies w
-                JOIN movies m ON w.tconst = m.tconst
-                WHERE w.user_session = ?
-                ORDER BY w.watched_date DESC
-            """
-            cursor = conn.cursor()
-            cursor.execute(query, (user_session,))
-            columns = [description[0] for description in cursor.description]
-            rows = cursor.fetchall()
-            return [dict(zip(columns, row)) for row in rows]
+            return self._list_movies(conn, 'watched_movies', 'watched_date', user_session)
 
     def clear_want_to_watch(self, user_session: str) -> bool:
         """Clear all movies from user's want to watch list"""
-        with self._get_connection() as conn:
+        with self._write_connection() as conn:
             cursor = conn.cursor()
             try:
                 cursor.execute("DELETE FROM want_to_watch WHERE user_session = ?", (user_session,))
@@ -776,7 +1478,7 @@ class IMDbQueries:
 
     def clear_watched(self, user_session: str) -> bool:
         """Clear all movies from user's watched list"""
-        with self._get_connection() as conn:
+        with self._write_connection() as conn:
             cursor = conn.cursor()
             try:
                 cursor.execute("DELETE FROM watched_movies WHERE user_session = ?", (user_session,))
@@ -789,18 +1491,35 @@ class IMDbQueries:
     def get_user_movie_lists_summary(self, user_session: str) -> Dict[str, Any]:
         """Get summary of user's movie lists"""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Count want to watch movies
-            cursor.execute("SELECT COUNT(*) FROM want_to_watch WHERE user_session = ?", (user_session,))
-            want_to_watch_count = cursor.fetchone()[0]
-            
-            # Count watched movies
-            cursor.execute("SELECT COUNT(*) FROM watched_movies WHERE user_session = ?", (user_session,))
-            watched_count = cursor.fetchone()[0]
-            
+            return self._lists_summary(conn, user_session)
+
+    def _lists_summary(self, conn, user_session: str) -> Dict[str, Any]:
+        """Counts of the user's lists read on `conn`"""
+        cursor = conn.cursor()
+        
+        # Count want to watch movies
+        cursor.execute("SELECT COUNT(*) FROM want_to_watch WHERE user_session = ?", (user_session,))
+        want_to_watch_count = cursor.fetchone()[0]
+        
+        # Count watched movies
+        cursor.execute("SELECT COUNT(*) FROM watched_movies WHERE user_session = ?", (user_session,))
+        watched_count = cursor.fetchone()[0]
+        
+        return {
+            'want_to_watch_count': want_to_watch_count,
+            'watched_count': watched_count,
+            'total_interactions': want_to_watch_count + watched_count
+        }
+
+    def get_dashboard_bootstrap(self, user_session: str) -> Dict[str, Any]:
+        """Everything the dashboard loads on start: the user's lists, their
+        summary and the database statistics, read on one connection in one
+        read transaction (so the lists and their counts always agree)"""
+        with self._get_connection() as conn:
+            conn.execute("BEGIN")
             return {
-                'want_to_watch_count': want_to_watch_count,
-                'watched_count': watched_count,
-                'total_interactions': want_to_watch_count + watched_count
-            } 
\ No newline at end of file
+                'want_to_watch': self._list_movies(conn, 'want_to_watch', 'added_date', user_session),
+                'watched': self._list_movies(conn, 'watched_movies', 'watched_date', user_session),
+                'summary': self._lists_summary(conn, user_session),
+                'stats': self._database_stats(conn)
+            }
@@ -0,0 +1,198 @@
+"""
+In-memory columnar copy of the movies table
+
+MovieCatalog holds the columns the structured listing queries filter and
+sort on as NumPy arrays, the text columns as packed UTF-8 string tables,
+and two presorted permutations of the rows: newest first (startYear DESC,
+primaryTitle, tconst) and longest first (runtimeMinutes DESC). A listing
+is then a binary search for the start of a contiguous block of one
+permutation plus a slice of it. Both permutations are read from SQLite
+itself, so results come out in exactly the order the SQL queries return.
+"""
+
+import bisect
+from array import array
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# Stand-ins for NULL in the integer columns; both sort after every real value
+NULL_YEAR = np.iinfo(np.int16).min
+NULL_RUNTIME = -1
+NULL_ADULT = -1
+
+MAX_YEAR = 2025                 # Newest release year listed, as in the SQL queries
+LOAD_BATCH = 50000              # Rows fetched per round trip while loading
+
+class StringTable:
+    """Packed UTF-8 strings addressed by row position; None for NULL"""
+
+    def __init__(self):
+        self._data = bytearray()
+        self._offsets = array('q', [0])
+        self._nulls = bytearray()
+
+    def append(self, value: Optional[str]):
+        if value is not None:
+            self._data += value.encode()
+        self._offsets.append(len(self._data))
+        self._nulls.append(value is None)
+
+    def __getitem__(self, position: int) -> Optional[str]:
+        if self._nulls[position]:
+            return None
+        return self._data[self._offsets[position]:self._offsets[position + 1]].decode()
+
+    def __len__(self):
+        return len(self._nulls)
+
+    def null_mask(self) -> np.ndarray:
+        """Boolean array, True where the string is NULL"""
+        return np.frombuffer(self._nulls, dtype=np.bool_)
+
+class MovieCatalog:
+    """Columnar, presorted snapshot of the movies table"""
+
+    def __init__(self, rowids, start_year, runtime, is_adult, genre_mask,
+                 tconst, primary_title, original_title, genres, year_order, runtime_order):
+        self.rowids = rowids
+        self.start_year = start_year
+        self.runtime = runtime
+        self.is_adult = is_adult
+        self.genre_mask = genre_mask
+        self.tconst = tconst
+        self.primary_title = primary_title
+        self.original_title = original_title
+        self.genres = genres
+        # Row positions of titled movies in listing order, and the negated
+        # sort column along each (ascending, for np.searchsorted)
+        self.year_order = year_order
+        self.year_order_keys = -start_year[year_order].astype(np.int32)
+        self.runtime_order = runtime_order
+        self.runtime_order_keys = -runtime[runtime_order]
+
+    @classmethod
+    def load(cls, conn) -> 'MovieCatalog':
+        """Read the movies table through an open SQLite connection"""
+        rowids = array('q')
+        start_year = array('h')
+        runtime = array('i')
+        is_adult = array('b')
+        genre_mask = array('q')
+        tconst, primary_title, original_title, genres = StringTable(), StringTable(), StringTable(), StringTable()
+
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT rowid, tconst, primaryTitle, originalTitle, startYear, runtimeMinutes, genres,
+                isAdult, genre_mask
+            FROM movies
+            ORDER BY rowid
+        """)
+        while True:
+            rows = cursor.fetchmany(LOAD_BATCH)
+            if not rows:
+                break
+            for row in rows:
+                rowids.append(row[0])
+                tconst.append(row[1])
+                primary_title.append(row[2])
+                original_title.append(row[3])
+                start_year.append(NULL_YEAR if row[4] is None else row[4])
+                runtime.append(NULL_RUNTIME if row[5] is None else row[5])
+                genres.append(row[6])
+                is_adult.append(NULL_ADULT if row[7] is None else row[7])
+                genre_mask.append(row[8] or 0)
+
+        rowids = np.frombuffer(rowids, dtype=np.int64)
+
+        def positions(query):
+            cursor.execute(query)
+            order = np.fromiter((row[0] for row in cursor), dtype=np.int64)
+            return np.searchsorted(rowids, order).astype(np.int32)
+
+        # Same orders SQLite produces walking idx_movies_year_key and
+        # (backwards) idx_movies_runtimeMinutes
+        year_order = positions("""
+            SELECT rowid FROM movies
+            WHERE primaryTitle IS NOT NULL
+            ORDER BY startYear DESC, primaryTitle, tconst
+        """)
+        runtime_order = positions("""
+            SELECT rowid FROM movies
+            WHERE runtimeMinutes IS NOT NULL AND primaryTitle IS NOT NULL
+            ORDER BY runtimeMinutes DESC, rowid DESC
+        """)
+
+        return cls(
+            rowids,
+            np.frombuffer(start_year, dtype=np.int16),
+            np.frombuffer(runtime, dtype=np.int32),
+            np.frombuffer(is_adult, dtype=np.int8),
+            np.frombuffer(genre_mask, dtype=np.int64),
+            tconst, primary_title, original_title, genres,
+            year_order, runtime_order
+        )
+
+    def __len__(self):
+        return len(self.rowids)
+
+    def _column(self, column: str, positions: np.ndarray) -> list:
+        """Values of one movies column at the given row positions"""
+        if column == 'startYear':
+            return [None if year == NULL_YEAR else year for year in self.start_year[positions].tolist()]
+        if column == 'runtimeMinutes':
+            return [None if minutes == NULL_RUNTIME else minutes for minutes in self.runtime[positions].tolist()]
+        strings = {'tconst': self.tconst, 'primaryTitle': self.primary_title,
+                   'originalTitle': self.original_title, 'genres': self.genres}[column]
+        return [strings[p] for p in positions.tolist()]
+
+    def rows(self, positions: np.ndarray, columns: List[str]) -> List[Dict[str, Any]]:
+        """Result dicts with the given movies columns for row positions"""
+        values = zip(*(self._column(column, positions) for column in columns))
+        return [dict(zip(columns, row)) for row in values]
+
+    @staticmethod
+    def _search(keys: np.ndarray, value: int, side: str) -> int:
+        """np.searchsorted for one value, cast to the keys' dtype so the keys are not copied"""
+        info = np.iinfo(keys.dtype)
+        return int(np.searchsorted(keys, keys.dtype.type(min(max(value, info.min), info.max)), side))
+
+    def _year_block(self, newest: int, oldest: int) -> tuple:
+        """Bounds in year_order of the movies released from oldest to newest"""
+        return (self._search(self.year_order_keys, -newest, 'left'),
+                self._search(self.year_order_keys, -oldest, 'right'))
+
+    def movies_by_year(self, year: int, limit: int) -> np.ndarray:
+        """Positions of a year's movies by title"""
+        start, end = self._year_block(year, year)
+        return self.year_order[start:min(end, start + limit)]
+
+    def movies_by_year_range(self, start_year: int, end_year: int, limit: int) -> np.ndarray:
+        """Positions of movies released between two years, newest first"""
+        start, end = self._year_block(end_year, start_year)
+        return self.year_order[start:min(end, start + limit)]
+
+    def movies_by_runtime(self, min_runtime: int, max_runtime: int, limit: int) -> np.ndarray:
+        """Positions of movies within a runtime range, longest first"""
+        start = self._search(self.runtime_order_keys, -max_runtime, 'left')
+        end = self._search(self.runtime_order_keys, -min_runtime, 'right')
+        return self.runtime_order[start:min(end, start + limit)]
+
+    def longest_movies(self, limit: int) -> np.ndarray:
+        """Positions of the longest movies"""
+        return self.runtime_order[:limit]
+
+    def recent_movies(self, offset: int, count: int, after: Optional[list] = None) -> np.ndarray:
+        """Positions of dated movies newest first, starting after a year_title_key"""
+        start = self._search(self.year_order_keys, -MAX_YEAR, 'left')
+        end = self._search(self.year_order_keys, -int(NULL_YEAR), 'left')
+        if after is not None:
+            year, title, tconst = after
+            if year is None:
+                return self.year_order[:0]
+            # Skip to the year, then past the key among that year's titles
+            year_start, year_end = self._year_block(year, year)
+            key = lambda i: (self.primary_title[self.year_order[i]], self.tconst[self.year_order[i]])
+            start = max(start, bisect.bisect_right(range(year_start, year_end), (title, tconst), key=key) + year_start)
+        start += offset
+        return self.year_order[start:min(end, start + count)]
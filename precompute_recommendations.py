@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Precompute recommendations for every active session
+
+Finds the sessions with at least 5 movies across want_to_watch and
+watched_movies, computes their recommendations in a process pool and
+stores them in session_recommendations. POST /api/recommendations serves
+a stored result while the session's lists and the catalog generation are
+unchanged, and computes on demand otherwise.
+
+The parent loads the in-memory catalog once; forked workers share it
+copy-on-write (on platforms that spawn workers, each loads its own).
+
+Usage: python precompute_recommendations.py [--db imdb.db] [--workers N] [--limit 15]
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from database_setup import IMDbDatabase
+from imdb_queries import IMDbQueries, interaction_fingerprint
+
+MIN_INTERACTIONS = 5            # As required by get_recommendations
+CHUNK_SIZE = 64                 # Sessions per task sent to a worker
+
+# Loaded by the parent before the pool starts, inherited by forked workers
+_catalog = None
+_recommender = None
+# IMDbQueries of the current worker process
+_queries = None
+
+def _init_worker(db_path):
+    """Open the worker's own connections, reusing the parent's catalog when forked"""
+    global _queries
+    _queries = IMDbQueries(db_path)
+    if _catalog is not None:
+        _queries.catalog, _queries.recommender = _catalog, _recommender
+    else:
+        _queries.load_catalog()
+
+def _recommend_chunk(chunk, limit):
+    """Recommendations of (session, want_to_watch_ids, watched_ids) tuples as table rows"""
+    rows = []
+    for user_session, want_to_watch_ids, watched_ids in chunk:
+        result = _queries.get_recommendations(want_to_watch_ids, watched_ids, limit)
+        rows.append((user_session, interaction_fingerprint(want_to_watch_ids, watched_ids), json.dumps(result)))
+    return rows
+
+def load_active_sessions(cursor):
+    """(session, want_to_watch_ids, watched_ids) of sessions with enough interactions
+
+    Lists are read the way POST /api/recommendations reads them: movies
+    still in the catalog, most recently added first.
+    """
+    lists = defaultdict(lambda: ([], []))
+    for index, (table, date_column) in enumerate([('want_to_watch', 'added_date'),
+                                                  ('watched_movies', 'watched_date')]):
+        cursor.execute(f"""
+            SELECT l.user_session, l.tconst
+            FROM {table} l
+            JOIN movies m ON l.tconst = m.tconst
+            ORDER BY l.user_session, l.{date_column} DESC
+        """)
+        for user_session, tconst in cursor:
+            lists[user_session][index].append(tconst)
+    return [(user_session, want_to_watch_ids, watched_ids)
+            for user_session, (want_to_watch_ids, watched_ids) in lists.items()
+            if len(want_to_watch_ids) + len(watched_ids) >= MIN_INTERACTIONS]
+
+def precompute(db_path, workers=1, limit=15):
+    """Recompute session_recommendations; returns (sessions, seconds spent computing them)"""
+    global _catalog, _recommender
+    db = IMDbDatabase(db_path)
+    db.create_tables()
+    cursor = db.cursor
+    cursor.execute("SELECT generation FROM catalog_generation WHERE id = 1")
+    row = cursor.fetchone()
+    generation = row[0] if row else 0
+
+    sessions = load_active_sessions(cursor)
+    print(f"Active sessions (>= {MIN_INTERACTIONS} interactions): {len(sessions):,}")
+
+    queries = IMDbQueries(db_path, use_catalog=True)
+    _catalog, _recommender = queries.catalog, queries.recommender
+    queries.close()
+
+    start_time = time.perf_counter()
+    chunks = [sessions[i:i + CHUNK_SIZE] for i in range(0, len(sessions), CHUNK_SIZE)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(db_path,)) as pool:
+        for rows in pool.map(_recommend_chunk, chunks, [limit] * len(chunks)):
+            cursor.executemany("""
+                INSERT OR REPLACE INTO session_recommendations
+                    (user_session, fingerprint, generation, recommendation_limit, result)
+                VALUES (?, ?, ?, ?, ?)
+            """, [(user_session, fingerprint, generation, limit, result)
+                  for user_session, fingerprint, result in rows])
+            db.connection.commit()
+
+    # Sessions no longer active keep no stale rows
+    cursor.execute("CREATE TEMP TABLE active_sessions (user_session TEXT PRIMARY KEY)")
+    cursor.executemany("INSERT INTO active_sessions VALUES (?)", [(session[0],) for session in sessions])
+    cursor.execute("""
+        DELETE FROM session_recommendations
+        WHERE user_session NOT IN (SELECT user_session FROM temp.active_sessions)
+    """)
+    db.connection.commit()
+    elapsed = time.perf_counter() - start_time
+    db.close()
+    return len(sessions), elapsed
+
+def main():
+    """Precompute recommendations for all active sessions"""
+    parser = argparse.ArgumentParser(description="Precompute recommendations for active sessions")
+    parser.add_argument('--db', default='imdb.db', help="SQLite database path")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Number of worker processes (default: number of CPUs)")
+    parser.add_argument('--limit', type=int, default=15, help="Recommendations stored per session")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"Database '{args.db}' not found! Please run database_setup.py first.")
+        return
+
+    sessions, elapsed = precompute(args.db, args.workers, args.limit)
+    rate = sessions / elapsed if elapsed else 0
+    print(f"Precomputed {sessions:,} sessions in {elapsed:.1f}s with {args.workers} worker(s) "
+          f"({rate:,.0f} sessions/sec)")
+
+if __name__ == "__main__":
+    main()
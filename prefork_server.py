@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Preforking production server for the IMDb Movies app
+
+The parent process imports the app once, which loads the in-memory movie
+catalog and recommender, and warms the result cache with the statistics
+the dashboard shows. It then binds the listening socket and forks the
+workers. Every worker serves requests from the shared socket on a
+threaded WSGI server and reads the parent's catalog pages copy-on-write,
+so N workers cost far less memory than N separately started apps.
+SQLite connections cannot cross a fork, so the parent closes its
+connections first and each worker opens its own pool on first use.
+
+Signals to the parent:
+    SIGHUP            graceful restart: reload the catalog, fork new
+                      workers, let the old ones finish in-flight requests
+    SIGTERM, SIGINT   graceful shutdown
+
+A new catalog generation (database_setup.py --refresh) triggers the same
+restart, so the reloaded catalog is loaded once and shared again instead
+of once per worker. Workers that die are replaced.
+
+Usage: python prefork_server.py [--host 0.0.0.0] [--port 8081] [--workers N]
+"""
+
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+import traceback
+
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+from app import app, db_path, queries
+
+POLL_INTERVAL = 1.0             # Seconds between checks for exited workers and signals
+GRACEFUL_TIMEOUT = 30           # Seconds workers get to finish in-flight requests
+KEEPALIVE_TIMEOUT = 5           # Seconds an idle keep-alive connection holds a worker thread
+BACKLOG = 1024                  # Pending connections queued on the listening socket
+
+class WorkerRequestHandler(WSGIRequestHandler):
+    # Idle keep-alive connections are dropped, so a stopping worker is not held up by them
+    timeout = KEEPALIVE_TIMEOUT
+
+def warm_cache():
+    """Fill the result cache with the dashboard statistics before forking"""
+    queries.get_database_stats()
+    queries.get_genre_stats()
+    queries.get_movies_stats_by_year()
+    queries.get_runtime_stats()
+
+def run_worker(listener: socket.socket):
+    """Serve requests from the inherited listening socket until SIGTERM"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)
+    host, port = listener.getsockname()[:2]
+    server = make_server(host, port, app, threaded=True,
+                         request_handler=WorkerRequestHandler, fd=listener.fileno())
+    # Wait for in-flight requests when stopping
+    server.daemon_threads = False
+    # shutdown() blocks until serve_forever returns, so it cannot run in the handler itself
+    signal.signal(signal.SIGTERM, lambda signum, frame: threading.Thread(target=server.shutdown).start())
+    server.serve_forever()
+    queries.close()
+
+class PreforkServer:
+    """Parent process: forks, supervises and restarts the workers"""
+
+    def __init__(self, listener: socket.socket, worker_count: int):
+        self.listener = listener
+        self.worker_count = worker_count
+        self.workers = set()
+        # Workers of a previous generation finishing their requests
+        self.retiring = set()
+        self.stopping = False
+        self.restart_requested = False
+        # A new generation is loaded here once, not by every worker
+        queries.reload_catalog = False
+        self.generation = queries.check_generation()
+
+    def spawn(self, count: int):
+        """Fork `count` workers sharing the parent's current state"""
+        # Connections are per process; nothing may be buffered twice
+        queries.close()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        # Keep the garbage collector from writing to (and so copying) the shared pages
+        gc.collect()
+        gc.freeze()
+        for _ in range(count):
+            pid = os.fork()
+            if pid == 0:
+                code = 0
+                try:
+                    run_worker(self.listener)
+                except Exception:
+                    traceback.print_exc()
+                    code = 1
+                finally:
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                    os._exit(code)
+            self.workers.add(pid)
+        gc.unfreeze()
+
+    def restart(self, reason: str):
+        """Reload the shared state and replace every worker without dropping connections"""
+        print(f"Graceful restart ({reason})")
+        if queries.use_catalog:
+            queries.load_catalog()
+        if queries.cache is not None:
+            queries.cache.clear()
+        warm_cache()
+        self.generation = queries.check_generation()
+        previous, self.workers = self.workers, set()
+        self.spawn(self.worker_count)
+        self._signal(previous, signal.SIGTERM)
+        self.retiring |= previous
+
+    def _signal(self, pids, signum):
+        for pid in pids:
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
+
+    def _reap(self):
+        """Collect exited workers; current workers that exited are replaced"""
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            if pid in self.workers:
+                self.workers.discard(pid)
+                if not self.stopping:
+                    print(f"Worker {pid} exited unexpectedly (status {status}), replacing it")
+            self.retiring.discard(pid)
+
+    def _request_stop(self, signum, frame):
+        self.stopping = True
+
+    def _request_restart(self, signum, frame):
+        self.restart_requested = True
+
+    def run(self):
+        """Supervise the workers until SIGTERM or SIGINT"""
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, self._request_stop)
+        signal.signal(signal.SIGHUP, self._request_restart)
+        warm_cache()
+        self.spawn(self.worker_count)
+        print(f"Started {self.worker_count} workers (parent pid {os.getpid()})")
+
+        while not self.stopping:
+            time.sleep(POLL_INTERVAL)
+            self._reap()
+            if self.stopping:
+                break
+            if self.restart_requested:
+                self.restart_requested = False
+                self.restart("SIGHUP")
+            elif queries.check_generation() != self.generation:
+                self.restart("new catalog generation")
+            if len(self.workers) < self.worker_count:
+                self.spawn(self.worker_count - len(self.workers))
+
+        self.stop()
+
+    def stop(self):
+        """Let every worker finish its requests, killing those that take too long"""
+        print("Shutting down workers...")
+        pids = self.workers | self.retiring
+        self._signal(pids, signal.SIGTERM)
+        deadline = time.monotonic() + GRACEFUL_TIMEOUT
+        while (self.workers or self.retiring) and time.monotonic() < deadline:
+            time.sleep(0.1)
+            self._reap()
+        self._signal(self.workers | self.retiring, signal.SIGKILL)
+        self._reap()
+        queries.close()
+
+def main():
+    """Bind the socket and run the preforking server"""
+    parser = argparse.ArgumentParser(description="Serve the IMDb Movies app from preforked workers")
+    parser.add_argument('--host', default='0.0.0.0', help="Interface to listen on")
+    parser.add_argument('--port', type=int, default=8081, help="Port to listen on")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Number of worker processes (default: number of CPUs)")
+    args = parser.parse_args()
+
+    if not os.path.exists(db_path):
+        print("Database not found! Please run 'python database_setup.py' first.")
+        return 1
+
+    listener = socket.create_server((args.host, args.port), backlog=BACKLOG)
+    # Workers all wait on this socket; those losing the race for a connection
+    # get EAGAIN instead of blocking in accept() where shutdown cannot reach them
+    listener.setblocking(False)
+    print(f"Starting IMDb Movies server on port {args.port}...")
+    print(f"Open http://localhost:{args.port} in your browser to explore the API")
+    PreforkServer(listener, args.workers).run()
+    listener.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+Bounded result cache for IMDbQueries
+
+QueryCache is an LRU map limited both by entry count and by the
+approximate size of the cached results (their JSON length), with a TTL
+per entry. The `cached` decorator puts an IMDbQueries method behind it,
+keyed by the catalog generation, the method name and its arguments bound
+to the method signature (so positional, keyword and default arguments
+share entries). database_setup.py bumps the generation whenever the
+catalog is rebuilt or refreshed, which retires every older entry.
+"""
+
+import functools
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Tuple
+
+class QueryCache:
+    """Thread-safe LRU cache with entry-count and byte-size limits and TTLs"""
+
+    def __init__(self, max_entries: int = 2048, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()   # key -> (value, size, expires_at)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (True, value) for a live entry, else (False, None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[0]
+
+    def put(self, key: Hashable, value: Any, ttl: float):
+        """Store a result for ttl seconds, evicting least recently used entries to fit"""
+        size = len(json.dumps(value, default=str))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, time.monotonic() + ttl)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        """Counters and current size, for sizing the cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+            }
+
+    def _remove(self, key):
+        value, size, expires_at = self._entries.pop(key)
+        self._bytes -= size
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable form of an argument value"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+def cached(ttl: float) -> Callable:
+    """Serve an IMDbQueries method from its QueryCache, keeping results for ttl seconds"""
+    def decorate(method):
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            generation = self.check_generation()
+            if self.cache is None:
+                return method(self, *args, **kwargs)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (generation, method.__name__) + tuple(_freeze(value) for value in bound.arguments.values())[1:]
+            hit, value = self.cache.get(key)
+            if hit:
+                return value
+            value = method(self, *args, **kwargs)
+            self.cache.put(key, value, ttl)
+            return value
+        return wrapper
+    return decorate
@@ -0,0 +1,102 @@
+"""
+Vectorized recommendation scoring over the in-memory MovieCatalog
+
+Recommender keeps the features the recommendation score uses (genre
+bits, release year, runtime and the fixed recency/runtime bonuses) as
+NumPy arrays for the movies that can be recommended at all: titled,
+not adult, with genres, released 1970-2025. A request is then a handful
+of array operations over the movies sharing a top genre, and the top-k
+come from np.argpartition instead of sorting every candidate. Movies
+similar to the session's (from similar_movies) arrive as score boosts.
+
+The score and order are the ones IMDbQueries.get_recommendations computes
+in SQL, operation for operation, so both paths return the same movies.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from movie_catalog import MAX_YEAR, NULL_RUNTIME, MovieCatalog
+
+MIN_YEAR = 1970                 # Oldest release year recommended
+GENRE_POINTS = 3                # Per top genre the movie has
+
+class Recommender:
+    """Precomputed recommendation features for one MovieCatalog snapshot"""
+
+    def __init__(self, catalog: MovieCatalog):
+        self.catalog = catalog
+        eligible = (~catalog.primary_title.null_mask() & ~catalog.genres.null_mask() & (catalog.is_adult == 0)
+                    & (catalog.start_year >= MIN_YEAR) & (catalog.start_year <= MAX_YEAR))
+
+        # Catalog positions of the candidates, in rowid order
+        self.positions = np.flatnonzero(eligible)
+        self.rowids = catalog.rowids[self.positions]
+        self.genre_mask = catalog.genre_mask[self.positions]
+        self.year = catalog.start_year[self.positions].astype(np.int64)
+        runtime = catalog.runtime[self.positions].astype(np.int64)
+        self.has_runtime = runtime != NULL_RUNTIME
+        self.runtime = runtime.astype(np.float64)
+        self.recent_bonus = np.where(self.year >= 2010, 2.0, 0.0)
+        self.runtime_bonus = np.where((runtime >= 80) & (runtime <= 180), 1.0, 0.0)
+
+    def __len__(self):
+        return len(self.positions)
+
+    def _scores(self, candidates: np.ndarray, genre_bits: List[int], avg_year,
+                avg_runtime: Optional[float]) -> np.ndarray:
+        """Recommendation scores of candidate indexes, added up in the SQL order"""
+        mask = self.genre_mask[candidates]
+        genre_score = np.zeros(len(candidates), dtype=np.int64)
+        for bit in genre_bits:
+            genre_score += np.where(mask & bit != 0, GENRE_POINTS, 0)
+
+        # Year proximity; SQLite divides integers when there was no year to average
+        year_gap = np.abs(self.year[candidates] - avg_year)
+        year_gap = year_gap // 10 if isinstance(avg_year, int) else year_gap / 10
+        scores = genre_score + np.maximum(0, 5 - year_gap)
+
+        if avg_runtime:
+            runtime_score = np.maximum(0, 3 - np.abs(self.runtime[candidates] - avg_runtime) / 30)
+            scores = scores + np.where(self.has_runtime[candidates], runtime_score, 0)
+        scores = scores + self.recent_bonus[candidates]
+        return scores + self.runtime_bonus[candidates]
+
+    def recommend(self, genre_bits: List[int], avg_year, avg_runtime: Optional[float],
+                  exclude_rowids: List[int], limit: int, boosts: Optional[Dict[int, float]] = None) -> np.ndarray:
+        """Catalog positions of the top movies by score, then newest, then rowid
+
+        Movies sharing a top genre are candidates, and so are the movies in
+        `boosts` (rowid -> points added to the score).
+        """
+        any_genre = sum(genre_bits)
+        matches = self.genre_mask & any_genre != 0
+        boosted = self.positions[:0]
+        if boosts and len(self):
+            boost_rowids = np.fromiter(boosts, dtype=np.int64, count=len(boosts))
+            boost_values = np.fromiter(boosts.values(), dtype=np.float64, count=len(boosts))
+            # Boosted movies that are eligible at all
+            found = np.minimum(np.searchsorted(self.rowids, boost_rowids), len(self.rowids) - 1)
+            eligible = self.rowids[found] == boost_rowids
+            boosted, boost_values = found[eligible], boost_values[eligible]
+            matches[boosted] = True
+        candidates = np.flatnonzero(matches)
+        if exclude_rowids:
+            excluded = np.isin(self.rowids[candidates], exclude_rowids)
+            candidates = candidates[~excluded]
+        if limit <= 0 or not len(candidates):
+            return self.positions[:0]
+
+        scores = self._scores(candidates, genre_bits, avg_year, avg_runtime)
+        if len(boosted):
+            at = np.searchsorted(candidates, boosted)
+            kept = (at < len(candidates)) & (candidates[np.minimum(at, len(candidates) - 1)] == boosted)
+            scores[at[kept]] += boost_values[kept]
+        if len(candidates) > limit:
+            # Keep every candidate tied with the k-th best so ties break exactly
+            threshold = scores[np.argpartition(-scores, limit - 1)[limit - 1]]
+            top = np.flatnonzero(scores >= threshold)
+            candidates, scores = candidates[top], scores[top]
+        order = np.lexsort((candidates, -self.year[candidates], -scores))[:limit]
+        return self.positions[candidates[order]]
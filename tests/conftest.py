@@ -0,0 +1,50 @@
+"""Shared fixtures: a small movie database built by database_setup.py"""
+
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import database_setup
+
+GENRES = ['Drama', 'Comedy', 'Action', 'Crime', 'Romance', 'Thriller']
+TITLES = ['The Godfather', 'Godfather Part II', 'The Good Father', 'Casablanca', 'Vertigo',
+          'Heat', 'Alien', 'Aliens', 'The Alien Shore', 'Rear Window']
+
+def write_title_basics(path: Path, count: int = 60):
+    """A title.basics TSV with `count` movies and a few non-movie titles"""
+    lines = ['tconst\ttitleType\tprimaryTitle\toriginalTitle\tisAdult\tstartYear\tendYear\truntimeMinutes\tgenres']
+    for i in range(count):
+        title = TITLES[i] if i < len(TITLES) else f"Movie Number {i}"
+        year = 1970 + i % 50 if i % 13 else '\\N'
+        genres = ','.join(GENRES[j % len(GENRES)] for j in (i, i + 1))
+        lines.append(f"tt{i:07d}\tmovie\t{title}\t{title}\t0\t{year}\t\\N\t{80 + i % 60}\t{genres}")
+    lines.append("tt9000000\ttvEpisode\tThe Godfather Episode\tThe Godfather Episode\t0\t2001\t\\N\t30\tDrama")
+    path.write_text('\n'.join(lines) + '\n')
+
+@pytest.fixture(scope='session')
+def built_db(tmp_path_factory):
+    directory = tmp_path_factory.mktemp('imdb')
+    write_title_basics(directory / 'title.basics.tsv')
+    db_path = directory / 'imdb.db'
+    database_setup.main(['--db', str(db_path), '--input', str(directory / 'title.basics.tsv'), '--workers', '1'])
+    return db_path
+
+@pytest.fixture
+def db_path(built_db, tmp_path):
+    """A fresh copy of the test database, so tests may write to it"""
+    path = tmp_path / 'imdb.db'
+    shutil.copy(built_db, path)
+    return str(path)
+
+@pytest.fixture(scope='session')
+def client(built_db):
+    """Flask test client serving the test database, result cache off"""
+    os.environ['IMDB_DB'] = str(built_db)
+    os.environ['IMDB_CACHE_MB'] = '0'
+    import app
+    return app.app.test_client()
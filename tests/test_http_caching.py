@@ -0,0 +1,36 @@
+"""Conditional GETs on catalog endpoints: 304 only for requests the endpoint accepts"""
+
+import pytest
+
+def revalidate(client, url):
+    """Fetch url, then fetch it again with the ETag it returned"""
+    first = client.get(url)
+    assert first.status_code == 200
+    return client.get(url, headers={'If-None-Match': first.headers['ETag']})
+
+def test_matching_etag_gets_304(client):
+    assert revalidate(client, '/api/movies/recent?limit=5').status_code == 304
+
+@pytest.mark.parametrize('url', [
+    '/api/movies/recent?format=table',
+    '/api/movies/recent?fields=tconst,rating',
+    '/api/movies/year/1990?fields=startYear',
+    '/api/movies/search',
+    '/api/movies/search?q=heat&mode=phonetic',
+    '/api/movies/genre/Drama?cursor=eyJ4Ijox',
+    '/api/regex/search?pattern=(',
+    '/api/views/decade_summary?direction=sideways',
+    '/api/views/decade_summary?order_by=rowid',
+    '/api/views/decade_summary?fields=decade,nope',
+    '/api/views/no_such_view',
+])
+def test_invalid_request_with_matching_etag_gets_400(client, url):
+    etag = client.get('/api/movies/recent?limit=5').headers['ETag']
+    assert client.get(url, headers={'If-None-Match': etag}).status_code == 400
+
+def test_export_is_not_cached(client):
+    response = client.get('/api/export/movies?format=csv')
+    assert response.status_code == 200
+    assert response.headers['Cache-Control'] == 'no-store'
+    assert 'ETag' not in response.headers
+    response.close()
@@ -0,0 +1,72 @@
+"""Page cursors: pages chain without gaps and tampered cursors are rejected"""
+
+import base64
+import json
+
+import pytest
+
+from imdb_queries import IMDbQueries, encode_cursor
+
+@pytest.fixture
+def queries(db_path):
+    queries = IMDbQueries(db_path)
+    yield queries
+    queries.close()
+
+def tampered(key) -> str:
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+def test_fuzzy_search_pages_chain(queries):
+    first = queries.fuzzy_search_movies('godfater', 1)
+    assert first['has_more']
+    second = queries.fuzzy_search_movies('godfater', 1, cursor=first['next_cursor'])
+    assert second['movies'][0]['tconst'] != first['movies'][0]['tconst']
+
+@pytest.mark.parametrize('key', [["x", 1, "tt1"], [-0.5, "1999", "tt1"], [-0.5, 0, 7], [-0.5, 0, ["tt1"]]])
+def test_fuzzy_search_rejects_wrong_typed_cursor(queries, key):
+    with pytest.raises(ValueError):
+        queries.fuzzy_search_movies('godfater', 5, cursor=tampered(key))
+
+def test_listing_pages_chain(queries):
+    seen = []
+    page = queries.get_recent_movies(7)
+    while True:
+        seen += [movie['tconst'] for movie in page['movies']]
+        if not page['has_more']:
+            break
+        page = queries.get_recent_movies(7, cursor=page['next_cursor'])
+    assert len(seen) == len(set(seen)) == len(queries.get_recent_movies(1000)['movies'])
+
+@pytest.mark.parametrize('call', [
+    lambda queries, cursor: queries.get_recent_movies(5, cursor=cursor),
+    lambda queries, cursor: queries.get_movies_by_genre('Drama', 5, cursor=cursor),
+    lambda queries, cursor: queries.regex_title_search('^The', 5, cursor=cursor),
+])
+@pytest.mark.parametrize('key', [["1999", "Heat", "tt1"], [1999, 5, "tt1"], [1999, "Heat", None], [True, "Heat", "tt1"]])
+def test_year_ordered_listings_reject_wrong_typed_cursor(queries, call, key):
+    with pytest.raises(ValueError):
+        call(queries, tampered(key))
+
+def test_catalog_listing_rejects_wrong_typed_cursor(db_path):
+    queries = IMDbQueries(db_path, use_catalog=True)
+    with pytest.raises(ValueError):
+        queries.get_recent_movies(5, cursor=tampered([{}, "Heat", "tt1"]))
+    queries.close()
+
+@pytest.mark.parametrize('key', [["1", -1.0, 0, "tt1"], [1, "x", 0, "tt1"], [1, -1.0, 0, [1]]])
+def test_title_search_rejects_wrong_typed_cursor(queries, key):
+    with pytest.raises(ValueError):
+        queries.search_movies('godfather', 5, cursor=tampered(key))
+
+def test_view_rejects_wrong_typed_cursor(queries):
+    with pytest.raises(ValueError):
+        queries.get_view_data('decade_summary', 5, cursor=tampered(["2"]))
+    with pytest.raises(ValueError):
+        queries.get_view_data('decade_summary', 5, order_by='decade', cursor=tampered([[1990], 2]))
+
+@pytest.mark.parametrize('url', ['/api/movies/search?q=godfater&mode=fuzzy', '/api/movies/recent',
+                                 '/api/movies/genre/Drama', '/api/regex/search?pattern=Heat'])
+def test_endpoints_answer_400_for_wrong_typed_cursor(client, url):
+    separator = '&' if '?' in url else '?'
+    response = client.get(f"{url}{separator}cursor={tampered(['x', 1, 'tt1'])}")
+    assert response.status_code == 400
@@ -0,0 +1,44 @@
+"""Precomputed recommendations are served only while they are still fresh"""
+
+import sqlite3
+
+import pytest
+
+from build_similar_movies import build_similar_movies
+from imdb_queries import IMDbQueries
+from precompute_recommendations import precompute
+
+@pytest.fixture
+def queries(db_path):
+    queries = IMDbQueries(db_path)
+    yield queries
+    queries.close()
+
+def list_movies(queries, sessions):
+    """Give each session a want to watch list of its own, overlapping the others'"""
+    lists = {}
+    for i, user_session in enumerate(sessions):
+        lists[user_session] = [f"tt{j:07d}" for j in range(i, i + 6)]
+        queries.add_many_to_want_to_watch(user_session, lists[user_session])
+    return lists
+
+def test_precomputed_result_is_served_while_fresh(db_path, queries):
+    lists = list_movies(queries, ['s1', 's2', 's3'])
+    precompute(db_path, workers=1)
+    result = queries.get_precomputed_recommendations('s1', lists['s1'], [])
+    assert result is not None and result['recommendations']
+    # A changed list no longer matches the stored fingerprint
+    assert queries.get_precomputed_recommendations('s1', lists['s1'][:-1], []) is None
+
+def test_rebuilding_neighbors_rejects_precomputed_results(db_path, queries):
+    lists = list_movies(queries, ['s1', 's2', 's3'])
+    build_similar_movies(db_path)
+    precompute(db_path, workers=1)
+    assert queries.get_precomputed_recommendations('s1', lists['s1'], []) is not None
+
+    # More sessions listing movies together change the neighbor boosts
+    list_movies(queries, ['s4', 's5'])
+    build_similar_movies(db_path)
+    assert queries.get_precomputed_recommendations('s1', lists['s1'], []) is None
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM session_recommendations").fetchone()[0] == 0
@@ -0,0 +1,70 @@
+"""database_setup.py --refresh: derived tables and the catalog generation"""
+
+import sqlite3
+
+import numpy as np
+
+import database_setup
+from build_similar_movies import build_similar_movies
+from conftest import write_title_basics
+from imdb_queries import NEIGHBOR_DTYPE, POSTINGS_DTYPE
+
+def refresh(db_path, snapshot):
+    return database_setup.main(['--refresh', '--db', db_path, '--input', str(snapshot), '--workers', '1'])
+
+def catalog_state(db_path):
+    with sqlite3.connect(db_path) as conn:
+        generation = conn.execute("SELECT generation FROM catalog_generation WHERE id = 1").fetchone()[0]
+        refreshed = conn.execute("SELECT view_name, refreshed_at FROM materialized_views ORDER BY view_name").fetchall()
+    return generation, refreshed
+
+def mark_materialized_rows(db_path):
+    """Overwrite a materialized column, to see whether a refresh rewrites it"""
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE decade_summary_mv SET total_movies = -1")
+
+def test_refresh_without_changes_keeps_views_and_generation(db_path, tmp_path):
+    snapshot = tmp_path / 'title.basics.tsv'
+    write_title_basics(snapshot)
+    before = catalog_state(db_path)
+    mark_materialized_rows(db_path)
+    assert refresh(db_path, snapshot) == 0
+    assert catalog_state(db_path) == before
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT MAX(total_movies) FROM decade_summary_mv").fetchone()[0] == -1
+
+def test_refresh_with_changes_rewrites_views_and_bumps_generation(db_path, tmp_path):
+    snapshot = tmp_path / 'title.basics.tsv'
+    write_title_basics(snapshot, count=50)
+    generation, _ = catalog_state(db_path)
+    mark_materialized_rows(db_path)
+    assert refresh(db_path, snapshot) == 0
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT generation FROM catalog_generation").fetchone()[0] == generation + 1
+        assert conn.execute("SELECT MIN(total_movies) FROM decade_summary_mv").fetchone()[0] > 0
+
+def test_refresh_from_missing_snapshot_fails(db_path, tmp_path):
+    assert refresh(db_path, tmp_path / 'missing.tsv.gz') == 1
+
+def test_refresh_removes_deleted_movies_from_neighbors(db_path, tmp_path):
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany("INSERT INTO want_to_watch (user_session, tconst) VALUES (?, ?)",
+                         [(session, f"tt{i:07d}") for session in ('s1', 's2', 's3') for i in range(55, 60)])
+        last_rowid = conn.execute("SELECT MAX(rowid) FROM movies").fetchone()[0]
+    build_similar_movies(db_path)
+
+    # Drop the movie with the highest rowid and add one, which takes over that rowid
+    snapshot = tmp_path / 'title.basics.tsv'
+    write_title_basics(snapshot, count=59)
+    with open(snapshot, 'a') as f:
+        f.write("tt8000000\tmovie\tA New Movie\tA New Movie\t0\t2020\t\\N\t95\tDrama\n")
+    assert refresh(db_path, snapshot) == 0
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT rowid FROM movies WHERE tconst = 'tt8000000'").fetchone()[0] == last_rowid
+        rows = conn.execute("SELECT movie_id, neighbor_ids, similarities FROM similar_movies").fetchall()
+    assert rows
+    for movie_id, neighbor_ids, similarities in rows:
+        neighbors = np.frombuffer(neighbor_ids, dtype=POSTINGS_DTYPE)
+        assert movie_id != last_rowid and last_rowid not in neighbors
+        assert len(neighbors) == len(np.frombuffer(similarities, dtype=NEIGHBOR_DTYPE))